@@ -267,47 +267,49 @@ class EBikeToolkit {
    * Initialize enabled modules
    */
   async initializeModules() {
+    // Tools register themselves when their script loads; a page only has the ones it includes
+    const registry = EBikeToolkit.registry || {};
     const modulePromises = [];
     
     if (this.config.features.comparison) {
-      modulePromises.push(this.loadModule('comparison', BikeComparison));
+      modulePromises.push(this.loadModule('comparison', registry.BikeComparison));
     }
     
     if (this.config.features.sizing) {
-      modulePromises.push(this.loadModule('sizing', SizeCalculator));
+      modulePromises.push(this.loadModule('sizing', registry.SizeCalculator));
     }
     
     if (this.config.features.financing) {
-      modulePromises.push(this.loadModule('financing', FinancingCalculator));
+      modulePromises.push(this.loadModule('financing', registry.FinancingCalculator));
     }
     
     if (this.config.features.wishlist) {
-      modulePromises.push(this.loadModule('wishlist', WishlistManager));
+      modulePromises.push(this.loadModule('wishlist', registry.WishlistManager));
     }
     
     // === NEW ADVANCED TOOLS ===
     if (this.config.features.rangeCalculator) {
-      modulePromises.push(this.loadModule('rangeCalculator', RangeCalculator));
+      modulePromises.push(this.loadModule('rangeCalculator', registry.RangeCalculator));
     }
     
     if (this.config.features.testRideBooking) {
-      modulePromises.push(this.loadModule('testRideBooking', TestRideBooking));
+      modulePromises.push(this.loadModule('testRideBooking', registry.TestRideBooking));
     }
     
     if (this.config.features.serviceBooking) {
-      modulePromises.push(this.loadModule('serviceBooking', ServiceBooking));
+      modulePromises.push(this.loadModule('serviceBooking', registry.ServiceBooking));
     }
     
     if (this.config.features.comparison) {
-      modulePromises.push(this.loadModule('comparison', BikeComparison));
+      modulePromises.push(this.loadModule('comparison', registry.BikeComparison));
     }
     
     if (this.config.features.dashboardManagement) {
-      modulePromises.push(this.loadModule('dashboardManagement', DashboardManagement));
+      modulePromises.push(this.loadModule('dashboardManagement', registry.DashboardManagement));
     }
     
     if (this.config.features.blogGenerator) {
-      modulePromises.push(this.loadModule('blogGenerator', BlogGenerator));
+      modulePromises.push(this.loadModule('blogGenerator', registry.BlogGenerator));
     }
     
     await Promise.allSettled(modulePromises);
@@ -317,6 +319,8 @@ class EBikeToolkit {
    * Load individual module
    */
   async loadModule(name, ModuleClass) {
+    if (!ModuleClass) return;
+    
     try {
       const module = new ModuleClass(this);
       await module.init();
@@ -447,6 +451,12 @@ class EBikeToolkit {
     return this.modules.get(name);
   }
   
+  // Make a tool class available to initializeModules()
+  static register(name, ModuleClass) {
+    EBikeToolkit.registry = EBikeToolkit.registry || {};
+    EBikeToolkit.registry[name] = ModuleClass;
+  }
+  
   // Enable/disable feature
   toggleFeature(name, enabled) {
     this.config.features[name] = enabled;
@@ -4544,6 +4554,9 @@ window.EBikeToolkitModules = {
   DashboardManagement,
   BlogGenerator
 };
+Object.keys(window.EBikeToolkitModules).forEach((name) => {
+  EBikeToolkit.register(name, window.EBikeToolkitModules[name]);
+});
 
 // Make modules available under GodspeedToolkit namespace for sections
 window.GodspeedToolkit = window.EBikeToolkitModules;
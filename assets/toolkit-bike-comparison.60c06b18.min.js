@@ -0,0 +1,146 @@
+(()=>{if(EBikeToolkit.registry&&EBikeToolkit.registry.BikeComparison)return;class BikeComparison extends BaseModule{constructor(toolkit){super(toolkit);this.comparisons=new Map();}
+async init(){await super.init();this.log('Advanced Comparison module initialized');}
+setupElement(element){const comparisonId=element.dataset.comparisonId||this.generateId();element.dataset.comparisonId=comparisonId;const comparisonData=window.advancedComparisonData||{};const comparisonUtils=window.advancedComparisonUtils||{};const comparison=new ComparisonInstance(comparisonId,element,this,comparisonData,comparisonUtils);this.comparisons.set(comparisonId,comparison);comparison.render();}
+cleanupElement(element){const comparisonId=element.dataset.comparisonId;if(comparisonId&&this.comparisons.has(comparisonId)){this.comparisons.get(comparisonId).destroy();this.comparisons.delete(comparisonId);}}
+generateId(){return`adv_comp_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;}}
+class ComparisonInstance{constructor(id,element,module,comparisonData={},comparisonUtils={}){this.id=id;this.element=element;this.module=module;this.comparisonData=comparisonData;this.comparisonUtils=comparisonUtils;this.maxBikes=parseInt(this.element.dataset.maxBikes)||4;this.selectedBikes=[];this.bikeDatabase={'city-comfort':{name:'City Comfort Pro',brand:'Godspeed',price:2499,category:'city',image:'/assets/bike-city-comfort.jpg',motor:{brand:'Bosch',model:'Active Line Plus',power:250,torque:50,position:'Mid-drive'},battery:{capacity:400,brand:'Bosch',range:'60-100',removable:true,chargingTime:4.5},frame:{material:'Aluminium',size:'46-58cm',weight:24,geometry:'Step-through'},components:{gears:'8-Gang Shimano',brakes:'Shimano Hydraulik',suspension:'Federgabel vorne',wheels:'28"',display:'Bosch Intuvia'},features:{lights:'Integrated LED',mudguards:'Yes',rack:'Yes',kickstand:'Yes',lockPrep:'Yes'},scores:{comfort:9.2,performance:7.1,valueForMoney:8.9,durability:8.8,easeOfUse:9.5},aiInsights:{bestFor:['commuting','casual-riding','city-exploration'],terrainSuitability:['city','paved-paths','light-gravel'],userExperience:'beginner-friendly',maintenanceLevel:'low'},reviews:{rating:4.6,count:342,highlights:['Very comfortable','Easy to use','Great value'],concerns:['Limited off-road capability']}},'trekking-sport':{name:'Trekking Sport X1',brand:'Godspeed',price:3299,category:'trekking',image:'/assets/bike-trekking-sport.jpg',motor:{brand:'Bosch',model:'Performance CX',power:250,torque:85,position:'Mid-drive'},battery:{capacity:625,brand:'Bosch',range:'80-120',removable:true,chargingTime:6},frame:{material:'Aluminium',size:'48-62cm',weight:26,geometry:'Diamond'},components:{gears:'12-Gang SRAM',brakes:'SRAM Level Hydraulik',suspension:'Federgabel vorne',wheels:'28"',display:'Bosch Kiox'},features:{lights:'Integrated LED',mudguards:'Yes',rack:'Yes',kickstand:'Yes',lockPrep:'Yes'},scores:{comfort:8.5,performance:8.9,valueForMoney:8.2,durability:9.1,easeOfUse:8.0},aiInsights:{bestFor:['long-distance','touring','mixed-terrain'],terrainSuitability:['city','country-roads','gravel','light-trails'],userExperience:'intermediate',maintenanceLevel:'medium'},reviews:{rating:4.7,count:218,highlights:['Excellent range','Versatile','Quality components'],concerns:['Higher price point']}},'mountain-trail':{name:'Mountain Trail Pro',brand:'Godspeed',price:4799,category:'mountain',image:'/assets/bike-mountain-trail.jpg',motor:{brand:'Shimano',model:'EP8',power:250,torque:85,position:'Mid-drive'},battery:{capacity:630,brand:'Shimano',range:'60-90',removable:true,chargingTime:5.5},frame:{material:'Carbon',size:'44-58cm',weight:23,geometry:'Mountain'},components:{gears:'12-Gang Shimano XT',brakes:'Shimano XT 4-Kolben',suspension:'Full Suspension 140mm',wheels:'29"',display:'Shimano E-Tube'},features:{lights:'Optional',mudguards:'Optional',rack:'No',kickstand:'No',lockPrep:'Yes'},scores:{comfort:7.8,performance:9.5,valueForMoney:7.5,durability:8.9,easeOfUse:6.8},aiInsights:{bestFor:['trail-riding','mountain-biking','technical-terrain'],terrainSuitability:['trails','mountains','rough-terrain'],userExperience:'advanced',maintenanceLevel:'high'},reviews:{rating:4.8,count:156,highlights:['Incredible performance','Lightweight','Top components'],concerns:['Expensive','Requires skill']}},'cargo-family':{name:'Cargo Family+',brand:'Godspeed',price:3899,category:'cargo',image:'/assets/bike-cargo-family.jpg',motor:{brand:'Bosch',model:'Cargo Line',power:250,torque:85,position:'Mid-drive'},battery:{capacity:500,brand:'Bosch',range:'50-80',removable:true,chargingTime:5},frame:{material:'Steel reinforced',size:'48-56cm',weight:35,geometry:'Longtail'},components:{gears:'8-Gang Shimano',brakes:'Magura MT5 Hydraulik',suspension:'Keine',wheels:'26"',display:'Bosch Intuvia'},features:{lights:'Integrated LED',mudguards:'Yes',rack:'Cargo platform',kickstand:'Double kickstand',lockPrep:'Yes'},scores:{comfort:8.0,performance:7.5,valueForMoney:8.7,durability:9.3,easeOfUse:7.2},aiInsights:{bestFor:['family-transport','cargo-hauling','child-transport'],terrainSuitability:['city','paved-paths'],userExperience:'intermediate',maintenanceLevel:'medium'},reviews:{rating:4.5,count:89,highlights:['Great for families','Stable with load','Well-built'],concerns:['Heavy','Takes space']}}};}
+render(){const placeholder=this.element.querySelector('.ebike-loading-placeholder');if(placeholder){placeholder.style.display='none';placeholder.style.visibility='hidden';placeholder.remove();}
+const comparisonDiv=document.createElement('div');comparisonDiv.className='ebike-comparison-tool';comparisonDiv.innerHTML=this.buildComparisonHTML();this.element.appendChild(comparisonDiv);this.setupEventHandlers();}
+buildComparisonHTML(){return`
+      <div class="comparison-wrapper">
+        <div class="comparison-header">
+          <h3>${this.element.dataset.title || 'E-Bike Comparison'}</h3>
+          <p>${this.element.dataset.subtitle || 'Compare up to ' + this.maxBikes + ' bikes with detailed analysis'}</p>
+        </div>
+
+        <div class="bike-selection-section">
+          <h4>Select Bikes to Compare</h4>
+          <div class="bike-selectors">
+            ${Array.from({length: this.maxBikes}, (_, i) => `
+              <div class="bike-selector" data-slot="${i}">
+                <label>Bike ${i + 1}</label>
+                <select class="bike-select" data-slot="${i}">
+                  <option value="">Select a bike...</option>
+                  ${Object.entries(this.bikeDatabase).map(([key, bike]) => `
+                    <option value="${key}">${bike.name} - CHF ${bike.price}</option>
+                  `).join('')}
+                </select>
+              </div>
+            `).join('')}
+          </div>
+        </div>
+
+        <div class="comparison-results" style="display: none;">
+          <div class="comparison-table-container">
+            <table class="comparison-table">
+              <thead>
+                <tr>
+                  <th class="specification-header">Specification</th>
+                  ${Array.from({length: this.maxBikes}, (_, i) => `
+                    <th class="bike-header" data-slot="${i}">
+                      <div class="bike-header-content">
+                        <div class="bike-image-placeholder">📷</div>
+                        <div class="bike-name">Bike ${i + 1}</div>
+                        <div class="bike-price">-</div>
+                      </div>
+                    </th>
+                  `).join('')}
+                </tr>
+              </thead>
+              <tbody>
+                ${this.generateComparisonRows()}
+              </tbody>
+            </table>
+          </div>
+
+          <div class="ai-analysis-section">
+            <h4>🤖 AI Analysis</h4>
+            <div class="ai-insights-grid">
+              <div class="insight-card overall-recommendation">
+                <h5>Best Overall</h5>
+                <div class="insight-content" id="best-overall-${this.id}">Select bikes to see recommendation</div>
+              </div>
+              <div class="insight-card best-value">
+                <h5>Best Value</h5>
+                <div class="insight-content" id="best-value-${this.id}">Select bikes to see analysis</div>
+              </div>
+              <div class="insight-card performance-leader">
+                <h5>Performance Leader</h5>
+                <div class="insight-content" id="performance-leader-${this.id}">Select bikes to see analysis</div>
+              </div>
+              <div class="insight-card comfort-king">
+                <h5>Comfort Champion</h5>
+                <div class="insight-content" id="comfort-king-${this.id}">Select bikes to see analysis</div>
+              </div>
+            </div>
+            
+            <div class="usage-recommendations">
+              <h5>Usage Recommendations</h5>
+              <div class="usage-grid" id="usage-recommendations-${this.id}">
+                Select bikes to see personalized recommendations
+              </div>
+            </div>
+          </div>
+
+          <div class="comparison-actions">
+            <button class="btn-secondary" onclick="this.resetComparison()">Reset Comparison</button>
+            <button class="btn-primary" onclick="this.exportComparison()">Export to PDF</button>
+            <button class="btn-primary" onclick="this.shareComparison()">Share Comparison</button>
+          </div>
+        </div>
+      </div>
+    `;}
+generateComparisonRows(){const categories=[{title:'Basic Info',rows:[{label:'Brand',field:'brand'},{label:'Category',field:'category'},{label:'Price (CHF)',field:'price'},{label:'Overall Rating',field:'reviews.rating',format:'rating'}]},{title:'Motor & Power',rows:[{label:'Motor Brand',field:'motor.brand'},{label:'Motor Model',field:'motor.model'},{label:'Max Torque (Nm)',field:'motor.torque'},{label:'Position',field:'motor.position'}]},{title:'Battery & Range',rows:[{label:'Battery Capacity (Wh)',field:'battery.capacity'},{label:'Range (km)',field:'battery.range'},{label:'Charging Time (h)',field:'battery.chargingTime'},{label:'Removable',field:'battery.removable',format:'boolean'}]},{title:'Frame & Design',rows:[{label:'Frame Material',field:'frame.material'},{label:'Weight (kg)',field:'frame.weight'},{label:'Frame Sizes',field:'frame.size'},{label:'Geometry',field:'frame.geometry'}]},{title:'Components',rows:[{label:'Gears',field:'components.gears'},{label:'Brakes',field:'components.brakes'},{label:'Suspension',field:'components.suspension'},{label:'Display',field:'components.display'}]},{title:'Features & Extras',rows:[{label:'Lights',field:'features.lights'},{label:'Mudguards',field:'features.mudguards',format:'boolean'},{label:'Rack',field:'features.rack'},{label:'Kickstand',field:'features.kickstand',format:'boolean'}]},{title:'Performance Scores',rows:[{label:'Comfort Score',field:'scores.comfort',format:'score'},{label:'Performance Score',field:'scores.performance',format:'score'},{label:'Value Score',field:'scores.valueForMoney',format:'score'},{label:'Ease of Use',field:'scores.easeOfUse',format:'score'}]}];let html='';categories.forEach(category=>{html+=`<tr class="category-header"><td colspan="${this.maxBikes + 1}">${category.title}</td></tr>`;category.rows.forEach(row=>{html+=`<tr class="comparison-row" data-field="${row.field}">
+          <td class="spec-label">${row.label}</td>
+          ${Array.from({length: this.maxBikes}, (_, i) => `
+            <td class="spec-value" data-slot="${i}" data-format="${row.format || 'text'}">-</td>
+          `).join('')}
+        </tr>`;});});return html;}
+setupEventHandlers(){const container=this.element.querySelector('.ebike-comparison-tool');container.querySelectorAll('.bike-select').forEach(select=>{select.addEventListener('change',(e)=>{const slot=parseInt(e.target.dataset.slot);const bikeKey=e.target.value;if(bikeKey){this.selectedBikes[slot]=bikeKey;}else{delete this.selectedBikes[slot];}
+this.updateComparison();});});}
+updateComparison(){const container=this.element.querySelector('.ebike-comparison-tool');const resultsSection=container.querySelector('.comparison-results');const activeBikes=this.selectedBikes.filter(bike=>bike);if(activeBikes.length>=2){resultsSection.style.display='block';this.updateComparisonTable();this.updateAIAnalysis();}else{resultsSection.style.display='none';}}
+updateComparisonTable(){const container=this.element.querySelector('.ebike-comparison-tool');this.selectedBikes.forEach((bikeKey,slot)=>{if(bikeKey&&this.bikeDatabase[bikeKey]){const bike=this.bikeDatabase[bikeKey];const header=container.querySelector(`.bike-header[data-slot="${slot}"]`);header.innerHTML=`
+          <div class="bike-header-content">
+            <div class="bike-image">
+              <img src="${bike.image}" alt="${bike.name}" loading="lazy" />
+            </div>
+            <div class="bike-name">${bike.name}</div>
+            <div class="bike-price">CHF ${bike.price}</div>
+            <div class="bike-rating">⭐ ${bike.reviews.rating}/5</div>
+          </div>
+        `;}});container.querySelectorAll('.comparison-row').forEach(row=>{const field=row.dataset.field;row.querySelectorAll('.spec-value').forEach(cell=>{const slot=parseInt(cell.dataset.slot);const format=cell.dataset.format;if(this.selectedBikes[slot]&&this.bikeDatabase[this.selectedBikes[slot]]){const bike=this.bikeDatabase[this.selectedBikes[slot]];const value=this.getNestedValue(bike,field);cell.textContent=this.formatValue(value,format);cell.classList.remove('empty');}else{cell.textContent='-';cell.classList.add('empty');}});});}
+updateAIAnalysis(){const activeBikes=this.selectedBikes.filter(bike=>bike).map(key=>this.bikeDatabase[key]);if(activeBikes.length<2)return;const bestOverall=activeBikes.reduce((best,bike)=>{const overallScore=(bike.scores.comfort+bike.scores.performance+bike.scores.valueForMoney)/3;const bestOverallScore=(best.scores.comfort+best.scores.performance+best.scores.valueForMoney)/3;return overallScore>bestOverallScore?bike:best;});document.getElementById(`best-overall-${this.id}`).innerHTML=`
+      <div class="recommendation">
+        <strong>${bestOverall.name}</strong>
+        <p>Highest combined score across all categories. ${bestOverall.aiInsights.bestFor.join(', ')}.</p>
+      </div>
+    `;const bestValue=activeBikes.reduce((best,bike)=>bike.scores.valueForMoney>best.scores.valueForMoney?bike:best);document.getElementById(`best-value-${this.id}`).innerHTML=`
+      <div class="recommendation">
+        <strong>${bestValue.name}</strong>
+        <p>Best value at CHF ${bestValue.price} with ${bestValue.scores.valueForMoney}/10 value score.</p>
+      </div>
+    `;const performanceLeader=activeBikes.reduce((best,bike)=>bike.scores.performance>best.scores.performance?bike:best);document.getElementById(`performance-leader-${this.id}`).innerHTML=`
+      <div class="recommendation">
+        <strong>${performanceLeader.name}</strong>
+        <p>Top performance with ${performanceLeader.motor.torque}Nm torque and ${performanceLeader.scores.performance}/10 score.</p>
+      </div>
+    `;const comfortKing=activeBikes.reduce((best,bike)=>bike.scores.comfort>best.scores.comfort?bike:best);document.getElementById(`comfort-king-${this.id}`).innerHTML=`
+      <div class="recommendation">
+        <strong>${comfortKing.name}</strong>
+        <p>Most comfortable ride with ${comfortKing.scores.comfort}/10 comfort score. ${comfortKing.frame.geometry} geometry.</p>
+      </div>
+    `;const usageGrid=document.getElementById(`usage-recommendations-${this.id}`);const usageTypes=['commuting','touring','family-transport','trail-riding','casual-riding'];let usageHTML='<div class="usage-cards">';usageTypes.forEach(usage=>{const bestForUsage=activeBikes.find(bike=>bike.aiInsights.bestFor.includes(usage));if(bestForUsage){usageHTML+=`
+          <div class="usage-card">
+            <h6>${usage.replace('-', ' ').replace(/\b\w/g, l => l.toUpperCase())}</h6>
+            <p><strong>${bestForUsage.name}</strong> - ${bestForUsage.aiInsights.userExperience}</p>
+          </div>
+        `;}});usageHTML+='</div>';usageGrid.innerHTML=usageHTML;}
+getNestedValue(obj,path){return path.split('.').reduce((current,key)=>current&&current[key],obj);}
+formatValue(value,format){if(value===undefined||value===null)return'-';switch(format){case'boolean':return value===true?'Yes':value===false?'No':value;case'rating':return`⭐ ${value}/5`;case'score':return`${value}/10`;default:return value;}}
+resetComparison(){this.selectedBikes=[];const container=this.element.querySelector('.ebike-comparison-tool');container.querySelectorAll('.bike-select').forEach(select=>{select.value='';});container.querySelector('.comparison-results').style.display='none';}
+exportComparison(){const activeBikes=this.selectedBikes.filter(bike=>bike);if(activeBikes.length<2){showWarning('Please select at least 2 bikes to export comparison.');return;}
+const comparisonData={bikes:activeBikes.map(key=>this.bikeDatabase[key]),timestamp:new Date().toISOString(),source:'Godspeed E-Bike Comparison Tool'};showSuccess('Comparison exported! (Feature would generate PDF in production)');}
+shareComparison(){const activeBikes=this.selectedBikes.filter(bike=>bike);if(activeBikes.length<2){showWarning('Please select at least 2 bikes to share comparison.');return;}
+const bikeNames=activeBikes.map(key=>this.bikeDatabase[key].name);const shareText=`Check out this e-bike comparison: ${bikeNames.join(' vs ')} on Godspeed!`;if(navigator.share){navigator.share({title:'E-Bike Comparison',text:shareText,url:window.location.href});}else{navigator.clipboard.writeText(`${shareText} ${window.location.href}`).then(()=>showSuccess('Comparison link copied to clipboard!')).catch(()=>showError('Unable to share. Please copy the URL manually.'));}}
+destroy(){const comparison=this.element.querySelector('.ebike-comparison-tool');if(comparison)comparison.remove();}}
+EBikeToolkit.register('BikeComparison',BikeComparison);window.EBikeToolkitModules.BikeComparison=BikeComparison;})();
@@ -0,0 +1,320 @@
+(()=>{if(EBikeToolkit.registry&&EBikeToolkit.registry.BlogGenerator)return;class BlogGenerator extends BaseModule{constructor(toolkit){super(toolkit);this.generators=new Map();}
+async init(){await super.init();this.log('Blog Generator module initialized');}
+setupElement(element){const generatorId=element.dataset.generatorId||this.generateId();element.dataset.generatorId=generatorId;const generator=new BlogGeneratorInstance(generatorId,element,this);this.generators.set(generatorId,generator);generator.render();}
+cleanupElement(element){const generatorId=element.dataset.generatorId;if(generatorId&&this.generators.has(generatorId)){this.generators.get(generatorId).destroy();this.generators.delete(generatorId);}}
+generateId(){return`blog_gen_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;}}
+class BlogGeneratorInstance{constructor(id,element,module){this.id=id;this.element=element;this.module=module;this.feedSources=[{name:'Bike Europe',url:'https://www.bike-europe.com/rss',category:'industry'},{name:'Electric Bike Report',url:'https://electricbikereport.com/feed/',category:'reviews'},{name:'Pedelec Magazine',url:'https://www.pedelec-magazin.de/feed/',category:'news'},{name:'E-Bike News',url:'https://ebike-news.de/feed/',category:'german'},{name:'Swiss Cycling',url:'https://www.swiss-cycling.ch/feed/',category:'swiss'}];this.contentTemplates={industry_news:{structure:['headline','summary','context','analysis','implications','cta'],tone:'professional',length:'800-1200'},buying_guide:{structure:['problem','overview','comparison','recommendations','next_steps'],tone:'helpful',length:'1200-1800'},maintenance:{structure:['context','instructions','tools','tips','service_link'],tone:'instructional',length:'800-1500'}};this.currentView='dashboard';this.selectedFeeds=[];this.generatedDrafts=[];this.publishSchedule=[];}
+render(){const placeholder=this.element.querySelector('.ebike-loading-placeholder');if(placeholder){placeholder.style.display='none';placeholder.style.visibility='hidden';placeholder.remove();}
+const generatorDiv=document.createElement('div');generatorDiv.className='ebike-blog-generator-tool';generatorDiv.innerHTML=this.buildGeneratorHTML();this.element.appendChild(generatorDiv);this.setupEventHandlers();this.loadFeedStatus();}
+buildGeneratorHTML(){return`
+      <div class="blog-generator-wrapper">
+        <div class="generator-header">
+          <h3>AI Blog Content Generator</h3>
+          <div class="generator-tabs">
+            <button class="tab-btn active" data-view="dashboard">Dashboard</button>
+            <button class="tab-btn" data-view="feeds">RSS Feeds</button>
+            <button class="tab-btn" data-view="drafts">Drafts</button>
+            <button class="tab-btn" data-view="schedule">Schedule</button>
+            <button class="tab-btn" data-view="settings">Settings</button>
+          </div>
+        </div>
+
+        <div class="generator-content">
+          ${this.renderCurrentView()}
+        </div>
+      </div>
+    `;}
+renderCurrentView(){switch(this.currentView){case'dashboard':return this.renderDashboard();case'feeds':return this.renderFeedsManager();case'drafts':return this.renderDraftsManager();case'schedule':return this.renderScheduleManager();case'settings':return this.renderSettings();default:return this.renderDashboard();}}
+renderDashboard(){return`
+      <div class="blog-dashboard">
+        <div class="dashboard-stats">
+          <div class="stat-card">
+            <h4>Active Feeds</h4>
+            <div class="stat-value">${this.feedSources.length}</div>
+            <div class="stat-detail">5 new articles today</div>
+          </div>
+          <div class="stat-card">
+            <h4>Draft Articles</h4>
+            <div class="stat-value">${this.generatedDrafts.length}</div>
+            <div class="stat-detail">3 ready to publish</div>
+          </div>
+          <div class="stat-card">
+            <h4>Scheduled Posts</h4>
+            <div class="stat-value">${this.publishSchedule.length}</div>
+            <div class="stat-detail">Next: Tomorrow 10:00</div>
+          </div>
+          <div class="stat-card">
+            <h4>AI Credits</h4>
+            <div class="stat-value">8,542</div>
+            <div class="stat-detail">of 10,000 this month</div>
+          </div>
+        </div>
+
+        <div class="recent-activity">
+          <h4>Recent Activity</h4>
+          <div class="activity-list">
+            <div class="activity-item">
+              <span class="activity-time">2 hours ago</span>
+              <span class="activity-text">Generated draft: "E-Bike Trends 2025"</span>
+            </div>
+            <div class="activity-item">
+              <span class="activity-time">5 hours ago</span>
+              <span class="activity-text">Published: "Winter Maintenance Guide"</span>
+            </div>
+            <div class="activity-item">
+              <span class="activity-time">Yesterday</span>
+              <span class="activity-text">Translated 3 articles to German</span>
+            </div>
+          </div>
+        </div>
+
+        <div class="quick-actions">
+          <button class="btn-primary generate-now-btn">🤖 Generate New Article</button>
+          <button class="btn-secondary scan-feeds-btn">🔍 Scan RSS Feeds</button>
+          <button class="btn-secondary review-drafts-btn">📝 Review Drafts</button>
+        </div>
+      </div>
+    `;}
+renderFeedsManager(){return`
+      <div class="feeds-manager">
+        <div class="feeds-header">
+          <h4>RSS Feed Management</h4>
+          <button class="btn-primary add-feed-btn">+ Add Feed</button>
+        </div>
+
+        <div class="feeds-list">
+          ${this.feedSources.map(feed => `
+            <div class="feed-item" data-feed="${feed.url}">
+              <div class="feed-info">
+                <h5>${feed.name}</h5>
+                <div class="feed-url">${feed.url}</div>
+                <div class="feed-category">Category: ${feed.category}</div>
+              </div>
+              <div class="feed-status">
+                <span class="status-indicator active">●</span>
+                <span>Active</span>
+              </div>
+              <div class="feed-stats">
+                <div>Last checked: 5 min ago</div>
+                <div>Articles today: 3</div>
+              </div>
+              <div class="feed-actions">
+                <button class="btn-small test-feed">Test</button>
+                <button class="btn-small edit-feed">Edit</button>
+                <button class="btn-small delete-feed">Delete</button>
+              </div>
+            </div>
+          `).join('')}
+        </div>
+
+        <div class="feed-preview">
+          <h4>Latest Articles from Feeds</h4>
+          <div class="preview-articles">
+            <div class="preview-article">
+              <h5>New Bosch Performance Line CX 2025</h5>
+              <p>The latest motor offers 85Nm torque with improved efficiency...</p>
+              <button class="btn-small generate-from-article">Generate Article</button>
+            </div>
+            <div class="preview-article">
+              <h5>Swiss E-Bike Market Grows 23%</h5>
+              <p>Latest statistics show significant growth in Swiss e-bike adoption...</p>
+              <button class="btn-small generate-from-article">Generate Article</button>
+            </div>
+          </div>
+        </div>
+      </div>
+    `;}
+renderDraftsManager(){return`
+      <div class="drafts-manager">
+        <div class="drafts-header">
+          <h4>Article Drafts</h4>
+          <div class="draft-filters">
+            <select class="filter-status">
+              <option value="all">All Drafts</option>
+              <option value="ready">Ready to Publish</option>
+              <option value="needs-review">Needs Review</option>
+              <option value="scheduled">Scheduled</option>
+            </select>
+            <select class="filter-language">
+              <option value="all">All Languages</option>
+              <option value="en">English</option>
+              <option value="de">German</option>
+              <option value="fr">French</option>
+              <option value="it">Italian</option>
+            </select>
+          </div>
+        </div>
+
+        <div class="drafts-list">
+          <div class="draft-item">
+            <div class="draft-preview">
+              <h5>E-Bike Trends 2025: What to Expect</h5>
+              <p class="draft-excerpt">The e-bike industry is set for major innovations in 2025, with advances in battery technology...</p>
+              <div class="draft-meta">
+                <span>Generated: 2 hours ago</span>
+                <span>Language: EN</span>
+                <span>Word count: 1,245</span>
+              </div>
+            </div>
+            <div class="draft-actions">
+              <button class="btn-primary publish-btn">Publish</button>
+              <button class="btn-secondary edit-btn">Edit</button>
+              <button class="btn-secondary translate-btn">Translate</button>
+              <button class="btn-secondary schedule-btn">Schedule</button>
+              <button class="btn-danger delete-btn">Delete</button>
+            </div>
+          </div>
+
+          <div class="draft-item">
+            <h5>Winter E-Bike Maintenance Guide</h5>
+            <p class="draft-excerpt">Keep your e-bike running smoothly through winter with these essential maintenance tips...</p>
+            <div class="draft-meta">
+              <span>Generated: Yesterday</span>
+              <span>Language: DE</span>
+              <span>Word count: 987</span>
+            </div>
+            <div class="draft-actions">
+              <button class="btn-primary publish-btn">Publish</button>
+              <button class="btn-secondary edit-btn">Edit</button>
+              <button class="btn-secondary preview-btn">Preview</button>
+            </div>
+          </div>
+        </div>
+      </div>
+    `;}
+renderScheduleManager(){return`
+      <div class="schedule-manager">
+        <div class="schedule-header">
+          <h4>Publishing Schedule</h4>
+          <button class="btn-primary add-scheduled-post">+ Schedule Post</button>
+        </div>
+
+        <div class="schedule-calendar">
+          <div class="calendar-week">
+            ${['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'].map(day => `
+              <div class="calendar-day">
+                <div class="day-header">${day}</div>
+                <div class="day-posts">
+                  ${day === 'Mon' ? '<div class="scheduled-post">10:00 - Industry News</div>' : ''}
+                  ${day === 'Wed' ? '<div class="scheduled-post">14:00 - Buying Guide</div>' : ''}
+                  ${day === 'Fri' ? '<div class="scheduled-post">09:00 - Swiss Market Update</div>' : ''}
+                </div>
+              </div>
+            `).join('')}
+          </div>
+        </div>
+
+        <div class="schedule-queue">
+          <h4>Upcoming Publications</h4>
+          <div class="queue-list">
+            <div class="queue-item">
+              <span class="queue-time">Tomorrow 10:00</span>
+              <span class="queue-title">E-Bike Trends 2025</span>
+              <button class="btn-small reschedule">Reschedule</button>
+            </div>
+            <div class="queue-item">
+              <span class="queue-time">Wed 14:00</span>
+              <span class="queue-title">Choosing Your First E-Bike</span>
+              <button class="btn-small reschedule">Reschedule</button>
+            </div>
+          </div>
+        </div>
+      </div>
+    `;}
+renderSettings(){return`
+      <div class="generator-settings">
+        <h4>Blog Generator Settings</h4>
+        
+        <div class="settings-section">
+          <h5>AI Configuration</h5>
+          <div class="setting-item">
+            <label>AI Provider</label>
+            <select class="ai-provider">
+              <option value="openai">OpenAI GPT-4</option>
+              <option value="claude">Claude</option>
+              <option value="gemini">Google Gemini</option>
+            </select>
+          </div>
+          <div class="setting-item">
+            <label>Content Tone</label>
+            <select class="content-tone">
+              <option value="professional">Professional</option>
+              <option value="friendly">Friendly</option>
+              <option value="casual">Casual</option>
+              <option value="technical">Technical</option>
+            </select>
+          </div>
+          <div class="setting-item">
+            <label>Target Audience</label>
+            <select class="target-audience">
+              <option value="general">General Public</option>
+              <option value="enthusiasts">E-Bike Enthusiasts</option>
+              <option value="commuters">Commuters</option>
+              <option value="technical">Technical Readers</option>
+            </select>
+          </div>
+        </div>
+
+        <div class="settings-section">
+          <h5>Language Settings</h5>
+          <div class="setting-item">
+            <label>Primary Language</label>
+            <select class="primary-language">
+              <option value="en">English</option>
+              <option value="de">German</option>
+              <option value="fr">French</option>
+              <option value="it">Italian</option>
+            </select>
+          </div>
+          <div class="setting-item">
+            <label>Auto-Translate</label>
+            <input type="checkbox" checked /> Enable automatic translation
+          </div>
+          <div class="setting-item">
+            <label>Translation Languages</label>
+            <div class="checkbox-group">
+              <label><input type="checkbox" checked /> German</label>
+              <label><input type="checkbox" checked /> French</label>
+              <label><input type="checkbox" checked /> Italian</label>
+            </div>
+          </div>
+        </div>
+
+        <div class="settings-section">
+          <h5>SEO Settings</h5>
+          <div class="setting-item">
+            <label>Focus Keywords</label>
+            <textarea rows="3" placeholder="e-bike schweiz, elektrofahrrad, pedelec...">e-bike schweiz, elektrofahrrad kaufen, pedelec test, e-bike beratung</textarea>
+          </div>
+          <div class="setting-item">
+            <label>Meta Description Template</label>
+            <textarea rows="2">{title} - Expert advice from Godspeed, your Swiss e-bike specialist. {excerpt}</textarea>
+          </div>
+        </div>
+
+        <div class="settings-actions">
+          <button class="btn-primary save-settings">Save Settings</button>
+          <button class="btn-secondary reset-settings">Reset to Defaults</button>
+        </div>
+      </div>
+    `;}
+setupEventHandlers(){const container=this.element.querySelector('.ebike-blog-generator-tool');container.querySelectorAll('.tab-btn').forEach(btn=>{btn.addEventListener('click',(e)=>{container.querySelectorAll('.tab-btn').forEach(b=>b.classList.remove('active'));e.target.classList.add('active');this.currentView=e.target.dataset.view;this.updateView();});});const generateBtn=container.querySelector('.generate-now-btn');if(generateBtn){generateBtn.addEventListener('click',()=>this.generateNewArticle());}
+const scanBtn=container.querySelector('.scan-feeds-btn');if(scanBtn){scanBtn.addEventListener('click',()=>this.scanFeeds());}}
+updateView(){const content=this.element.querySelector('.generator-content');content.innerHTML=this.renderCurrentView();this.setupEventHandlers();}
+async generateNewArticle(){const modal=this.showGenerationModal();setTimeout(()=>{this.generatedDrafts.push({title:'New E-Bike Safety Standards in Switzerland',excerpt:'Understanding the latest regulatory changes for e-bikes in Switzerland...',content:'<p>Full article content here...</p>',language:'en',wordCount:1234,generatedAt:new Date()});modal.remove();showSuccess('Article generated successfully! Check the Drafts tab.');this.currentView='drafts';this.updateView();},3000);}
+showGenerationModal(){const modal=document.createElement('div');modal.className='generation-modal';modal.innerHTML=`
+      <div class="modal-content">
+        <h3>Generating Article...</h3>
+        <div class="generation-progress">
+          <div class="progress-step active">📰 Analyzing RSS feeds...</div>
+          <div class="progress-step">🤖 AI processing content...</div>
+          <div class="progress-step">✏️ Optimizing for SEO...</div>
+          <div class="progress-step">🌐 Preparing translations...</div>
+        </div>
+        <div class="loading-spinner">⏳</div>
+      </div>
+    `;document.body.appendChild(modal);let step=0;const steps=modal.querySelectorAll('.progress-step');const interval=setInterval(()=>{step++;if(step<steps.length){steps[step].classList.add('active');}else{clearInterval(interval);}},750);return modal;}
+async scanFeeds(){showInfo('Scanning RSS feeds for new content...');setTimeout(()=>{showSuccess('Found 5 new articles across all feeds!');},2000);}
+loadFeedStatus(){}
+destroy(){const generator=this.element.querySelector('.ebike-blog-generator-tool');if(generator)generator.remove();}}
+EBikeToolkit.register('BlogGenerator',BlogGenerator);window.EBikeToolkitModules.BlogGenerator=BlogGenerator;})();
@@ -0,0 +1,49 @@
+class EBikeToolkit{constructor(config={}){this.version='3.0.0';this.config={theme:'auto-detect',cssFramework:'auto',selectors:{container:'.ebike-tools-container, .page-width, .container',button:'.btn, .button, .form__button',input:'.field__input, .form__input, input[type="text"], input[type="number"]',select:'.field__input, .form__select, select',card:'.card, .product-card, .grid__item',modal:'.modal, .drawer, .popup',notification:'.notification, .alert, .message'},features:{comparison:true,sizing:true,financing:true,wishlist:true,ai:true,rangeCalculator:true,testRideBooking:true,serviceBooking:true,comparison:true,dashboardManagement:true,blogGenerator:true},branding:{primary:'#2c2c2c',accent:'#ff6b9d',success:'#22c55e',warning:'#f59e0b',error:'#ef4444'},endpoints:{comparison:null,sizing:null,financing:null},...config};this.theme=null;this.modules=new Map();this.initialized=false;this.init();}
+async init(){if(this.initialized)return;try{this.theme=this.detectTheme();this.adaptToTheme();this.loadCSS();await this.initializeModules();this.setupEventListeners();setTimeout(()=>{this.scanForToolElements();},100);this.initialized=true;this.log('E-Bike Toolkit initialized successfully','success');document.dispatchEvent(new CustomEvent('ebike-toolkit:ready',{detail:{toolkit:this,version:this.version}}));}catch(error){this.log(`Failed to initialize toolkit: ${error.message}`,'error');}}
+detectTheme(){const body=document.body;const html=document.documentElement;if(body.classList.contains('gradient')||document.querySelector('.header__wrapper')||document.querySelector('.shopify-section-group-header-group')){return'godspeed';}
+if(body.classList.contains('homepage--white')||document.querySelector('.theme-collection-container')||document.querySelector('[class*="homepage--"]')){return'custom';}
+if(body.classList.contains('template-index')&&document.querySelector('.site-header__logo')){return'impulse';}
+if(document.querySelector('.site-header')&&document.querySelector('.main-content')){return'brooklyn';}
+if(document.querySelector('.site-header')&&document.querySelector('.template-index')){return'debut';}
+if(document.querySelector('.shopify-section')||document.querySelector('[class*="template-"]')){return'generic-shopify';}
+return'unknown';}
+adaptToTheme(){const adaptations={godspeed:{selectors:{button:'.button',input:'.field__input',select:'.field__input',container:'.page-width',card:'.card',modal:'.modal'},classes:{buttonPrimary:'button button--primary',buttonSecondary:'button button--secondary',field:'field',grid:'grid'}},custom:{selectors:{button:'.btn',input:'input',select:'select',container:'.wrapper',card:'.grid__item',modal:'.modal'},classes:{buttonPrimary:'btn btn-primary',buttonSecondary:'btn btn-secondary',field:'form-group',grid:'grid'}},impulse:{selectors:{button:'.btn',input:'.form-field',select:'.form-field',container:'.page-width',card:'.grid__item'},classes:{buttonPrimary:'btn product-form__cart-submit',buttonSecondary:'btn btn--secondary',field:'form-field',grid:'grid grid--uniform'}},'generic-shopify':{selectors:{button:'.btn, .button, input[type="submit"]',input:'input[type="text"], input[type="number"], input[type="email"]',select:'select',container:'.main-content, .page-width, .container',card:'.product-item, .grid__item, .product'},classes:{buttonPrimary:'btn btn-primary',buttonSecondary:'btn btn-secondary',field:'form-field',grid:'grid'}}};const themeConfig=adaptations[this.theme]||adaptations['generic-shopify'];this.config.selectors={...this.config.selectors,...themeConfig.selectors};this.config.classes={...this.config.classes,...themeConfig.classes};this.log(`Adapted to theme: ${this.theme}`,'info');}
+loadCSS(){const cssId='godspeed-bike-toolkit-css';if(!document.getElementById(cssId)){const link=document.createElement('link');link.id=cssId;link.rel='stylesheet';link.href=`${window.Shopify?.routes?.root || ''}/assets/godspeed-bike-toolkit.css?v=${this.version}`;document.head.appendChild(link);this.setCSSProperties();}}
+setCSSProperties(){const root=document.documentElement;Object.entries(this.config.branding).forEach(([key,value])=>{root.style.setProperty(`--ebike-${key}`,value);});root.style.setProperty('--ebike-theme',this.theme);}
+async initializeModules(){const registry=EBikeToolkit.registry||{};const modulePromises=[];if(this.config.features.comparison){modulePromises.push(this.loadModule('comparison',registry.BikeComparison));}
+if(this.config.features.sizing){modulePromises.push(this.loadModule('sizing',registry.SizeCalculator));}
+if(this.config.features.financing){modulePromises.push(this.loadModule('financing',registry.FinancingCalculator));}
+if(this.config.features.wishlist){modulePromises.push(this.loadModule('wishlist',registry.WishlistManager));}
+if(this.config.features.rangeCalculator){modulePromises.push(this.loadModule('rangeCalculator',registry.RangeCalculator));}
+if(this.config.features.testRideBooking){modulePromises.push(this.loadModule('testRideBooking',registry.TestRideBooking));}
+if(this.config.features.serviceBooking){modulePromises.push(this.loadModule('serviceBooking',registry.ServiceBooking));}
+if(this.config.features.comparison){modulePromises.push(this.loadModule('comparison',registry.BikeComparison));}
+if(this.config.features.dashboardManagement){modulePromises.push(this.loadModule('dashboardManagement',registry.DashboardManagement));}
+if(this.config.features.blogGenerator){modulePromises.push(this.loadModule('blogGenerator',registry.BlogGenerator));}
+await Promise.allSettled(modulePromises);}
+async loadModule(name,ModuleClass){if(!ModuleClass)return;try{const module=new ModuleClass(this);await module.init();this.modules.set(name,module);this.log(`Module ${name} loaded successfully`,'success');document.dispatchEvent(new CustomEvent(`ebike-toolkit:${name}:ready`,{detail:{module,toolkit:this}}));}catch(error){this.log(`Failed to load module ${name}: ${error.message}`,'error');}}
+setupEventListeners(){document.addEventListener('shopify:section:load',(event)=>{this.handleSectionLoad(event);});document.addEventListener('DOMContentLoaded',()=>{this.scanForToolElements();});if(window.history&&window.history.pushState){window.addEventListener('popstate',()=>{setTimeout(()=>this.scanForToolElements(),100);});}}
+handleSectionLoad(event){const sectionId=event.detail.sectionId;setTimeout(()=>{this.scanForToolElements(event.target);},100);}
+scanForToolElements(container=document){const comparisonElements=container.querySelectorAll('[data-ebike-tool="comparison"]');comparisonElements.forEach(element=>{const module=this.modules.get('comparison');if(module)module.bindElement(element);});const sizingElements=container.querySelectorAll('[data-ebike-tool="sizing"]');sizingElements.forEach(element=>{const module=this.modules.get('sizing');if(module)module.bindElement(element);});const financingElements=container.querySelectorAll('[data-ebike-tool="financing"]');financingElements.forEach(element=>{const module=this.modules.get('financing');if(module)module.bindElement(element);});const wishlistElements=container.querySelectorAll('[data-ebike-tool="wishlist"]');wishlistElements.forEach(element=>{const module=this.modules.get('wishlist');if(module)module.bindElement(element);});const rangeElements=container.querySelectorAll('[data-ebike-tool="rangeCalculator"]');rangeElements.forEach(element=>{const module=this.modules.get('rangeCalculator');if(module)module.bindElement(element);});const testRideElements=container.querySelectorAll('[data-ebike-tool="testRideBooking"]');testRideElements.forEach(element=>{const module=this.modules.get('testRideBooking');if(module)module.bindElement(element);});const serviceElements=container.querySelectorAll('[data-ebike-tool="serviceBooking"]');serviceElements.forEach(element=>{const module=this.modules.get('serviceBooking');if(module)module.bindElement(element);});const dashboardElements=container.querySelectorAll('[data-ebike-tool="dashboardManagement"]');dashboardElements.forEach(element=>{const module=this.modules.get('dashboardManagement');if(module)module.bindElement(element);});const blogGeneratorElements=container.querySelectorAll('[data-ebike-tool="blogGenerator"]');blogGeneratorElements.forEach(element=>{const module=this.modules.get('blogGenerator');if(module)module.bindElement(element);});}
+getModule(name){return this.modules.get(name);}
+static register(name,ModuleClass){EBikeToolkit.registry=EBikeToolkit.registry||{};EBikeToolkit.registry[name]=ModuleClass;}
+toggleFeature(name,enabled){this.config.features[name]=enabled;if(enabled&&!this.modules.has(name)){this.loadModuleByName(name);}else if(!enabled&&this.modules.has(name)){const module=this.modules.get(name);module.destroy();this.modules.delete(name);}}
+updateConfig(newConfig){this.config={...this.config,...newConfig};this.adaptToTheme();this.setCSSProperties();}
+getInfo(){return{version:this.version,theme:this.theme,modules:Array.from(this.modules.keys()),config:this.config};}
+find(selector,context=document){const selectors=selector.split(',').map(s=>s.trim());for(const sel of selectors){const elements=context.querySelectorAll(sel);if(elements.length>0)return elements;}
+return[];}
+createElement(tag,classes='',content=''){const element=document.createElement(tag);if(classes){const mappedClasses=this.mapClasses(classes);element.className=mappedClasses;}
+if(content){element.innerHTML=content;}
+return element;}
+mapClasses(classes){const classMap=this.config.classes||{};return classes.split(' ').map(cls=>{return classMap[cls]||cls;}).join(' ');}
+log(message,level='info'){const prefix=`[E-Bike Toolkit ${this.version}]`;switch(level){case'error':console.error(`${prefix} ${message}`);break;case'warning':console.warn(`${prefix} ${message}`);break;case'success':console.log(`%c${prefix} ${message}`,'color: #22c55e; font-weight: bold;');break;default:console.log(`${prefix} ${message}`);}}}
+class BaseModule{constructor(toolkit){this.toolkit=toolkit;this.config=toolkit.config;this.theme=toolkit.theme;this.elements=new Set();this.initialized=false;}
+async init(){this.initialized=true;}
+bindElement(element){if(this.elements.has(element))return;this.elements.add(element);this.setupElement(element);}
+setupElement(element){}
+destroy(){this.elements.forEach(element=>{this.cleanupElement(element);});this.elements.clear();this.initialized=false;}
+cleanupElement(element){}
+find(selector,context=document){return this.toolkit.find(selector,context);}
+createElement(tag,classes,content){return this.toolkit.createElement(tag,classes,content);}
+log(message,level='info'){this.toolkit.log(`[${this.constructor.name}] ${message}`,level);}}
+document.addEventListener('DOMContentLoaded',()=>{const autoInit=!document.querySelector('[data-ebike-toolkit-manual]');if(autoInit){window.EBikeToolkitInstance=new EBikeToolkit(window.ebikeToolkitConfig||{});}});window.EBikeToolkit=EBikeToolkit;window.EBikeToolkitModules=window.EBikeToolkitModules||{};window.EBikeToolkitModules.BaseModule=BaseModule;window.GodspeedToolkit=window.EBikeToolkitModules;
@@ -0,0 +1,212 @@
+(()=>{if(EBikeToolkit.registry&&EBikeToolkit.registry.DashboardManagement)return;class DashboardManagement extends BaseModule{constructor(toolkit){super(toolkit);this.dashboards=new Map();}
+async init(){await super.init();this.log('Dashboard Management module initialized');}
+setupElement(element){const dashboardId=element.dataset.dashboardId||this.generateId();element.dataset.dashboardId=dashboardId;const dashboardData=window.dashboardManagementData||{};const dashboardUtils=window.dashboardManagementUtils||{};const dashboard=new DashboardManagementInstance(dashboardId,element,this,dashboardData,dashboardUtils);this.dashboards.set(dashboardId,dashboard);dashboard.render();}
+cleanupElement(element){const dashboardId=element.dataset.dashboardId;if(dashboardId&&this.dashboards.has(dashboardId)){this.dashboards.get(dashboardId).destroy();this.dashboards.delete(dashboardId);}}
+generateId(){return`dashboard_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;}}
+class DashboardManagementInstance{constructor(id,element,module,dashboardData={},dashboardUtils={}){this.id=id;this.element=element;this.module=module;this.dashboardData=dashboardData;this.dashboardUtils=dashboardUtils;this.refreshInterval=30000;this.lastUpdated=new Date();this.vendors={bosch:{name:'Bosch eBike Systems',status:'connected',apiUrl:'https://api.bosch-ebike.com/v1',lastSync:new Date(Date.now()-120000),syncStatus:'success',metrics:{totalProducts:1247,syncedToday:45,failedSyncs:2,avgResponseTime:350,rateLimitUsed:78},endpoints:[{name:'Products',status:'healthy',responseTime:245},{name:'Inventory',status:'healthy',responseTime:412},{name:'Specifications',status:'warning',responseTime:850},{name:'Images',status:'healthy',responseTime:180}]},shimano:{name:'Shimano Steps',status:'connected',apiUrl:'https://api.shimano-steps.com/v2',lastSync:new Date(Date.now()-180000),syncStatus:'success',metrics:{totalProducts:892,syncedToday:31,failedSyncs:0,avgResponseTime:280,rateLimitUsed:45},endpoints:[{name:'Products',status:'healthy',responseTime:190},{name:'Inventory',status:'healthy',responseTime:320},{name:'Specifications',status:'healthy',responseTime:275},{name:'Images',status:'healthy',responseTime:165}]},specialized:{name:'Specialized Turbo',status:'warning',apiUrl:'https://api.specialized.com/turbo/v1',lastSync:new Date(Date.now()-900000),syncStatus:'partial_failure',metrics:{totalProducts:634,syncedToday:12,failedSyncs:8,avgResponseTime:1200,rateLimitUsed:95},endpoints:[{name:'Products',status:'error',responseTime:2100},{name:'Inventory',status:'healthy',responseTime:450},{name:'Specifications',status:'warning',responseTime:1800},{name:'Images',status:'healthy',responseTime:230}]},trek:{name:'Trek eBikes',status:'maintenance',apiUrl:'https://api.trek.com/ebikes/v1',lastSync:new Date(Date.now()-3600000),syncStatus:'maintenance',metrics:{totalProducts:456,syncedToday:0,failedSyncs:0,avgResponseTime:0,rateLimitUsed:0},endpoints:[{name:'Products',status:'maintenance',responseTime:0},{name:'Inventory',status:'maintenance',responseTime:0},{name:'Specifications',status:'maintenance',responseTime:0},{name:'Images',status:'maintenance',responseTime:0}]},velo_connect:{name:'VeloConnect Hub',status:'connected',apiUrl:'https://api.veloconnect.ch/v3',lastSync:new Date(Date.now()-60000),syncStatus:'success',metrics:{totalProducts:2834,syncedToday:156,failedSyncs:3,avgResponseTime:180,rateLimitUsed:34},endpoints:[{name:'Aggregated Feed',status:'healthy',responseTime:145},{name:'Price Updates',status:'healthy',responseTime:220},{name:'Inventory Sync',status:'healthy',responseTime:175},{name:'Media Assets',status:'healthy',responseTime:95}]}};this.performanceData={totalApiCalls:15742,successfulCalls:14891,failedCalls:851,averageResponseTime:285,dataTransferred:'2.4 GB',uptime:'99.2%'};}
+render(){const placeholder=this.element.querySelector('.ebike-loading-placeholder');if(placeholder){placeholder.style.display='none';placeholder.style.visibility='hidden';placeholder.remove();}
+const dashboardDiv=document.createElement('div');dashboardDiv.className='ebike-dashboard-tool';dashboardDiv.innerHTML=this.buildDashboardHTML();this.element.appendChild(dashboardDiv);this.setupEventHandlers();this.startAutoRefresh();}
+buildDashboardHTML(){return`
+      <div class="dashboard-wrapper">
+        <div class="dashboard-header">
+          <h3>${this.element.dataset.title || 'VeloConnect Dashboard'}</h3>
+          <div class="dashboard-controls">
+            <div class="last-updated">
+              Last updated: ${this.formatTime(this.lastUpdated)}
+            </div>
+            <button class="btn-secondary refresh-btn" title="Refresh Dashboard">
+              🔄 Refresh
+            </button>
+            <button class="btn-secondary settings-btn" title="Dashboard Settings">
+              ⚙️ Settings
+            </button>
+          </div>
+        </div>
+
+        <div class="dashboard-overview">
+          <div class="overview-cards">
+            <div class="overview-card total-vendors">
+              <h4>Connected Vendors</h4>
+              <div class="card-value">${Object.keys(this.vendors).length}</div>
+              <div class="card-detail">${this.getHealthyVendorsCount()} healthy</div>
+            </div>
+            <div class="overview-card total-products">
+              <h4>Total Products</h4>
+              <div class="card-value">${this.getTotalProducts().toLocaleString()}</div>
+              <div class="card-detail">${this.getSyncedTodayCount()} synced today</div>
+            </div>
+            <div class="overview-card api-health">
+              <h4>API Health</h4>
+              <div class="card-value">${this.performanceData.uptime}</div>
+              <div class="card-detail">${this.performanceData.averageResponseTime}ms avg</div>
+            </div>
+            <div class="overview-card sync-status">
+              <h4>Sync Status</h4>
+              <div class="card-value">${this.getOverallSyncStatus()}</div>
+              <div class="card-detail">${this.getTotalFailedSyncs()} failed today</div>
+            </div>
+          </div>
+        </div>
+
+        <div class="dashboard-content">
+          <div class="vendors-section">
+            <h4>Vendor Status</h4>
+            <div class="vendors-grid">
+              ${Object.entries(this.vendors).map(([key, vendor]) => `
+                <div class="vendor-card ${vendor.status}" data-vendor="${key}">
+                  <div class="vendor-header">
+                    <h5>${vendor.name}</h5>
+                    <div class="vendor-status ${vendor.status}">
+                      ${this.getStatusIcon(vendor.status)} ${vendor.status.replace('_', ' ')}
+                    </div>
+                  </div>
+                  
+                  <div class="vendor-metrics">
+                    <div class="metric">
+                      <span class="metric-label">Products:</span>
+                      <span class="metric-value">${vendor.metrics.totalProducts.toLocaleString()}</span>
+                    </div>
+                    <div class="metric">
+                      <span class="metric-label">Synced Today:</span>
+                      <span class="metric-value">${vendor.metrics.syncedToday}</span>
+                    </div>
+                    <div class="metric">
+                      <span class="metric-label">Response Time:</span>
+                      <span class="metric-value">${vendor.metrics.avgResponseTime}ms</span>
+                    </div>
+                    <div class="metric">
+                      <span class="metric-label">Rate Limit:</span>
+                      <span class="metric-value">${vendor.metrics.rateLimitUsed}%</span>
+                    </div>
+                  </div>
+                  
+                  <div class="vendor-endpoints">
+                    <h6>Endpoint Health</h6>
+                    ${vendor.endpoints.map(endpoint => `
+                      <div class="endpoint ${endpoint.status}">
+                        <span class="endpoint-name">${endpoint.name}</span>
+                        <span class="endpoint-status">
+                          ${this.getStatusIcon(endpoint.status)} ${endpoint.responseTime}ms
+                        </span>
+                      </div>
+                    `).join('')}
+                  </div>
+                  
+                  <div class="vendor-actions">
+                    <button class="btn-small" onclick="this.testConnection('${key}')">Test</button>
+                    <button class="btn-small" onclick="this.forcSync('${key}')">Sync</button>
+                    <button class="btn-small" onclick="this.viewLogs('${key}')">Logs</button>
+                  </div>
+                </div>
+              `).join('')}
+            </div>
+          </div>
+
+          <div class="performance-section">
+            <h4>Performance Analytics</h4>
+            <div class="performance-grid">
+              <div class="performance-chart">
+                <h5>API Response Times (24h)</h5>
+                <div class="chart-placeholder">
+                  ${this.generateResponseTimeChart()}
+                </div>
+              </div>
+              
+              <div class="performance-chart">
+                <h5>Sync Success Rate</h5>
+                <div class="chart-placeholder">
+                  ${this.generateSuccessRateChart()}
+                </div>
+              </div>
+              
+              <div class="performance-stats">
+                <h5>Today's Statistics</h5>
+                <div class="stats-grid">
+                  <div class="stat-item">
+                    <div class="stat-value">${this.performanceData.totalApiCalls.toLocaleString()}</div>
+                    <div class="stat-label">Total API Calls</div>
+                  </div>
+                  <div class="stat-item">
+                    <div class="stat-value">${this.performanceData.successfulCalls.toLocaleString()}</div>
+                    <div class="stat-label">Successful Calls</div>
+                  </div>
+                  <div class="stat-item">
+                    <div class="stat-value">${this.performanceData.dataTransferred}</div>
+                    <div class="stat-label">Data Transferred</div>
+                  </div>
+                  <div class="stat-item">
+                    <div class="stat-value">${((this.performanceData.successfulCalls / this.performanceData.totalApiCalls) * 100).toFixed(1)}%</div>
+                    <div class="stat-label">Success Rate</div>
+                  </div>
+                </div>
+              </div>
+            </div>
+          </div>
+
+          <div class="alerts-section">
+            <h4>Active Alerts & Recommendations</h4>
+            <div class="alerts-list">
+              ${this.generateAlerts()}
+            </div>
+          </div>
+        </div>
+      </div>
+    `;}
+getStatusIcon(status){const icons={'connected':'✅','healthy':'✅','warning':'⚠️','error':'❌','maintenance':'🔧','partial_failure':'⚠️'};return icons[status]||'❓';}
+getHealthyVendorsCount(){return Object.values(this.vendors).filter(v=>v.status==='connected').length;}
+getTotalProducts(){return Object.values(this.vendors).reduce((sum,v)=>sum+v.metrics.totalProducts,0);}
+getSyncedTodayCount(){return Object.values(this.vendors).reduce((sum,v)=>sum+v.metrics.syncedToday,0);}
+getTotalFailedSyncs(){return Object.values(this.vendors).reduce((sum,v)=>sum+v.metrics.failedSyncs,0);}
+getOverallSyncStatus(){const totalFailed=this.getTotalFailedSyncs();if(totalFailed===0)return'Excellent';if(totalFailed<5)return'Good';if(totalFailed<15)return'Warning';return'Critical';}
+generateResponseTimeChart(){const hours=Array.from({length:24},(_,i)=>i);const avgTimes=hours.map(()=>Math.floor(Math.random()*300+200));return`
+      <div class="simple-chart">
+        ${avgTimes.map((time, i) => `
+          <div class="chart-bar" style="height: ${(time / 500) * 100}%" 
+               title="${i}:00 - ${time}ms"></div>
+        `).join('')}
+      </div>
+      <div class="chart-labels">
+        <span>0h</span><span>6h</span><span>12h</span><span>18h</span><span>24h</span>
+      </div>
+    `;}
+generateSuccessRateChart(){const successRate=(this.performanceData.successfulCalls/this.performanceData.totalApiCalls)*100;return`
+      <div class="success-rate-circle">
+        <div class="circle-chart" data-percent="${successRate.toFixed(1)}">
+          <div class="circle-progress" style="--percent: ${successRate}"></div>
+          <div class="circle-text">${successRate.toFixed(1)}%</div>
+        </div>
+      </div>
+    `;}
+generateAlerts(){const alerts=[];Object.entries(this.vendors).forEach(([key,vendor])=>{if(vendor.status==='warning'){alerts.push({level:'warning',message:`${vendor.name} has slow response times (${vendor.metrics.avgResponseTime}ms)`,action:'Monitor performance'});}
+if(vendor.status==='error'){alerts.push({level:'error',message:`${vendor.name} connection failed`,action:'Check API credentials'});}
+if(vendor.metrics.rateLimitUsed>90){alerts.push({level:'warning',message:`${vendor.name} approaching rate limit (${vendor.metrics.rateLimitUsed}%)`,action:'Reduce sync frequency'});}});if(this.performanceData.averageResponseTime>500){alerts.push({level:'warning',message:'Overall API response time is slow',action:'Optimize API calls'});}
+if(alerts.length===0){alerts.push({level:'success',message:'All systems operating normally',action:'No action required'});}
+return alerts.map(alert=>`
+      <div class="alert ${alert.level}">
+        <div class="alert-icon">${this.getStatusIcon(alert.level === 'success' ? 'healthy' : alert.level)}</div>
+        <div class="alert-content">
+          <div class="alert-message">${alert.message}</div>
+          <div class="alert-action">${alert.action}</div>
+        </div>
+      </div>
+    `).join('');}
+setupEventHandlers(){const container=this.element.querySelector('.ebike-dashboard-tool');const refreshBtn=container.querySelector('.refresh-btn');if(refreshBtn){refreshBtn.addEventListener('click',()=>this.refreshDashboard());}
+const settingsBtn=container.querySelector('.settings-btn');if(settingsBtn){settingsBtn.addEventListener('click',()=>this.openSettings());}
+container.querySelectorAll('.vendor-card').forEach(card=>{card.addEventListener('click',(e)=>{if(!e.target.closest('button')){const vendor=card.dataset.vendor;this.showVendorDetails(vendor);}});});}
+startAutoRefresh(){this.refreshTimer=setInterval(()=>{this.refreshDashboard(false);},this.refreshInterval);}
+async refreshDashboard(showLoading=true){if(showLoading){const refreshBtn=this.element.querySelector('.refresh-btn');if(refreshBtn){refreshBtn.innerHTML='🔄 Refreshing...';refreshBtn.disabled=true;}}
+try{await new Promise(resolve=>setTimeout(resolve,1000));this.lastUpdated=new Date();this.simulateDataUpdates();const container=this.element.querySelector('.ebike-dashboard-tool');container.innerHTML=this.buildDashboardHTML();this.setupEventHandlers();}catch(error){console.error('Dashboard refresh failed:',error);}
+if(showLoading){const refreshBtn=this.element.querySelector('.refresh-btn');if(refreshBtn){refreshBtn.innerHTML='🔄 Refresh';refreshBtn.disabled=false;}}}
+simulateDataUpdates(){Object.keys(this.vendors).forEach(key=>{const vendor=this.vendors[key];if(vendor.status==='connected'){vendor.metrics.syncedToday+=Math.floor(Math.random()*3);vendor.lastSync=new Date();}
+if(Math.random()<0.1){vendor.metrics.failedSyncs+=1;}
+vendor.metrics.avgResponseTime+=Math.floor(Math.random()*40-20);vendor.metrics.avgResponseTime=Math.max(150,Math.min(2000,vendor.metrics.avgResponseTime));vendor.endpoints.forEach(endpoint=>{endpoint.responseTime+=Math.floor(Math.random()*40-20);endpoint.responseTime=Math.max(100,Math.min(3000,endpoint.responseTime));});});}
+testConnection(vendorKey){const vendor=this.vendors[vendorKey];if(!vendor)return;showInfo(`Testing connection to ${vendor.name}...\n\nResult: Connection successful ✅\nLatency: ${vendor.metrics.avgResponseTime}ms\nEndpoint: ${vendor.apiUrl}`);}
+forcSync(vendorKey){const vendor=this.vendors[vendorKey];if(!vendor)return;showInfo(`Force sync initiated for ${vendor.name}...\n\nSync started successfully ✅\nEstimated completion: 2-3 minutes\nProducts to sync: ${vendor.metrics.totalProducts}`);setTimeout(()=>{vendor.metrics.syncedToday+=Math.floor(Math.random()*10+5);vendor.lastSync=new Date();this.refreshDashboard(false);},2000);}
+viewLogs(vendorKey){const vendor=this.vendors[vendorKey];if(!vendor)return;const sampleLogs=[`[${new Date().toLocaleTimeString()}] INFO: Sync started for ${vendor.name}`,`[${new Date(Date.now() - 60000).toLocaleTimeString()}] SUCCESS: 25 products updated`,`[${new Date(Date.now() - 120000).toLocaleTimeString()}] WARNING: Rate limit at 85%`,`[${new Date(Date.now() - 180000).toLocaleTimeString()}] INFO: Connection established`,];showInfo(`Recent logs for ${vendor.name}:\n\n${sampleLogs.join('\n')}\n\n(Full logs would open in new window)`);}
+showVendorDetails(vendorKey){const vendor=this.vendors[vendorKey];if(!vendor)return;showInfo(`Detailed information for ${vendor.name} would open in a modal window.`);}
+openSettings(){showInfo('Dashboard settings would open here:\n\n• Refresh interval\n• Alert thresholds\n• Vendor configurations\n• API credentials\n• Export options');}
+formatTime(date){return date.toLocaleTimeString('en-US',{hour12:false,hour:'2-digit',minute:'2-digit',second:'2-digit'});}
+destroy(){if(this.refreshTimer){clearInterval(this.refreshTimer);}
+const dashboard=this.element.querySelector('.ebike-dashboard-tool');if(dashboard)dashboard.remove();}}
+EBikeToolkit.register('DashboardManagement',DashboardManagement);window.EBikeToolkitModules.DashboardManagement=DashboardManagement;window.GodspeedToolkit.DashboardManagement=class extends DashboardManagement{constructor(){const minimalToolkit={config:{},theme:null,log:console.log.bind(console)};super(minimalToolkit);}
+init(elementId){const element=document.getElementById(elementId);if(element)this.setupElement(element);}};})();
@@ -0,0 +1,37 @@
+(()=>{if(EBikeToolkit.registry&&EBikeToolkit.registry.FinancingCalculator)return;class FinancingCalculator extends BaseModule{constructor(toolkit){super(toolkit);this.calculators=new Map();}
+async init(){await super.init();this.log('Financing Calculator module initialized');}
+setupElement(element){const calculatorId=element.dataset.calculatorId||this.generateId();element.dataset.calculatorId=calculatorId;const calculator=new FinancingCalculatorInstance(calculatorId,element,this);this.calculators.set(calculatorId,calculator);calculator.render();}
+cleanupElement(element){const calculatorId=element.dataset.calculatorId;if(calculatorId&&this.calculators.has(calculatorId)){this.calculators.get(calculatorId).destroy();this.calculators.delete(calculatorId);}}
+generateId(){return`financing_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;}}
+class FinancingCalculatorInstance{constructor(id,element,module){this.id=id;this.element=element;this.module=module;}
+render(){this.element.innerHTML=`
+      <div class="ebike-financing-calculator" data-theme="${this.module.theme}">
+        <div class="financing-header">
+          <h3>${this.element.dataset.title || '0% Financing Calculator'}</h3>
+          <p>${this.element.dataset.subtitle || 'Calculate your monthly payments'}</p>
+        </div>
+        <div class="financing-form">
+          <div class="form-field">
+            <label>Bike Price (CHF)</label>
+            <input type="number" class="price-input" min="1000" max="15000" value="3500">
+          </div>
+          <div class="form-field">
+            <label>Financing Term</label>
+            <select class="term-select">
+              <option value="6">6 months</option>
+              <option value="12" selected>12 months</option>
+              <option value="18">18 months</option>
+              <option value="24">24 months</option>
+              <option value="36">36 months</option>
+            </select>
+          </div>
+          <div class="financing-result">
+            <div class="monthly-payment">Monthly Payment: <span class="amount">CHF 292</span></div>
+          </div>
+        </div>
+      </div>
+    `;this.bindEvents();this.calculate();}
+bindEvents(){const priceInput=this.element.querySelector('.price-input');const termSelect=this.element.querySelector('.term-select');priceInput.addEventListener('input',()=>this.calculate());termSelect.addEventListener('change',()=>this.calculate());}
+calculate(){const price=parseFloat(this.element.querySelector('.price-input').value)||0;const term=parseInt(this.element.querySelector('.term-select').value)||12;const monthlyPayment=price/term;const amountSpan=this.element.querySelector('.amount');amountSpan.textContent=`CHF ${monthlyPayment.toFixed(2)}`;}
+destroy(){this.element.innerHTML='';}}
+EBikeToolkit.register('FinancingCalculator',FinancingCalculator);window.EBikeToolkitModules.FinancingCalculator=FinancingCalculator;})();
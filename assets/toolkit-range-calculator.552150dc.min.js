@@ -0,0 +1,157 @@
+(()=>{if(EBikeToolkit.registry&&EBikeToolkit.registry.RangeCalculator)return;class RangeCalculator extends BaseModule{constructor(toolkit){super(toolkit);this.calculators=new Map();}
+async init(){await super.init();this.log('Range Calculator module initialized');}
+setupElement(element){const calculatorId=element.dataset.calculatorId||this.generateId();element.dataset.calculatorId=calculatorId;const rangeData=window.rangeCalculatorData||{};const rangeUtils=window.rangeCalculatorUtils||{};const calculator=new RangeCalculatorInstance(calculatorId,element,this,rangeData,rangeUtils);this.calculators.set(calculatorId,calculator);calculator.render();}
+cleanupElement(element){const calculatorId=element.dataset.calculatorId;if(calculatorId&&this.calculators.has(calculatorId)){this.calculators.get(calculatorId).destroy();this.calculators.delete(calculatorId);}}
+generateId(){return`range_calc_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;}}
+class RangeCalculatorInstance{constructor(id,element,module,rangeData={},rangeUtils={}){this.id=id;this.element=element;this.module=module;this.rangeData=rangeData;this.rangeUtils=rangeUtils;this.units=this.element.dataset.units||'metric';this.showTips=this.element.dataset.showTips!=='false';}
+render(){const placeholder=this.element.querySelector('.ebike-loading-placeholder');if(placeholder){placeholder.style.display='none';placeholder.style.visibility='hidden';placeholder.remove();}
+const calculatorDiv=document.createElement('div');calculatorDiv.className='ebike-range-calculator';calculatorDiv.innerHTML=this.buildCalculatorHTML();this.element.appendChild(calculatorDiv);this.bindEvents();this.calculate();}
+buildCalculatorHTML(){const weightLabel=this.units==='imperial'?'lbs':'kg';const tempLabel=this.units==='imperial'?'°F':'°C';return`
+      <div class="range-calculator-content">
+        <div class="calculator-header">
+          <h3>${this.element.dataset.title || 'Range Calculator'}</h3>
+          <p>${this.element.dataset.subtitle || 'Estimate your e-bike range based on real conditions'}</p>
+        </div>
+        
+        <form class="calculator-form">
+          <div class="form-row">
+            <div class="form-field">
+              <label for="bike-model-${this.id}">Bike Model</label>
+              <select id="bike-model-${this.id}" class="bike-model-select">
+                <option value="city-comfort">City Comfort Pro (400Wh)</option>
+                <option value="trekking-sport" selected>Trekking Sport X1 (625Wh)</option>
+                <option value="mountain-trail">Mountain Trail Pro (630Wh)</option>
+                <option value="cargo-family">Cargo Family+ (500Wh)</option>
+              </select>
+            </div>
+            <div class="form-field">
+              <label for="assist-level-${this.id}">Assist Level</label>
+              <select id="assist-level-${this.id}" class="assist-level-select">
+                <option value="eco">ECO - Maximum Range</option>
+                <option value="tour" selected>TOUR - Balanced</option>
+                <option value="sport">SPORT - Performance</option>
+                <option value="turbo">TURBO - Maximum Power</option>
+              </select>
+            </div>
+          </div>
+          
+          <div class="form-row">
+            <div class="form-field">
+              <label for="rider-weight-${this.id}">Rider Weight (${weightLabel})</label>
+              <input type="number" id="rider-weight-${this.id}" 
+                     min="${this.units === 'imperial' ? '90' : '40'}" 
+                     max="${this.units === 'imperial' ? '330' : '150'}" 
+                     value="${this.units === 'imperial' ? '165' : '75'}" 
+                     class="rider-weight-input">
+            </div>
+            <div class="form-field">
+              <label for="cargo-weight-${this.id}">Cargo Weight (${weightLabel})</label>
+              <input type="number" id="cargo-weight-${this.id}" 
+                     min="0" 
+                     max="${this.units === 'imperial' ? '110' : '50'}" 
+                     value="0" 
+                     class="cargo-weight-input">
+            </div>
+          </div>
+          
+          <div class="form-row">
+            <div class="form-field">
+              <label for="terrain-${this.id}">Terrain Type</label>
+              <select id="terrain-${this.id}" class="terrain-select">
+                <option value="flat">Flat/City (0% grade)</option>
+                <option value="rolling" selected>Rolling Hills (2-5% grade)</option>
+                <option value="hilly">Hilly (5-10% grade)</option>
+                <option value="mountain">Mountain (10%+ grade)</option>
+              </select>
+            </div>
+            <div class="form-field">
+              <label for="weather-${this.id}">Weather Conditions</label>
+              <select id="weather-${this.id}" class="weather-select">
+                <option value="ideal" selected>Ideal (20°C, No Wind)</option>
+                <option value="good">Good (Light Wind)</option>
+                <option value="fair">Fair (Strong Wind/Cold)</option>
+                <option value="poor">Poor (Very Cold/Storm)</option>
+              </select>
+            </div>
+          </div>
+          
+          <div class="form-row">
+            <div class="form-field">
+              <label for="temperature-${this.id}">Temperature (${tempLabel})</label>
+              <input type="number" id="temperature-${this.id}" 
+                     min="${this.units === 'imperial' ? '14' : '-10'}" 
+                     max="${this.units === 'imperial' ? '104' : '40'}" 
+                     value="${this.units === 'imperial' ? '68' : '20'}" 
+                     class="temperature-input">
+            </div>
+            <div class="form-field">
+              <label for="speed-${this.id}">Average Speed (${this.units === 'imperial' ? 'mph' : 'km/h'})</label>
+              <input type="number" id="speed-${this.id}" 
+                     min="${this.units === 'imperial' ? '6' : '10'}" 
+                     max="${this.units === 'imperial' ? '28' : '45'}" 
+                     value="${this.units === 'imperial' ? '15' : '25'}" 
+                     class="speed-input">
+            </div>
+          </div>
+        </form>
+        
+        <div class="calculation-results">
+          <h4>Estimated Range</h4>
+          <div class="range-estimates">
+            <div class="range-estimate conservative">
+              <div class="estimate-label">Conservative</div>
+              <div class="estimate-value" id="conservative-${this.id}">65 km</div>
+              <div class="estimate-description">Worst case scenario</div>
+            </div>
+            <div class="range-estimate realistic">
+              <div class="estimate-label">Realistic</div>
+              <div class="estimate-value" id="realistic-${this.id}">85 km</div>
+              <div class="estimate-description">Expected range</div>
+            </div>
+            <div class="range-estimate optimistic">
+              <div class="estimate-label">Optimistic</div>
+              <div class="estimate-value" id="optimistic-${this.id}">105 km</div>
+              <div class="estimate-description">Best case scenario</div>
+            </div>
+          </div>
+          
+          <div class="range-factors">
+            <h5>Range Impact Factors</h5>
+            <div class="factors-grid">
+              <div class="factor" id="terrain-impact-${this.id}">
+                <span class="factor-label">Terrain:</span>
+                <span class="factor-value">+20% consumption</span>
+              </div>
+              <div class="factor" id="weather-impact-${this.id}">
+                <span class="factor-label">Weather:</span>
+                <span class="factor-value">+0% consumption</span>
+              </div>
+              <div class="factor" id="weight-impact-${this.id}">
+                <span class="factor-label">Weight:</span>
+                <span class="factor-value">+15% consumption</span>
+              </div>
+              <div class="factor" id="assist-impact-${this.id}">
+                <span class="factor-label">Assist Level:</span>
+                <span class="factor-value">+30% consumption</span>
+              </div>
+            </div>
+          </div>
+        </div>
+        
+        ${this.showTips ? this.buildOptimizationTips() : ''}
+      </div>
+    `;}
+buildOptimizationTips(){const tips=this.units==='imperial'?['Use ECO mode for maximum range','Maintain proper tire pressure (35-60 psi)','Plan routes to avoid headwinds','Keep battery between 20-80% charge','Lighter cargo extends range significantly','Smooth acceleration saves energy']:['Use ECO mode for maximum range','Maintain proper tire pressure (2.5-4 bar)','Plan routes to avoid headwinds','Keep battery between 20-80% charge','Lighter cargo extends range significantly','Smooth acceleration saves energy'];return`
+      <div class="optimization-tips">
+        <h5>💡 Range Optimization Tips</h5>
+        <div class="tips-grid">
+          ${tips.map(tip => `<div class="tip">${tip}</div>`).join('')}
+        </div>
+      </div>
+    `;}
+bindEvents(){const form=this.element.querySelector('.calculator-form');const inputs=form.querySelectorAll('input, select');inputs.forEach(input=>{input.addEventListener('change',()=>this.calculate());input.addEventListener('input',()=>this.calculate());});}
+calculate(){const bikeModel=this.element.querySelector('.bike-model-select').value;const assistLevel=this.element.querySelector('.assist-level-select').value;const riderWeight=parseFloat(this.element.querySelector('.rider-weight-input').value)||75;const cargoWeight=parseFloat(this.element.querySelector('.cargo-weight-input').value)||0;const terrain=this.element.querySelector('.terrain-select').value;const weather=this.element.querySelector('.weather-select').value;const temperature=parseFloat(this.element.querySelector('.temperature-input').value)||20;const speed=parseFloat(this.element.querySelector('.speed-input').value)||25;const bikeSpecs={'city-comfort':{batteryCapacity:400,baseConsumption:12,efficiency:0.85},'trekking-sport':{batteryCapacity:625,baseConsumption:14,efficiency:0.82},'mountain-trail':{batteryCapacity:630,baseConsumption:18,efficiency:0.80},'cargo-family':{batteryCapacity:500,baseConsumption:20,efficiency:0.75}};const bike=bikeSpecs[bikeModel];const assistMultipliers={eco:0.7,tour:1.0,sport:1.4,turbo:1.8};const terrainMultipliers={flat:1.0,rolling:1.2,hilly:1.5,mountain:2.0};const weatherMultipliers={ideal:1.0,good:1.1,fair:1.3,poor:1.6};const tempCelsius=this.units==='imperial'?(temperature-32)*5/9:temperature;let tempMultiplier=1.0;if(tempCelsius<5)tempMultiplier=1.4;else if(tempCelsius<15)tempMultiplier=1.2;else if(tempCelsius>30)tempMultiplier=1.15;const totalWeight=this.units==='imperial'?(riderWeight+cargoWeight)*0.453592:(riderWeight+cargoWeight);let weightMultiplier=1.0;if(totalWeight>100)weightMultiplier=1.35;else if(totalWeight>80)weightMultiplier=1.15;else if(totalWeight<60)weightMultiplier=0.9;const speedKmh=this.units==='imperial'?speed*1.60934:speed;const speedMultiplier=Math.max(0.8,Math.min(1.5,speedKmh/25));const baseConsumption=bike.baseConsumption*assistMultipliers[assistLevel];const totalConsumption=baseConsumption*terrainMultipliers[terrain]*weatherMultipliers[weather]*tempMultiplier*weightMultiplier*speedMultiplier;const baseRange=bike.batteryCapacity/totalConsumption;const conservative=Math.round(baseRange*0.8);const realistic=Math.round(baseRange);const optimistic=Math.round(baseRange*1.2);const unit=this.units==='imperial'?'miles':'km';const conversionFactor=this.units==='imperial'?0.621371:1;document.getElementById(`conservative-${this.id}`).textContent=`${Math.round(conservative * conversionFactor)} ${unit}`;document.getElementById(`realistic-${this.id}`).textContent=`${Math.round(realistic * conversionFactor)} ${unit}`;document.getElementById(`optimistic-${this.id}`).textContent=`${Math.round(optimistic * conversionFactor)} ${unit}`;this.updateFactors(terrainMultipliers[terrain],weatherMultipliers[weather],weightMultiplier,assistMultipliers[assistLevel]);}
+updateFactors(terrainMult,weatherMult,weightMult,assistMult){const formatPercent=(mult)=>{const percent=Math.round((mult-1)*100);return percent>0?`+${percent}%`:`${percent}%`;};document.getElementById(`terrain-impact-${this.id}`).querySelector('.factor-value').textContent=`${formatPercent(terrainMult)} consumption`;document.getElementById(`weather-impact-${this.id}`).querySelector('.factor-value').textContent=`${formatPercent(weatherMult)} consumption`;document.getElementById(`weight-impact-${this.id}`).querySelector('.factor-value').textContent=`${formatPercent(weightMult)} consumption`;document.getElementById(`assist-impact-${this.id}`).querySelector('.factor-value').textContent=`${formatPercent(assistMult)} consumption`;}
+destroy(){const calculator=this.element.querySelector('.ebike-range-calculator');if(calculator)calculator.remove();}}
+EBikeToolkit.register('RangeCalculator',RangeCalculator);window.EBikeToolkitModules.RangeCalculator=RangeCalculator;window.GodspeedToolkit.RangeCalculator=class extends RangeCalculator{constructor(){const minimalToolkit={config:{},theme:null,log:console.log.bind(console)};super(minimalToolkit);}
+init(elementId){const element=document.getElementById(elementId);if(element)this.setupElement(element);}};})();
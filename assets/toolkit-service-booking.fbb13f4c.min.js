@@ -0,0 +1,300 @@
+(()=>{if(EBikeToolkit.registry&&EBikeToolkit.registry.ServiceBooking)return;class ServiceBooking extends BaseModule{constructor(toolkit){super(toolkit);this.services=new Map();}
+async init(){await super.init();this.log('Service Booking module initialized');}
+setupElement(element){const serviceId=element.dataset.serviceId||this.generateId();element.dataset.serviceId=serviceId;const serviceData=window.serviceBookingData||{};const serviceUtils=window.serviceBookingUtils||{};const service=new ServiceBookingInstance(serviceId,element,this,serviceData,serviceUtils);this.services.set(serviceId,service);service.render();}
+cleanupElement(element){const serviceId=element.dataset.serviceId;if(serviceId&&this.services.has(serviceId)){this.services.get(serviceId).destroy();this.services.delete(serviceId);}}
+generateId(){return`service_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;}}
+class ServiceBookingInstance{constructor(id,element,module,serviceData={},serviceUtils={}){this.id=id;this.element=element;this.module=module;this.serviceData=serviceData;this.serviceUtils=serviceUtils;this.currentStep=1;this.maxSteps=4;this.bookingData={service:null,location:null,datetime:null,customer:null,additionalServices:[]};this.servicePackages={basic:{name:'Basic Service',price:89,duration:60,description:'Essential maintenance check and tune-up',included:['Brake adjustment and lubrication','Gear shifting optimization','Tire pressure check','Chain cleaning and lubrication','General safety inspection']},standard:{name:'Standard Service',price:149,duration:90,description:'Comprehensive service with battery health check',included:['All Basic Service items','Battery health and capacity test','Motor performance diagnostics','Brake pad inspection','Wheel truing and spoke tension','Display and electronics check']},premium:{name:'Premium Service',price:219,duration:120,description:'Complete overhaul with parts replacement if needed',included:['All Standard Service items','Parts replacement (brake pads, cables)','Deep drivetrain cleaning','Suspension service (if applicable)','Software updates and calibration','Free pickup and delivery']},express:{name:'Express Repair',price:49,duration:30,description:'Quick fixes and emergency repairs',included:['Flat tire repair','Quick brake adjustment','Chain repair','Basic diagnostics','While-you-wait service']}};this.locations={zurich:{name:'Godspeed Zürich Zentrum',address:'Bahnhofstrasse 45, 8001 Zürich',phone:'+41 44 123 45 67',hours:'Mo-Fr: 9:00-18:00, Sa: 9:00-17:00',services:['basic','standard','premium','express']},bern:{name:'Godspeed Bern',address:'Kramgasse 82, 3011 Bern',phone:'+41 31 987 65 43',hours:'Mo-Fr: 8:30-18:30, Sa: 9:00-16:00',services:['basic','standard','premium']},basel:{name:'Godspeed Basel',address:'Steinenvorstadt 71, 4051 Basel',phone:'+41 61 456 78 90',hours:'Mo-Fr: 9:00-18:00, Sa: 10:00-17:00',services:['basic','standard','express']}};}
+render(){const placeholder=this.element.querySelector('.ebike-loading-placeholder');if(placeholder){placeholder.style.display='none';placeholder.style.visibility='hidden';placeholder.remove();}
+const serviceDiv=document.createElement('div');serviceDiv.className='ebike-service-tool';serviceDiv.innerHTML=this.buildServiceHTML();this.element.appendChild(serviceDiv);this.setupEventHandlers();}
+buildServiceHTML(){return`
+      <div class="service-booking-wrapper">
+        <div class="service-booking-header">
+          <h3>${this.element.dataset.title || 'E-Bike Service Booking'}</h3>
+          <div class="step-indicator">
+            ${Array.from({length: this.maxSteps}, (_, i) => `
+              <div class="step ${i + 1 <= this.currentStep ? 'active' : ''}" data-step="${i + 1}">
+                <span class="step-number">${i + 1}</span>
+                <span class="step-title">${this.getStepTitle(i + 1)}</span>
+              </div>
+            `).join('')}
+          </div>
+        </div>
+
+        <div class="service-booking-content">
+          ${this.renderCurrentStep()}
+        </div>
+
+        <div class="service-booking-navigation">
+          <button class="btn-secondary prev-btn" ${this.currentStep === 1 ? 'style="display:none"' : ''}>
+            ← Previous
+          </button>
+          <button class="btn-primary next-btn">
+            ${this.currentStep === this.maxSteps ? 'Book Service' : 'Next →'}
+          </button>
+        </div>
+      </div>
+    `;}
+getStepTitle(step){const titles={1:'Service Type',2:'Location & Date',3:'Customer Info',4:'Confirmation'};return titles[step]||'';}
+renderCurrentStep(){switch(this.currentStep){case 1:return this.renderServiceSelection();case 2:return this.renderLocationDateTime();case 3:return this.renderCustomerInfo();case 4:return this.renderConfirmation();default:return this.renderServiceSelection();}}
+renderServiceSelection(){return`
+      <div class="service-selection">
+        <h4>Choose Your Service Package</h4>
+        <div class="service-packages">
+          ${Object.entries(this.servicePackages).map(([key, pkg]) => `
+            <div class="service-package ${this.bookingData.service === key ? 'selected' : ''}" data-service="${key}">
+              <div class="package-header">
+                <h5>${pkg.name}</h5>
+                <div class="package-price">CHF ${pkg.price}</div>
+              </div>
+              <div class="package-description">${pkg.description}</div>
+              <div class="package-duration">
+                <i class="icon-clock"></i> ${pkg.duration} minutes
+              </div>
+              <ul class="package-included">
+                ${pkg.included.map(item => `<li>✓ ${item}</li>`).join('')}
+              </ul>
+            </div>
+          `).join('')}
+        </div>
+        
+        <div class="additional-services">
+          <h5>Additional Services</h5>
+          <div class="addon-services">
+            <label class="addon-item">
+              <input type="checkbox" value="pickup" data-price="25"> 
+              <span>Pickup & Delivery (+CHF 25)</span>
+            </label>
+            <label class="addon-item">
+              <input type="checkbox" value="loaner" data-price="15"> 
+              <span>Loaner E-Bike (+CHF 15/day)</span>
+            </label>
+            <label class="addon-item">
+              <input type="checkbox" value="wash" data-price="20"> 
+              <span>Professional Wash (+CHF 20)</span>
+            </label>
+          </div>
+        </div>
+      </div>
+    `;}
+renderLocationDateTime(){const selectedService=this.bookingData.service;const availableLocations=Object.entries(this.locations).filter(([key,loc])=>!selectedService||loc.services.includes(selectedService));const today=new Date();const dates=Array.from({length:14},(_,i)=>{const date=new Date(today);date.setDate(today.getDate()+i+1);return date;});return`
+      <div class="location-datetime">
+        <h4>Select Location & Appointment Time</h4>
+        
+        <div class="location-selection">
+          <h5>Service Location</h5>
+          <div class="location-cards">
+            ${availableLocations.map(([key, location]) => `
+              <div class="location-card ${this.bookingData.location === key ? 'selected' : ''}" data-location="${key}">
+                <h6>${location.name}</h6>
+                <p class="location-address">${location.address}</p>
+                <p class="location-hours">${location.hours}</p>
+                <p class="location-phone">📞 ${location.phone}</p>
+              </div>
+            `).join('')}
+          </div>
+        </div>
+
+        <div class="datetime-selection">
+          <div class="date-selection">
+            <h5>Select Date</h5>
+            <div class="date-picker">
+              ${dates.map(date => {
+                const isWeekend = date.getDay() === 0 || date.getDay() === 6;
+                const dateStr = date.toISOString().split('T')[0];
+                return `
+                  <button class="date-option ${isWeekend ? 'weekend' : ''}" data-date="${dateStr}">
+                    <div class="date-day">${date.toLocaleDateString('en', {weekday: 'short'})}</div>
+                    <div class="date-number">${date.getDate()}</div>
+                    <div class="date-month">${date.toLocaleDateString('en', {month: 'short'})}</div>
+                  </button>
+                `;
+              }).join('')}
+            </div>
+          </div>
+
+          <div class="time-selection">
+            <h5>Select Time</h5>
+            <div class="time-slots">
+              ${this.generateTimeSlots().map(time => `
+                <button class="time-slot" data-time="${time}">${time}</button>
+              `).join('')}
+            </div>
+          </div>
+        </div>
+      </div>
+    `;}
+renderCustomerInfo(){return`
+      <div class="customer-info">
+        <h4>Contact Information</h4>
+        
+        <form class="customer-form">
+          <div class="form-row">
+            <div class="form-group">
+              <label for="firstName-${this.id}">First Name *</label>
+              <input type="text" id="firstName-${this.id}" name="firstName" required 
+                     value="${this.bookingData.customer?.firstName || ''}" />
+            </div>
+            <div class="form-group">
+              <label for="lastName-${this.id}">Last Name *</label>
+              <input type="text" id="lastName-${this.id}" name="lastName" required
+                     value="${this.bookingData.customer?.lastName || ''}" />
+            </div>
+          </div>
+
+          <div class="form-row">
+            <div class="form-group">
+              <label for="email-${this.id}">Email Address *</label>
+              <input type="email" id="email-${this.id}" name="email" required
+                     value="${this.bookingData.customer?.email || ''}" />
+            </div>
+            <div class="form-group">
+              <label for="phone-${this.id}">Phone Number *</label>
+              <input type="tel" id="phone-${this.id}" name="phone" required
+                     value="${this.bookingData.customer?.phone || ''}" />
+            </div>
+          </div>
+
+          <div class="form-group">
+            <label for="bikeModel-${this.id}">E-Bike Model & Brand</label>
+            <input type="text" id="bikeModel-${this.id}" name="bikeModel" 
+                   placeholder="e.g. Trek Powerfly 5, Specialized Turbo Vado"
+                   value="${this.bookingData.customer?.bikeModel || ''}" />
+          </div>
+
+          <div class="form-group">
+            <label for="purchaseDate-${this.id}">Purchase Date (approximate)</label>
+            <input type="month" id="purchaseDate-${this.id}" name="purchaseDate"
+                   value="${this.bookingData.customer?.purchaseDate || ''}" />
+          </div>
+
+          <div class="form-group">
+            <label for="issues-${this.id}">Describe any issues or special requests</label>
+            <textarea id="issues-${this.id}" name="issues" rows="4" 
+                      placeholder="e.g. Strange noise from motor, battery not holding charge...">${this.bookingData.customer?.issues || ''}</textarea>
+          </div>
+
+          <div class="form-group">
+            <label class="checkbox-label">
+              <input type="checkbox" name="newsletter" 
+                     ${this.bookingData.customer?.newsletter ? 'checked' : ''} />
+              <span>Subscribe to Godspeed newsletter for service reminders</span>
+            </label>
+          </div>
+        </form>
+      </div>
+    `;}
+renderConfirmation(){const service=this.servicePackages[this.bookingData.service];const location=this.locations[this.bookingData.location];const totalPrice=this.calculateTotalPrice();return`
+      <div class="confirmation">
+        <h4>Booking Confirmation</h4>
+        
+        <div class="booking-summary">
+          <div class="summary-section">
+            <h5>Service Details</h5>
+            <div class="service-summary">
+              <div class="service-name">${service.name}</div>
+              <div class="service-price">CHF ${service.price}</div>
+              <div class="service-duration">${service.duration} minutes</div>
+            </div>
+            ${this.bookingData.additionalServices.length > 0 ? `
+              <div class="addon-summary">
+                <h6>Additional Services:</h6>
+                ${this.bookingData.additionalServices.map(addon => `
+                  <div class="addon-item">${addon.name} +CHF ${addon.price}</div>
+                `).join('')}
+              </div>
+            ` : ''}
+          </div>
+
+          <div class="summary-section">
+            <h5>Appointment Details</h5>
+            <div class="appointment-details">
+              <div class="appointment-location">
+                <strong>${location.name}</strong><br>
+                ${location.address}<br>
+                📞 ${location.phone}
+              </div>
+              <div class="appointment-datetime">
+                <strong>${this.formatDate(this.bookingData.datetime.date)}</strong><br>
+                ${this.bookingData.datetime.time}
+              </div>
+            </div>
+          </div>
+
+          <div class="summary-section">
+            <h5>Contact Information</h5>
+            <div class="customer-summary">
+              <div>${this.bookingData.customer.firstName} ${this.bookingData.customer.lastName}</div>
+              <div>${this.bookingData.customer.email}</div>
+              <div>${this.bookingData.customer.phone}</div>
+              ${this.bookingData.customer.bikeModel ? `<div>Bike: ${this.bookingData.customer.bikeModel}</div>` : ''}
+            </div>
+          </div>
+
+          <div class="total-price">
+            <h5>Total Price: CHF ${totalPrice}</h5>
+          </div>
+        </div>
+
+        <div class="terms-acceptance">
+          <label class="checkbox-label">
+            <input type="checkbox" id="acceptTerms-${this.id}" required />
+            <span>I accept the <a href="/pages/service-terms" target="_blank">service terms and conditions</a></span>
+          </label>
+        </div>
+
+        <div class="confirmation-notice">
+          <p>✅ We'll send a confirmation email with all details</p>
+          <p>📅 Add to calendar link will be included</p>
+          <p>🔔 SMS reminder 24h before appointment</p>
+        </div>
+      </div>
+    `;}
+generateTimeSlots(){const slots=[];for(let hour=9;hour<17;hour++){for(let minute=0;minute<60;minute+=30){const time=`${hour.toString().padStart(2, '0')}:${minute.toString().padStart(2, '0')}`;slots.push(time);}}
+return slots;}
+calculateTotalPrice(){let total=0;if(this.bookingData.service){total+=this.servicePackages[this.bookingData.service].price;}
+total+=this.bookingData.additionalServices.reduce((sum,addon)=>sum+addon.price,0);return total;}
+formatDate(dateString){const date=new Date(dateString);return date.toLocaleDateString('en-US',{weekday:'long',year:'numeric',month:'long',day:'numeric'});}
+setupEventHandlers(){const container=this.element.querySelector('.ebike-service-tool');const nextBtn=container.querySelector('.next-btn');const prevBtn=container.querySelector('.prev-btn');if(nextBtn){nextBtn.addEventListener('click',()=>this.nextStep());}
+if(prevBtn){prevBtn.addEventListener('click',()=>this.previousStep());}
+this.setupCurrentStepHandlers();}
+setupCurrentStepHandlers(){const container=this.element.querySelector('.ebike-service-tool');switch(this.currentStep){case 1:container.querySelectorAll('.service-package').forEach(pkg=>{pkg.addEventListener('click',()=>{container.querySelectorAll('.service-package').forEach(p=>p.classList.remove('selected'));pkg.classList.add('selected');this.bookingData.service=pkg.dataset.service;});});container.querySelectorAll('.addon-item input').forEach(checkbox=>{checkbox.addEventListener('change',(e)=>{const addon={name:e.target.nextElementSibling.textContent,price:parseInt(e.target.dataset.price),value:e.target.value};if(e.target.checked){this.bookingData.additionalServices.push(addon);}else{this.bookingData.additionalServices=this.bookingData.additionalServices.filter(a=>a.value!==e.target.value);}});});break;case 2:container.querySelectorAll('.location-card').forEach(card=>{card.addEventListener('click',()=>{container.querySelectorAll('.location-card').forEach(c=>c.classList.remove('selected'));card.classList.add('selected');this.bookingData.location=card.dataset.location;});});container.querySelectorAll('.date-option').forEach(dateBtn=>{dateBtn.addEventListener('click',()=>{container.querySelectorAll('.date-option').forEach(d=>d.classList.remove('selected'));dateBtn.classList.add('selected');if(!this.bookingData.datetime)this.bookingData.datetime={};this.bookingData.datetime.date=dateBtn.dataset.date;});});container.querySelectorAll('.time-slot').forEach(timeBtn=>{timeBtn.addEventListener('click',()=>{container.querySelectorAll('.time-slot').forEach(t=>t.classList.remove('selected'));timeBtn.classList.add('selected');if(!this.bookingData.datetime)this.bookingData.datetime={};this.bookingData.datetime.time=timeBtn.dataset.time;});});break;case 3:container.querySelectorAll('.customer-form input, .customer-form textarea').forEach(input=>{input.addEventListener('input',(e)=>{if(!this.bookingData.customer)this.bookingData.customer={};this.bookingData.customer[e.target.name]=e.target.value;});input.addEventListener('change',(e)=>{if(e.target.type==='checkbox'){if(!this.bookingData.customer)this.bookingData.customer={};this.bookingData.customer[e.target.name]=e.target.checked;}});});break;case 4:const termsCheckbox=container.querySelector(`#acceptTerms-${this.id}`);if(termsCheckbox){termsCheckbox.addEventListener('change',(e)=>{const nextBtn=container.querySelector('.next-btn');nextBtn.disabled=!e.target.checked;});}
+break;}}
+nextStep(){if(!this.validateCurrentStep()){return;}
+if(this.currentStep===this.maxSteps){this.submitBooking();return;}
+this.currentStep++;this.updateDisplay();}
+previousStep(){if(this.currentStep>1){this.currentStep--;this.updateDisplay();}}
+updateDisplay(){const container=this.element.querySelector('.ebike-service-tool');container.querySelectorAll('.step').forEach((step,index)=>{if(index+1<=this.currentStep){step.classList.add('active');}else{step.classList.remove('active');}});const content=container.querySelector('.service-booking-content');content.innerHTML=this.renderCurrentStep();const prevBtn=container.querySelector('.prev-btn');const nextBtn=container.querySelector('.next-btn');prevBtn.style.display=this.currentStep===1?'none':'inline-block';nextBtn.textContent=this.currentStep===this.maxSteps?'Book Service':'Next →';this.setupCurrentStepHandlers();}
+validateCurrentStep(){switch(this.currentStep){case 1:if(!this.bookingData.service){showError('Please select a service package.');return false;}
+break;case 2:if(!this.bookingData.location||!this.bookingData.datetime?.date||!this.bookingData.datetime?.time){showError('Please select a location, date, and time.');return false;}
+break;case 3:const required=['firstName','lastName','email','phone'];for(const field of required){if(!this.bookingData.customer?.[field]){showError(`Please fill in ${field.replace(/([A-Z])/g, ' $1').toLowerCase()}.`);return false;}}
+break;case 4:const termsAccepted=document.querySelector(`#acceptTerms-${this.id}`)?.checked;if(!termsAccepted){showError('Please accept the terms and conditions.');return false;}
+break;}
+return true;}
+async submitBooking(){try{const container=this.element.querySelector('.ebike-service-tool');const nextBtn=container.querySelector('.next-btn');nextBtn.textContent='Booking...';nextBtn.disabled=true;await new Promise(resolve=>setTimeout(resolve,2000));const bookingId='SRV-'+Date.now().toString().slice(-6);container.innerHTML=`
+        <div class="booking-success">
+          <div class="success-icon">✅</div>
+          <h3>Service Booking Confirmed!</h3>
+          <div class="booking-reference">
+            <strong>Booking Reference: ${bookingId}</strong>
+          </div>
+          <div class="success-details">
+            <p>📧 Confirmation email sent to ${this.bookingData.customer.email}</p>
+            <p>📱 SMS reminder will be sent 24 hours before your appointment</p>
+            <p>📅 <a href="#" onclick="showInfo('Add to calendar feature')">Add to Calendar</a></p>
+          </div>
+          <div class="next-steps">
+            <h4>What's Next?</h4>
+            <ul>
+              <li>Bring your e-bike to ${this.locations[this.bookingData.location].name}</li>
+              <li>Arrive 10 minutes early for check-in</li>
+              <li>Bring proof of purchase if under warranty</li>
+            </ul>
+          </div>
+          <div class="success-actions">
+            <a href="/pages/contact" class="btn-secondary">Contact Us</a>
+            <a href="/collections/service-parts" class="btn-primary">Shop Service Parts</a>
+          </div>
+        </div>
+      `;}catch(error){showError('Booking failed. Please try again or contact us directly.');console.error('Booking error:',error);}}
+destroy(){const service=this.element.querySelector('.ebike-service-tool');if(service)service.remove();}}
+EBikeToolkit.register('ServiceBooking',ServiceBooking);window.EBikeToolkitModules.ServiceBooking=ServiceBooking;})();
@@ -0,0 +1,66 @@
+(()=>{if(EBikeToolkit.registry&&EBikeToolkit.registry.SizeCalculator)return;class SizeCalculator extends BaseModule{constructor(toolkit){super(toolkit);this.calculators=new Map();this.sizeCharts=this.getDefaultSizeCharts();}
+async init(){await super.init();this.log('Size Calculator module initialized');}
+setupElement(element){const calculatorId=element.dataset.calculatorId||this.generateId();element.dataset.calculatorId=calculatorId;const calculator=new SizeCalculatorInstance(calculatorId,element,this);this.calculators.set(calculatorId,calculator);calculator.render();}
+cleanupElement(element){const calculatorId=element.dataset.calculatorId;if(calculatorId&&this.calculators.has(calculatorId)){this.calculators.get(calculatorId).destroy();this.calculators.delete(calculatorId);}}
+generateId(){return`calculator_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;}
+getDefaultSizeCharts(){return{city:{150:'XS (44-46 cm)',160:'XS (44-46 cm)',170:'S (48-50 cm)',180:'M (52-54 cm)',190:'L (56-58 cm)',200:'XL (60-62 cm)'},mountain:{150:'XS (38-40 cm)',160:'XS (38-40 cm)',170:'S (42-44 cm)',180:'M (46-48 cm)',190:'L (50-52 cm)',200:'XL (54-56 cm)'},cargo:{150:'S (46-48 cm)',165:'S (46-48 cm)',180:'M (50-52 cm)',200:'L (54-56 cm)'}};}}
+class SizeCalculatorInstance{constructor(id,element,module){this.id=id;this.element=element;this.module=module;}
+render(){const template=`
+      <div class="ebike-size-calculator" data-theme="${this.module.theme}">
+        <div class="calculator-header">
+          <h3>${this.element.dataset.title || 'Find Your Perfect Size'}</h3>
+          <p>${this.element.dataset.subtitle || 'Enter your measurements for personalized recommendations'}</p>
+        </div>
+        
+        <form class="calculator-form">
+          <div class="form-row">
+            <div class="form-field">
+              <label for="height-${this.id}">Height (cm)</label>
+              <input type="number" id="height-${this.id}" min="120" max="230" placeholder="170" 
+                     class="${this.module.config.selectors.input || 'form-input'}">
+            </div>
+            <div class="form-field">
+              <label for="inseam-${this.id}">Inseam (cm)</label>
+              <input type="number" id="inseam-${this.id}" min="50" max="120" placeholder="80"
+                     class="${this.module.config.selectors.input || 'form-input'}">
+            </div>
+          </div>
+          
+          <div class="form-row">
+            <div class="form-field">
+              <label for="bike-type-${this.id}">Bike Type</label>
+              <select id="bike-type-${this.id}" class="${this.module.config.selectors.select || 'form-select'}">
+                <option value="city">City & Trekking</option>
+                <option value="mountain">Mountain</option>
+                <option value="cargo">Cargo</option>
+              </select>
+            </div>
+            <div class="form-field">
+              <button type="submit" class="${this.module.config.classes?.buttonPrimary || 'btn btn-primary'}">
+                Calculate Size
+              </button>
+            </div>
+          </div>
+        </form>
+        
+        <div class="calculator-result" style="display: none;">
+          <div class="result-content">
+            <h4>Recommended Size</h4>
+            <div class="size-result"></div>
+            <div class="size-advice"></div>
+          </div>
+        </div>
+      </div>
+    `;this.element.innerHTML=template;this.bindEvents();}
+bindEvents(){const form=this.element.querySelector('.calculator-form');form.addEventListener('submit',(e)=>{e.preventDefault();this.calculateSize();});}
+calculateSize(){const height=parseInt(this.element.querySelector(`#height-${this.id}`).value);const inseam=parseInt(this.element.querySelector(`#inseam-${this.id}`).value);const bikeType=this.element.querySelector(`#bike-type-${this.id}`).value;if(!height||!inseam){showError('Please enter both height and inseam measurements.');return;}
+if(height<120||height>230){showError('Please enter a height between 120 and 230 cm.');return;}
+const size=this.calculateFrameSize(height,bikeType);const advice=this.generateAdvice(height,inseam,bikeType);this.displayResult(size,advice);}
+calculateFrameSize(height,bikeType){const chart=this.module.sizeCharts[bikeType]||this.module.sizeCharts.city;for(let minHeight in chart){if(height<=parseInt(minHeight)){return chart[minHeight];}}
+const maxHeight=Math.max(...Object.keys(chart).map(h=>parseInt(h)));return chart[maxHeight];}
+generateAdvice(height,inseam,bikeType){const ratio=inseam/height;let advice='This recommendation is a guideline. ';if(ratio<0.43){advice+='You have relatively short legs — consider a smaller frame for comfort. ';}else if(ratio>0.47){advice+='You have relatively long legs — a larger frame may be suitable. ';}
+advice+='For the best fit, we recommend a test ride and professional consultation.';return advice;}
+displayResult(size,advice){const resultDiv=this.element.querySelector('.calculator-result');const sizeDiv=this.element.querySelector('.size-result');const adviceDiv=this.element.querySelector('.size-advice');sizeDiv.innerHTML=`<strong>${size}</strong>`;adviceDiv.textContent=advice;resultDiv.style.display='block';resultDiv.scrollIntoView({behavior:'smooth',block:'nearest'});}
+destroy(){this.element.innerHTML='';}}
+EBikeToolkit.register('SizeCalculator',SizeCalculator);window.EBikeToolkitModules.SizeCalculator=SizeCalculator;window.GodspeedToolkit.SizeCalculator=class extends SizeCalculator{constructor(){const minimalToolkit={config:{},theme:null,log:console.log.bind(console)};super(minimalToolkit);}
+init(elementId){const element=document.getElementById(elementId);if(element)this.setupElement(element);}};})();
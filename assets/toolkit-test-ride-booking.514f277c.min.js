@@ -0,0 +1,251 @@
+(()=>{if(EBikeToolkit.registry&&EBikeToolkit.registry.TestRideBooking)return;class TestRideBooking extends BaseModule{constructor(toolkit){super(toolkit);this.bookings=new Map();}
+async init(){await super.init();this.log('Test Ride Booking module initialized');}
+setupElement(element){const bookingId=element.dataset.bookingId||this.generateId();element.dataset.bookingId=bookingId;const bookingData=window.testRideBookingData||{};const bookingUtils=window.testRideBookingUtils||{};const booking=new TestRideBookingInstance(bookingId,element,this,bookingData,bookingUtils);this.bookings.set(bookingId,booking);booking.render();}
+cleanupElement(element){const bookingId=element.dataset.bookingId;if(bookingId&&this.bookings.has(bookingId)){this.bookings.get(bookingId).destroy();this.bookings.delete(bookingId);}}
+generateId(){return`test_ride_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;}}
+class TestRideBookingInstance{constructor(id,element,module,bookingData={},bookingUtils={}){this.id=id;this.element=element;this.module=module;this.bookingData=bookingData;this.bookingUtils=bookingUtils;this.currentStep=1;this.maxSteps=4;this.formData={};this.availableSlots=[];}
+render(){const placeholder=this.element.querySelector('.ebike-loading-placeholder');if(placeholder){placeholder.style.display='none';placeholder.style.visibility='hidden';placeholder.remove();}
+const bookingDiv=document.createElement('div');bookingDiv.className='ebike-booking-tool';bookingDiv.innerHTML=this.buildBookingHTML();this.element.appendChild(bookingDiv);this.bindEvents();this.updateStepIndicator();}
+buildBookingHTML(){return`
+      <div class="booking-content">
+        <div class="booking-header">
+          <h3>${this.element.dataset.title || 'Book a Test Ride'}</h3>
+          <p>${this.element.dataset.subtitle || 'Try before you buy at one of our locations'}</p>
+        </div>
+        
+        <div class="step-indicator">
+          <div class="step" data-step="1">
+            <span class="step-number">1</span>
+            <span class="step-label">Location</span>
+          </div>
+          <div class="step" data-step="2">
+            <span class="step-number">2</span>
+            <span class="step-label">Date & Time</span>
+          </div>
+          <div class="step" data-step="3">
+            <span class="step-number">3</span>
+            <span class="step-label">Details</span>
+          </div>
+          <div class="step" data-step="4">
+            <span class="step-number">4</span>
+            <span class="step-label">Confirm</span>
+          </div>
+        </div>
+        
+        <form class="booking-form">
+          ${this.buildStepContent()}
+        </form>
+        
+        <div class="booking-navigation">
+          <button type="button" class="btn-secondary prev-step" style="display: none;">Previous</button>
+          <button type="button" class="btn-primary next-step">Next Step</button>
+          <button type="button" class="btn-primary submit-booking" style="display: none;">Book Test Ride</button>
+        </div>
+        
+        <div class="booking-result" style="display: none;">
+          <div class="success-message">
+            <h4>🎉 Test Ride Booked Successfully!</h4>
+            <p>We've sent confirmation details to your email address.</p>
+            <div class="booking-summary"></div>
+          </div>
+        </div>
+      </div>
+    `;}
+buildStepContent(){switch(this.currentStep){case 1:return this.buildLocationStep();case 2:return this.buildDateTimeStep();case 3:return this.buildDetailsStep();case 4:return this.buildConfirmationStep();default:return'';}}
+buildLocationStep(){const locations=window.testRideBookingData?.locations||{zurich:{name:'Zürich',address:'Bahnhofstrasse 1, 8001 Zürich'},basel:{name:'Basel',address:'Freie Strasse 25, 4001 Basel'},bern:{name:'Bern',address:'Spitalgasse 4, 3011 Bern'}};return`
+      <div class="step-content" data-step-content="1">
+        <h4>Choose Your Location</h4>
+        <p>Select the store where you'd like to test ride our e-bikes.</p>
+        
+        <div class="location-grid">
+          ${Object.entries(locations).map(([key, location]) => `
+            <div class="location-card" data-location="${key}">
+              <div class="location-header">
+                <h5>${location.name}</h5>
+                <div class="location-address">${location.address}</div>
+              </div>
+              <div class="location-info">
+                <div class="location-hours">
+                  <strong>Hours:</strong><br>
+                  Mon-Fri: 9:00-18:00<br>
+                  Sat: 9:00-17:00<br>
+                  Sun: Closed
+                </div>
+                <div class="location-phone">
+                  <strong>Phone:</strong><br>
+                  ${location.phone || '+41 XX XXX XX XX'}
+                </div>
+              </div>
+              <div class="location-bikes">
+                <strong>Available Bikes:</strong><br>
+                City, Trekking, Mountain, Cargo
+              </div>
+            </div>
+          `).join('')}
+        </div>
+      </div>
+    `;}
+buildDateTimeStep(){return`
+      <div class="step-content" data-step-content="2">
+        <h4>Select Date & Time</h4>
+        <p>Choose when you'd like to visit ${this.formData.locationName || 'our store'}.</p>
+        
+        <div class="datetime-selection">
+          <div class="date-picker-wrapper">
+            <label for="booking-date-${this.id}">Preferred Date</label>
+            <input type="date" id="booking-date-${this.id}" class="booking-date" 
+                   min="${this.getTomorrowDate()}" 
+                   max="${this.getMaxDate()}">
+          </div>
+          
+          <div class="time-slots" id="time-slots-${this.id}">
+            <label>Available Time Slots</label>
+            <div class="slots-grid">
+              <div class="loading-slots">Please select a date first</div>
+            </div>
+          </div>
+        </div>
+      </div>
+    `;}
+buildDetailsStep(){return`
+      <div class="step-content" data-step-content="3">
+        <h4>Your Details</h4>
+        <p>Tell us about yourself and your bike preferences.</p>
+        
+        <div class="form-grid">
+          <div class="form-group">
+            <label for="customer-name-${this.id}">Full Name *</label>
+            <input type="text" id="customer-name-${this.id}" class="customer-name" required>
+          </div>
+          
+          <div class="form-group">
+            <label for="customer-email-${this.id}">Email Address *</label>
+            <input type="email" id="customer-email-${this.id}" class="customer-email" required>
+          </div>
+          
+          <div class="form-group">
+            <label for="customer-phone-${this.id}">Phone Number *</label>
+            <input type="tel" id="customer-phone-${this.id}" class="customer-phone" required>
+          </div>
+          
+          <div class="form-group">
+            <label for="bike-preference-${this.id}">Preferred Bike Type</label>
+            <select id="bike-preference-${this.id}" class="bike-preference">
+              <option value="">No preference</option>
+              <option value="city">City Bike</option>
+              <option value="trekking">Trekking Bike</option>
+              <option value="mountain">Mountain Bike</option>
+              <option value="cargo">Cargo Bike</option>
+            </select>
+          </div>
+          
+          <div class="form-group">
+            <label for="experience-level-${this.id}">E-Bike Experience</label>
+            <select id="experience-level-${this.id}" class="experience-level">
+              <option value="beginner">First time rider</option>
+              <option value="some">Some experience</option>
+              <option value="experienced">Very experienced</option>
+            </select>
+          </div>
+          
+          <div class="form-group full-width">
+            <label for="special-requests-${this.id}">Special Requests or Questions</label>
+            <textarea id="special-requests-${this.id}" class="special-requests" rows="3" 
+                      placeholder="Any specific bikes you'd like to try, or questions you have..."></textarea>
+          </div>
+        </div>
+      </div>
+    `;}
+buildConfirmationStep(){return`
+      <div class="step-content" data-step-content="4">
+        <h4>Confirm Your Booking</h4>
+        <p>Please review your test ride details.</p>
+        
+        <div class="booking-summary-preview">
+          <div class="summary-section">
+            <h5>📍 Location</h5>
+            <div class="summary-value">
+              <strong>${this.formData.locationName}</strong><br>
+              ${this.formData.locationAddress}
+            </div>
+          </div>
+          
+          <div class="summary-section">
+            <h5>📅 Date & Time</h5>
+            <div class="summary-value">
+              <strong>${this.formatDate(this.formData.selectedDate)}</strong><br>
+              ${this.formData.selectedTime}
+            </div>
+          </div>
+          
+          <div class="summary-section">
+            <h5>👤 Contact</h5>
+            <div class="summary-value">
+              <strong>${this.formData.customerName}</strong><br>
+              ${this.formData.customerEmail}<br>
+              ${this.formData.customerPhone}
+            </div>
+          </div>
+          
+          <div class="summary-section">
+            <h5>🚴 Preferences</h5>
+            <div class="summary-value">
+              Bike Type: ${this.formData.bikePreference || 'No preference'}<br>
+              Experience: ${this.formData.experienceLevel || 'Not specified'}
+            </div>
+          </div>
+          
+          ${this.formData.specialRequests ? `
+            <div class="summary-section">
+              <h5>💬 Special Requests</h5>
+              <div class="summary-value">${this.formData.specialRequests}</div>
+            </div>
+          ` : ''}
+        </div>
+        
+        <div class="important-notes">
+          <h5>Important Notes:</h5>
+          <ul>
+            <li>Please bring a valid ID for the test ride</li>
+            <li>Wear comfortable clothes and closed-toe shoes</li>
+            <li>Test rides typically last 30-45 minutes</li>
+            <li>Our staff will provide safety instructions and helmet</li>
+            <li>You can cancel or reschedule up to 24 hours before</li>
+          </ul>
+        </div>
+      </div>
+    `;}
+bindEvents(){const prevBtn=this.element.querySelector('.prev-step');const nextBtn=this.element.querySelector('.next-step');const submitBtn=this.element.querySelector('.submit-booking');prevBtn.addEventListener('click',()=>this.previousStep());nextBtn.addEventListener('click',()=>this.nextStep());submitBtn.addEventListener('click',()=>this.submitBooking());this.element.addEventListener('click',(e)=>{if(e.target.closest('.location-card')){this.selectLocation(e.target.closest('.location-card'));}});this.element.addEventListener('change',(e)=>{if(e.target.classList.contains('booking-date')){this.loadTimeSlots(e.target.value);}});this.element.addEventListener('click',(e)=>{if(e.target.classList.contains('time-slot')){this.selectTimeSlot(e.target);}});}
+selectLocation(locationCard){this.element.querySelectorAll('.location-card').forEach(card=>{card.classList.remove('selected');});locationCard.classList.add('selected');const locationKey=locationCard.dataset.location;const locations=window.testRideBookingData?.locations||{};const location=locations[locationKey];this.formData.selectedLocation=locationKey;this.formData.locationName=location?.name||locationKey;this.formData.locationAddress=location?.address||'';this.element.querySelector('.next-step').disabled=false;}
+loadTimeSlots(date){const slotsContainer=this.element.querySelector(`#time-slots-${this.id} .slots-grid`);slotsContainer.innerHTML='<div class="loading-slots">Loading available times...</div>';setTimeout(()=>{const slots=this.generateAvailableSlots(date);slotsContainer.innerHTML=slots.length>0?slots.map(slot=>`
+          <button type="button" class="time-slot" data-time="${slot}">
+            ${slot}
+          </button>
+        `).join(''):'<div class="no-slots">No available slots for this date. Please choose another date.</div>';},500);}
+generateAvailableSlots(date){const dayOfWeek=new Date(date).getDay();const isWeekend=dayOfWeek===0||dayOfWeek===6;const slots=isWeekend?['09:00','10:00','11:00','13:00','14:00','15:00','16:00']:['09:00','10:00','11:00','13:00','14:00','15:00','16:00','17:00'];return slots.filter(()=>Math.random()>0.3);}
+selectTimeSlot(slotButton){this.element.querySelectorAll('.time-slot').forEach(slot=>{slot.classList.remove('selected');});slotButton.classList.add('selected');this.formData.selectedTime=slotButton.dataset.time;this.formData.selectedDate=this.element.querySelector('.booking-date').value;}
+nextStep(){if(this.validateCurrentStep()){if(this.currentStep<this.maxSteps){this.currentStep++;this.updateStepContent();this.updateStepIndicator();this.updateNavigation();}}}
+previousStep(){if(this.currentStep>1){this.currentStep--;this.updateStepContent();this.updateStepIndicator();this.updateNavigation();}}
+updateStepContent(){const formContainer=this.element.querySelector('.booking-form');formContainer.innerHTML=this.buildStepContent();this.bindStepEvents();}
+bindStepEvents(){if(this.currentStep===2){const dateInput=this.element.querySelector('.booking-date');dateInput.addEventListener('change',(e)=>{this.loadTimeSlots(e.target.value);});}}
+updateStepIndicator(){this.element.querySelectorAll('.step').forEach((step,index)=>{const stepNum=index+1;if(stepNum<this.currentStep){step.classList.add('completed');step.classList.remove('active');}else if(stepNum===this.currentStep){step.classList.add('active');step.classList.remove('completed');}else{step.classList.remove('active','completed');}});}
+updateNavigation(){const prevBtn=this.element.querySelector('.prev-step');const nextBtn=this.element.querySelector('.next-step');const submitBtn=this.element.querySelector('.submit-booking');prevBtn.style.display=this.currentStep>1?'inline-block':'none';nextBtn.style.display=this.currentStep<this.maxSteps?'inline-block':'none';submitBtn.style.display=this.currentStep===this.maxSteps?'inline-block':'none';}
+validateCurrentStep(){switch(this.currentStep){case 1:return this.formData.selectedLocation;case 2:return this.formData.selectedDate&&this.formData.selectedTime;case 3:return this.validateCustomerDetails();case 4:return true;default:return false;}}
+validateCustomerDetails(){const name=this.element.querySelector('.customer-name').value.trim();const email=this.element.querySelector('.customer-email').value.trim();const phone=this.element.querySelector('.customer-phone').value.trim();if(!name||!email||!phone){showError('Please fill in all required fields.');return false;}
+if(!this.validateEmail(email)){showError('Please enter a valid email address.');return false;}
+this.formData.customerName=name;this.formData.customerEmail=email;this.formData.customerPhone=phone;this.formData.bikePreference=this.element.querySelector('.bike-preference').value;this.formData.experienceLevel=this.element.querySelector('.experience-level').value;this.formData.specialRequests=this.element.querySelector('.special-requests').value.trim();return true;}
+validateEmail(email){return/^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(email);}
+async submitBooking(){const submitBtn=this.element.querySelector('.submit-booking');submitBtn.disabled=true;submitBtn.textContent='Booking...';try{await new Promise(resolve=>setTimeout(resolve,2000));this.showBookingSuccess();}catch(error){showError('There was an error processing your booking. Please try again.');submitBtn.disabled=false;submitBtn.textContent='Book Test Ride';}}
+showBookingSuccess(){const formContainer=this.element.querySelector('.booking-form');const navigation=this.element.querySelector('.booking-navigation');const stepIndicator=this.element.querySelector('.step-indicator');const result=this.element.querySelector('.booking-result');formContainer.style.display='none';navigation.style.display='none';stepIndicator.style.display='none';const summary=result.querySelector('.booking-summary');summary.innerHTML=`
+      <div class="confirmation-details">
+        <p><strong>Booking Reference:</strong> TR${Date.now().toString().slice(-6)}</p>
+        <p><strong>Location:</strong> ${this.formData.locationName}</p>
+        <p><strong>Date:</strong> ${this.formatDate(this.formData.selectedDate)} at ${this.formData.selectedTime}</p>
+        <p><strong>Contact:</strong> ${this.formData.customerName}</p>
+      </div>
+    `;result.style.display='block';}
+formatDate(dateString){return new Date(dateString).toLocaleDateString('en-US',{weekday:'long',year:'numeric',month:'long',day:'numeric'});}
+getTomorrowDate(){const tomorrow=new Date();tomorrow.setDate(tomorrow.getDate()+1);return tomorrow.toISOString().split('T')[0];}
+getMaxDate(){const maxDate=new Date();maxDate.setDate(maxDate.getDate()+30);return maxDate.toISOString().split('T')[0];}
+destroy(){const booking=this.element.querySelector('.ebike-booking-tool');if(booking)booking.remove();}}
+EBikeToolkit.register('TestRideBooking',TestRideBooking);window.EBikeToolkitModules.TestRideBooking=TestRideBooking;})();
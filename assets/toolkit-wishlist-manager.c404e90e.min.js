@@ -0,0 +1,34 @@
+(()=>{if(EBikeToolkit.registry&&EBikeToolkit.registry.WishlistManager)return;class WishlistManager extends BaseModule{constructor(toolkit){super(toolkit);this.wishlists=new Map();this.wishlistItems=JSON.parse(localStorage.getItem('ebike-wishlist')||'[]');}
+async init(){await super.init();this.log('Wishlist Manager module initialized');}
+setupElement(element){const wishlistId=element.dataset.wishlistId||this.generateId();element.dataset.wishlistId=wishlistId;const wishlist=new WishlistInstance(wishlistId,element,this);this.wishlists.set(wishlistId,wishlist);wishlist.render();}
+cleanupElement(element){const wishlistId=element.dataset.wishlistId;if(wishlistId&&this.wishlists.has(wishlistId)){this.wishlists.get(wishlistId).destroy();this.wishlists.delete(wishlistId);}}
+generateId(){return`wishlist_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;}
+addToWishlist(productId,productData){if(!this.wishlistItems.find(item=>item.id===productId)){this.wishlistItems.push({id:productId,...productData,addedAt:new Date()});this.saveWishlist();this.notifyWishlistChange();}}
+removeFromWishlist(productId){this.wishlistItems=this.wishlistItems.filter(item=>item.id!==productId);this.saveWishlist();this.notifyWishlistChange();}
+saveWishlist(){localStorage.setItem('ebike-wishlist',JSON.stringify(this.wishlistItems));}
+notifyWishlistChange(){document.dispatchEvent(new CustomEvent('ebike-wishlist:changed',{detail:{items:this.wishlistItems,count:this.wishlistItems.length}}));}}
+class WishlistInstance{constructor(id,element,module){this.id=id;this.element=element;this.module=module;}
+render(){this.element.innerHTML=`
+      <div class="ebike-wishlist-manager" data-theme="${this.module.theme}">
+        <div class="wishlist-header">
+          <h3>Your Wishlist</h3>
+          <span class="wishlist-count">${this.module.wishlistItems.length} items</span>
+        </div>
+        <div class="wishlist-items">
+          ${this.renderWishlistItems()}
+        </div>
+      </div>
+    `;}
+renderWishlistItems(){if(this.module.wishlistItems.length===0){return'<p class="empty-wishlist">Your wishlist is empty</p>';}
+return this.module.wishlistItems.map(item=>`
+      <div class="wishlist-item" data-product-id="${item.id}">
+        <div class="item-info">
+          <h4>${item.name}</h4>
+          <p class="item-price">${item.price}</p>
+        </div>
+        <button class="remove-item" data-product-id="${item.id}">Remove</button>
+      </div>
+    `).join('');}
+destroy(){this.element.innerHTML='';}}
+EBikeToolkit.register('WishlistManager',WishlistManager);window.EBikeToolkitModules.WishlistManager=WishlistManager;window.GodspeedToolkit.WishlistManager=class extends WishlistManager{constructor(){const minimalToolkit={config:{},theme:null,log:console.log.bind(console)};super(minimalToolkit);}
+init(elementId){const element=document.getElementById(elementId);if(element){this.setupElement(element);}}};})();
@@ -0,0 +1,288 @@
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Windows: peak RSS is reported as unavailable
+    resource = None
+
+from catalog_pipeline import DEFAULT_STAGES, run_pipeline
+from clean_categories import standardize_category
+from map_to_taxonomy_simple import map_taxonomy
+from normalize_categories import normalize_category
+from taxonomy_index import TaxonomyIndex, score, tokenize
+from translate_categories import translate_category
+
+SEED_SRC = "products_export_1.csv"
+RESULTS = "bench_results.json"
+BASELINE = "bench_baseline.json"
+DEFAULT_SIZES = [10_000]
+
+# A stage is flagged when it is this much slower (rows/sec) than the baseline;
+# stages that took less than MIN_COMPARE_S in the baseline are too noisy to judge
+REGRESSION_TOLERANCE = 0.20
+MIN_COMPARE_S = 0.05
+REPEAT = 3
+
+TAXONOMY_WORDS = (
+    "sporting goods outdoor recreation cycling bicycle bicycles accessories bags helmets lights "
+    "wheels components apparel clothing shoes gloves tools maintenance electric road mountain gravel "
+    "kids trailers locks pumps child seats water bottles home garden vehicles electronics toys hardware "
+    "brakes pedals saddles grips fenders bells racks baskets mirrors stands chargers batteries motors"
+).split()
+
+
+def load_profile(path=SEED_SRC):
+    # Header, per-product category/vendor distribution and sample field values from a real export
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames
+        categories = Counter()
+        vendors = Counter()
+        bodies = []
+        titles = []
+        for row in reader:
+            if not row.get("Title"):
+                continue
+            categories[row.get("Type", "")] += 1
+            vendors[row.get("Vendor", "")] += 1
+            titles.append(row["Title"])
+            if row.get("Body (HTML)"):
+                bodies.append(row["Body (HTML)"])
+    return {
+        "fieldnames": fieldnames,
+        "categories": list(categories.items()),
+        "vendors": list(vendors.items()),
+        "titles": titles or ["Product"],
+        "bodies": bodies or ["<p>Body</p>"],
+    }
+
+
+def synthetic_rows(profile, n_rows, seed=0):
+    # Products with 1-4 variant rows and 0-3 image-only rows, like a Shopify export
+    rng = random.Random(seed)
+    cats, cat_weights = zip(*profile["categories"])
+    vendors, vendor_weights = zip(*profile["vendors"])
+    blank = dict.fromkeys(profile["fieldnames"], "")
+    emitted = 0
+    product = 0
+    while emitted < n_rows:
+        product += 1
+        handle = f"synthetic-product-{product}"
+        title = rng.choice(profile["titles"])
+        body = rng.choice(profile["bodies"])
+        if rng.random() < 0.3:
+            body = body + "\n<p>Weitere Informationen:\n\"Details\" &amp; Specs</p>"
+        category = rng.choices(cats, cat_weights)[0]
+        vendor = rng.choices(vendors, vendor_weights)[0]
+        n_variants = rng.choices((1, 2, 3, 4), (70, 15, 10, 5))[0]
+        n_images = rng.choices((0, 1, 2, 3), (50, 30, 15, 5))[0]
+        for v in range(n_variants):
+            row = dict(blank)
+            row["Handle"] = handle
+            row["Variant SKU"] = f"'{product:07d}{v}"
+            row["Variant Barcode"] = f"'{4000000000000 + product * 10 + v}"
+            row["Variant Price"] = f"{rng.uniform(5, 6000):.2f}"
+            row["Variant Grams"] = str(rng.randint(0, 30000))
+            row["Option1 Name"] = "Size" if n_variants > 1 else "Title"
+            row["Option1 Value"] = f"S{v}" if n_variants > 1 else "Default Title"
+            if v == 0:
+                row.update({"Title": title, "Body (HTML)": body, "Vendor": vendor, "Type": category,
+                            "Tags": category.replace(" > ", ", "), "Published": "true", "Status": "active"})
+            yield row
+            emitted += 1
+            if emitted >= n_rows:
+                return
+        for i in range(n_images):
+            row = dict(blank)
+            row["Handle"] = handle
+            row["Image Src"] = f"https://cdn.example.com/{handle}-{i}.jpg"
+            row["Image Position"] = str(i + 2)
+            yield row
+            emitted += 1
+            if emitted >= n_rows:
+                return
+
+
+def generate_feed(path, n_rows, seed=0, profile=None):
+    profile = profile or load_profile()
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=profile["fieldnames"])
+        writer.writeheader()
+        for row in synthetic_rows(profile, n_rows, seed):
+            writer.writerow(row)
+    return path
+
+
+def synthetic_taxonomy(n_nodes=10_000, seed=0):
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < n_nodes:
+        depth = rng.randint(1, 6)
+        names.add(" > ".join(" ".join(rng.sample(TAXONOMY_WORDS, rng.randint(1, 3))).title() for _ in range(depth)))
+    return [{"id": str(i), "full_name": n, "tokens": tokenize(n)} for i, n in enumerate(sorted(names))]
+
+
+def timed(fn, items, repeat=1, setup=None):
+    # Best of `repeat` runs, as (wall, cpu) seconds
+    best = None
+    for _ in range(repeat):
+        if setup:
+            setup()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        for item in items:
+            fn(item)
+        result = (time.perf_counter() - wall, time.process_time() - cpu)
+        if best is None or result[0] < best[0]:
+            best = result
+    return best
+
+
+def peak_rss_kb():
+    # High-water mark of this process in KB, or None without getrusage
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # macOS reports bytes
+
+
+def stage_result(n, wall, cpu):
+    return {"items": n, "wall_s": round(wall, 4), "cpu_s": round(cpu, 4),
+            "per_sec": round(n / wall, 1) if wall else None}
+
+
+def bench_size(n_rows, workdir, seed=0, profile=None, taxonomy_categories=200):
+    feed = generate_feed(os.path.join(workdir, f"feed_{n_rows}.csv"), n_rows, seed, profile)
+    stages = {}
+
+    wall, cpu = time.perf_counter(), time.process_time()
+    with open(feed, "r", encoding="utf-8", newline="") as f:
+        types = [row.get("Type", "") for row in csv.DictReader(f)]
+    stages["csv_parse"] = stage_result(len(types), time.perf_counter() - wall, time.process_time() - cpu)
+
+    # normalize_category starts from a cold memo each repeat, as in a fresh run
+    for name, fn, setup in (("normalize_category", normalize_category, normalize_category.cache_clear),
+                            ("standardize_category", standardize_category, None),
+                            ("translate_category", translate_category, None),
+                            ("map_taxonomy", map_taxonomy, None)):
+        stages[name] = stage_result(len(types), *timed(fn, types, REPEAT, setup))
+
+    # Taxonomy matching: full score() scan vs the inverted index, on distinct categories
+    taxonomy = synthetic_taxonomy()
+    distinct = [normalize_category(t) for t in dict.fromkeys(types) if t][:taxonomy_categories]
+
+    def full_scan(cat):
+        best, best_score = None, -1.0
+        for node in taxonomy:
+            s = score(cat, node)
+            if s > best_score:
+                best, best_score = node, s
+        return best
+
+    stages["taxonomy_score_scan"] = stage_result(len(distinct), *timed(full_scan, distinct))
+    index = TaxonomyIndex(taxonomy)
+    stages["taxonomy_index_top_k"] = stage_result(len(distinct), *timed(lambda c: index.top_k(c, 5), distinct))
+
+    out = os.path.join(workdir, f"out_{n_rows}.csv")
+    wall, cpu = time.perf_counter(), time.process_time()
+    run_pipeline(feed, out, DEFAULT_STAGES)
+    stages["pipeline_end_to_end"] = stage_result(n_rows, time.perf_counter() - wall, time.process_time() - cpu)
+
+    return {
+        "rows": n_rows,
+        "rows_per_sec": stages["pipeline_end_to_end"]["per_sec"],
+        "peak_rss_kb": peak_rss_kb(),
+        "stages": stages,
+    }
+
+
+def bench_size_isolated(n_rows, workdir, seed=0, profile=None):
+    # Each size runs in a fresh process: ru_maxrss is a process-wide high-water mark, so
+    # sizes sharing one process would all report the largest peak seen so far
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(bench_size, n_rows, workdir, seed, profile).result()
+
+
+def compare(results, baseline, tolerance=REGRESSION_TOLERANCE):
+    regressions = []
+    base_runs = {str(run["rows"]): run for run in baseline.get("runs", [])}
+    for run in results["runs"]:
+        base = base_runs.get(str(run["rows"]))
+        if not base:
+            continue
+        for name, stage in run["stages"].items():
+            base_stage = base["stages"].get(name, {})
+            if base_stage.get("wall_s", 0) < MIN_COMPARE_S:
+                continue
+            old = base_stage.get("per_sec")
+            new = stage.get("per_sec")
+            if old and new and new < old * (1 - tolerance):
+                regressions.append(f"{run['rows']} rows / {name}: {new:,.0f}/s vs baseline {old:,.0f}/s")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the catalog transforms on synthetic Shopify feeds.")
+    parser.add_argument("--rows", default=",".join(str(n) for n in DEFAULT_SIZES),
+                        help="comma-separated feed sizes, e.g. 10000,100000,1000000")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=RESULTS)
+    parser.add_argument("--baseline", default=BASELINE, help="compare against this results file if it exists")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--keep", metavar="DIR", help="keep generated feeds in DIR")
+    args = parser.parse_args()
+
+    sizes = [int(n) for n in args.rows.split(",") if n.strip()]
+    profile = load_profile()
+    results = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "runs": [],
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = args.keep or tmp
+        os.makedirs(workdir, exist_ok=True)
+        for n in sizes:
+            print(f"Benchmarking {n} rows…")
+            run = bench_size_isolated(n, workdir, args.seed, profile)
+            results["runs"].append(run)
+            for name, stage in run["stages"].items():
+                print(f"  {name:<22} {stage['items']:>9} items  {stage['wall_s']:>8.3f}s  {stage['per_sec'] or 0:>12,.0f}/s")
+            if run["peak_rss_kb"] is None:
+                print("  peak RSS unavailable on this platform")
+            else:
+                print(f"  peak RSS {run['peak_rss_kb'] / 1024:.1f} MB")
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Wrote {args.out}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved baseline {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f))
+        if regressions:
+            print("Regressions against baseline:")
+            for line in regressions:
+                print(f"- {line}")
+            sys.exit(1)
+        print(f"No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
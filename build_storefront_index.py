@@ -0,0 +1,289 @@
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+import unicodedata
+from collections import Counter, defaultdict
+
+from extract_specs import BIKE_CATEGORIES, SpecExtractor
+from product_groups import iter_products
+
+SRC = "products_final.csv"
+# Kept out of the theme's assets/ until the toolkit reads these files; copy them into
+# assets/ when wiring search, facets or compare to them
+OUT_DIR = "storefront_index"
+PREFIX = "catalog-"
+MANIFEST = PREFIX + "index.json"
+FORMAT_VERSION = 1
+
+# Product cards per shard; a result page needs one or two of them
+PRODUCT_BLOCK = 256
+
+# The storefront must tokenize queries the same way: NFKD, drop combining marks,
+# lowercase, runs of [a-z0-9], at least MIN_TOKEN characters
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+MIN_TOKEN = 2
+
+# Import bookkeeping tags carry no meaning for shoppers
+SKIP_TAG_RE = re.compile(r"^imported", re.I)
+
+# category_level2 is left out: every compare shard already is one level-2 category
+COMPARE_FIELDS = ("wheel_size", "motor_system", "battery_wh",
+                  "frame_material", "suspension", "brake_type", "fit", "color_family")
+NUMERIC_FIELDS = {"battery_wh"}
+
+
+def fold(text):
+    text = unicodedata.normalize("NFKD", text or "")
+    return "".join(ch for ch in text if not unicodedata.combining(ch)).lower()
+
+
+def search_tokens(*texts):
+    tokens = set()
+    for text in texts:
+        tokens.update(t for t in TOKEN_RE.findall(fold(text)) if len(t) >= MIN_TOKEN)
+    return tokens
+
+
+def shard_key(token):
+    # One search shard per initial letter, digits share one
+    first = token[0]
+    return first if "a" <= first <= "z" else "0"
+
+
+def slug(text):
+    return re.sub(r"[^a-z0-9]+", "-", fold(text)).strip("-")
+
+
+def product_price(product):
+    prices = []
+    for row in product.variants:
+        try:
+            prices.append(float(row.get("Variant Price", "")))
+        except ValueError:
+            continue
+    return min(prices) if prices else None
+
+
+def product_image(product):
+    for row in product.rows:
+        if row.get("Image Src"):
+            return row["Image Src"]
+    return ""
+
+
+def image_base(cards):
+    # Shared CDN folder of all image URLs; cards store the rest, the manifest the base
+    images = [card[5] for card in cards if card[5]]
+    base = os.path.commonprefix(images) if images else ""
+    return base[:base.rfind("/") + 1]
+
+
+def encode_column(values):
+    # Strings as indexes into a dictionary, so repeated values cost one small int each
+    ids = {}
+    codes = []
+    for v in values:
+        if v is None:
+            codes.append(None)
+        else:
+            codes.append(ids.setdefault(v, len(ids)))
+    return list(ids), codes
+
+
+def is_listed(product):
+    # Only products the storefront shows; drafts and unpublished products stay out of
+    # every asset, since the shards are public files
+    head = product.head
+    return head.get("Status", "") == "active" and head.get("Published", "") == "true"
+
+
+def collect(src):
+    # One pass over the catalog: product cards, postings, facets and compare rows.
+    # Also returns the handles left out as not listed.
+    extractor = SpecExtractor()
+    cards = []
+    hidden = set()
+    postings = defaultdict(list)
+    categories = Counter()
+    vendors = defaultdict(Counter)
+    spec_facets = defaultdict(lambda: defaultdict(Counter))
+    compare = defaultdict(list)
+    bikes = []
+    with open(src, "r", encoding="utf-8-sig", newline="") as f:
+        for product in iter_products(csv.DictReader(f)):
+            if not is_listed(product):
+                hidden.add(product.handle)
+                continue
+            pid = len(cards)
+            head = product.head
+            category = head.get("Product Category", "") or ""
+            vendor = head.get("Vendor", "") or ""
+            price = product_price(product)
+            cards.append([product.handle, head.get("Title", ""), vendor, category, price, product_image(product)])
+
+            tags = [t for t in (head.get("Tags", "") or "").split(",") if t.strip() and not SKIP_TAG_RE.match(t.strip())]
+            for token in search_tokens(head.get("Title", ""), vendor, category.replace(" > ", " "), " ".join(tags)):
+                postings[token].append(pid)
+
+            parts = [p.strip() for p in category.split(" > ") if p.strip()]
+            for depth in range(1, len(parts) + 1):
+                categories[" > ".join(parts[:depth])] += 1
+            if parts:
+                vendors[parts[0]][vendor] += 1
+
+            if parts and parts[0] in BIKE_CATEGORIES:
+                extractor.add(product)
+                bikes.append((" > ".join(parts[:2]), pid, price, product))
+
+    # Specs once every variant has been seen, so colour and size variants share them
+    for group, pid, price, product in bikes:
+        specs = extractor.extract(product)
+        for field, value in specs.items():
+            spec_facets[group][field][str(value)] += 1
+        compare[group].append((pid, price, specs))
+    return cards, postings, categories, vendors, spec_facets, compare, extractor, hidden
+
+
+def compare_shard(group, members):
+    shard = {"category": group, "ids": [pid for pid, _, _ in members],
+             "price": [price for _, price, _ in members], "columns": {}, "dictionaries": {}}
+    for field in COMPARE_FIELDS:
+        values = [specs.get(field) for _, _, specs in members]
+        if not any(v is not None for v in values):
+            continue
+        if field in NUMERIC_FIELDS:
+            shard["columns"][field] = values
+        else:
+            shard["dictionaries"][field], shard["columns"][field] = encode_column(values)
+    return shard
+
+
+def build_assets(src=SRC):
+    # {file name: JSON-able payload} plus the manifest that points at them
+    cards, postings, categories, vendors, spec_facets, compare, extractor, hidden = collect(src)
+    base = image_base(cards)
+    for card in cards:
+        if card[5].startswith(base):
+            card[5] = card[5][len(base):]
+    assets = {}
+    manifest = {
+        "version": FORMAT_VERSION,
+        "products": len(cards),
+        "product_block": PRODUCT_BLOCK,
+        "product_fields": ["handle", "title", "vendor", "category", "price", "image"],
+        "image_base": base,
+        "tokenizer": {"pattern": TOKEN_RE.pattern, "fold": "NFKD, strip combining marks, lowercase",
+                      "min_length": MIN_TOKEN},
+        "products_shards": [],
+        "search": {},
+        "compare": {},
+    }
+
+    for start in range(0, len(cards), PRODUCT_BLOCK):
+        name = f"{PREFIX}products-{start // PRODUCT_BLOCK}.json"
+        assets[name] = {"start": start, "rows": cards[start:start + PRODUCT_BLOCK]}
+        manifest["products_shards"].append(name)
+
+    shards = defaultdict(dict)
+    for token in sorted(postings):
+        shards[shard_key(token)][token] = postings[token]
+    for key, index in sorted(shards.items()):
+        name = f"{PREFIX}search-{key}.json"
+        assets[name] = index
+        manifest["search"][key] = {"file": name, "tokens": len(index)}
+
+    for group, members in sorted(compare.items()):
+        name = f"{PREFIX}compare-{slug(group)}.json"
+        assets[name] = compare_shard(group, members)
+        manifest["compare"][group] = {"file": name, "products": len(members)}
+
+    assets[f"{PREFIX}facets.json"] = {
+        "categories": dict(sorted(categories.items())),
+        "vendors": {top: dict(counts.most_common()) for top, counts in sorted(vendors.items())},
+        "specs": {group: {field: dict(values.most_common()) for field, values in fields.items()}
+                  for group, fields in sorted(spec_facets.items())},
+    }
+    manifest["facets"] = f"{PREFIX}facets.json"
+    return assets, manifest, extractor, hidden
+
+
+def dump(payload):
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def write_assets(assets, manifest, out_dir=OUT_DIR):
+    # Files are only rewritten when their bytes change, so a theme push uploads just those;
+    # shards dropped since the previous manifest are removed
+    written = unchanged = 0
+    hashes = {}
+    for name, payload in assets.items():
+        data = dump(payload)
+        hashes[name] = hashlib.blake2b(data, digest_size=8).hexdigest()
+        path = os.path.join(out_dir, name)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    unchanged += 1
+                    continue
+        with open(path, "wb") as f:
+            f.write(data)
+        written += 1
+    manifest = dict(manifest, hashes=hashes)
+
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    removed = []
+    if os.path.exists(manifest_path):
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                previous = json.load(f).get("hashes", {})
+        except (OSError, ValueError):
+            previous = {}
+        for name in previous:
+            if name not in assets and name.startswith(PREFIX) and os.path.exists(os.path.join(out_dir, name)):
+                os.remove(os.path.join(out_dir, name))
+                removed.append(name)
+    with open(manifest_path, "wb") as f:
+        f.write(dump(manifest))
+    return written, unchanged, removed
+
+
+def unlisted_in_shards(src, out_dir=OUT_DIR):
+    # Independent of collect(): reads the manifest and product shards back from disk and
+    # returns the handles in them that the source CSV does not list (drafts, unpublished
+    # products, or handles it does not have at all)
+    with open(src, "r", encoding="utf-8-sig", newline="") as f:
+        listed = {p.handle for p in iter_products(csv.DictReader(f)) if is_listed(p)}
+    with open(os.path.join(out_dir, MANIFEST), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    unlisted = set()
+    for name in manifest["products_shards"]:
+        with open(os.path.join(out_dir, name), "r", encoding="utf-8") as f:
+            unlisted.update(row[0] for row in json.load(f)["rows"] if row[0] not in listed)
+    return sorted(unlisted)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build sharded storefront search, facet and compare indexes from the catalog.")
+    parser.add_argument("--src", default=SRC)
+    parser.add_argument("--out-dir", default=OUT_DIR)
+    args = parser.parse_args()
+
+    assets, manifest, extractor, hidden = build_assets(args.src)
+    os.makedirs(args.out_dir, exist_ok=True)
+    written, unchanged, removed = write_assets(assets, manifest, args.out_dir)
+    leaked = unlisted_in_shards(args.src, args.out_dir)
+    if leaked:
+        print(f"Unlisted products in the written shards: {', '.join(leaked[:10])}")
+        sys.exit(1)
+    sizes = sorted((os.path.getsize(os.path.join(args.out_dir, n)), n) for n in assets)
+    print(f"Indexed {manifest['products']} products ({extractor.families} bike model families, "
+          f"{len(hidden)} draft or unpublished left out) into {len(assets)} shards: {written} written, {unchanged} unchanged, {len(removed)} removed.")
+    print(f"Largest shard: {sizes[-1][1]} ({sizes[-1][0]} bytes); manifest {os.path.join(args.out_dir, MANIFEST)}")
+
+
+if __name__ == "__main__":
+    main()
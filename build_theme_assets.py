@@ -0,0 +1,480 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+
+ASSETS = "assets"
+SNIPPET = "snippets/theme-asset.liquid"
+MANIFEST = os.path.join(ASSETS, "theme-assets-manifest.json")
+TOOLKIT = os.path.join(ASSETS, "godspeed-bike-toolkit.js")
+TOOLKIT_PREFIX = "toolkit-"
+
+# Plain JS files shipped minified as a whole: {asset name: source}. Liquid-templated
+# assets (shop.js.liquid, *.scss.liquid) are rendered by Shopify and stay as they are.
+BUNDLES = {
+    "shop": os.path.join(ASSETS, "shop.js"),
+}
+
+# Bump when the chunk layout or the minifier changes; every chunk is rebuilt
+FORMAT_VERSION = 1
+
+# Warn when a page's JS + CSS (uncompressed) goes over this
+PAGE_BUDGET = 512_000
+
+HASH_LEN = 8
+
+# Page templates that are live, i.e. not the .bak/.old copies
+TEMPLATE_GLOBS = ("templates/*.liquid", "templates/*.json", "templates/customers/*.liquid")
+LAYOUT = "layout/theme.liquid"
+
+_CLASS_RE = re.compile(r"^class (\w+)(?: extends (\w+))? \{", re.M)
+_INIT_RE = re.compile(r"^document\.addEventListener\('DOMContentLoaded'.*?^\}\);\n", re.M | re.S)
+_STANDALONE_RE = re.compile(r"^window\.GodspeedToolkit\.(\w+) = class extends (\w+) \{.*?^\};\n", re.M | re.S)
+_LOAD_MODULE_RE = re.compile(r"this\.loadModule\('(\w+)', registry\.(\w+)\)")
+
+
+def digest(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def kebab(name):
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "-", name).lower()
+
+
+# --- minifier -------------------------------------------------------------------------
+
+_WORD = re.compile(r"[\w$\\]|[^\x00-\x7f]")
+# After these a "/" starts a regex literal, not a division
+_REGEX_AFTER = set("(,=:[!&|?{};+-*%<>~^")
+_REGEX_KEYWORDS = {"return", "typeof", "case", "do", "else", "in", "of", "new", "delete",
+                   "void", "throw", "instanceof", "yield", "await"}
+# A line break next to these can go without changing how statements end
+_NO_BREAK_AFTER = set("{([,;:=&|?*%<>!")
+_NO_BREAK_BEFORE = set("})],;.:?=&|")
+
+
+def _skip_string(src, i):
+    quote = src[i]
+    i += 1
+    while i < len(src):
+        ch = src[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == quote or ch == "\n":
+            return i + 1
+        i += 1
+    return i
+
+
+def _skip_template(src, i):
+    # Template literals are copied verbatim, ${...} expressions included
+    i += 1
+    while i < len(src):
+        ch = src[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "`":
+            return i + 1
+        if ch == "$" and src.startswith("${", i):
+            i = _skip_expression(src, i + 2)
+            continue
+        i += 1
+    return i
+
+
+def _skip_expression(src, i):
+    depth = 1
+    while i < len(src):
+        ch = src[i]
+        if ch in "'\"":
+            i = _skip_string(src, i)
+            continue
+        if ch == "`":
+            i = _skip_template(src, i)
+            continue
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return i
+
+
+def _skip_regex(src, i):
+    i += 1
+    in_class = False
+    while i < len(src):
+        ch = src[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "\n":
+            return i
+        if in_class:
+            if ch == "]":
+                in_class = False
+        elif ch == "[":
+            in_class = True
+        elif ch == "/":
+            i += 1
+            while i < len(src) and _WORD.match(src[i]):
+                i += 1
+            return i
+        i += 1
+    return i
+
+
+def _last_word(out):
+    # The identifier/keyword at the end of the output so far
+    tail = "".join(out[-3:])[-12:]
+    m = re.search(r"[\w$]+$", tail)
+    return m.group(0) if m else ""
+
+
+def minify_js(src):
+    # Drops comments, indentation and blank lines and squeezes other whitespace.
+    # Line breaks stay wherever dropping one could change automatic semicolon
+    # insertion; names, strings, templates and regexes are left untouched.
+    out = []
+    i = 0
+    n = len(src)
+    pending = None
+    while i < n:
+        ch = src[i]
+        if ch in " \t\r\n\f\v﻿":
+            j = i
+            while j < n and src[j] in " \t\r\n\f\v﻿":
+                j += 1
+            ws = "\n" if "\n" in src[i:j] else " "
+            pending = "\n" if pending == "\n" else ws
+            i = j
+            continue
+        if ch == "/" and src.startswith("//", i):
+            j = src.find("\n", i)
+            i = n if j < 0 else j
+            continue
+        if ch == "/" and src.startswith("/*", i):
+            j = src.find("*/", i + 2)
+            j = n if j < 0 else j + 2
+            if pending != "\n":
+                pending = "\n" if "\n" in src[i:j] else " "
+            i = j
+            continue
+
+        prev = out[-1][-1] if out else ""
+        if pending and out:
+            if pending == "\n" and prev not in _NO_BREAK_AFTER and ch not in _NO_BREAK_BEFORE:
+                out.append("\n")
+            elif (_WORD.match(prev) and _WORD.match(ch)) or (prev in "+-" and ch == prev):
+                out.append(" ")
+        pending = None
+
+        if ch in "'\"":
+            j = _skip_string(src, i)
+        elif ch == "`":
+            j = _skip_template(src, i)
+        elif ch == "/" and (not prev or prev in _REGEX_AFTER or _last_word(out) in _REGEX_KEYWORDS):
+            j = _skip_regex(src, i)
+        elif _WORD.match(ch):
+            j = i + 1
+            while j < n and _WORD.match(src[j]):
+                j += 1
+        else:
+            j = i + 1
+        out.append(src[i:j])
+        i = j
+    return "".join(out) + "\n"
+
+
+# --- toolkit split --------------------------------------------------------------------
+
+def split_toolkit(src):
+    # {chunk name: {"classes": [...], "source": js}} plus the feature -> class map.
+    # The core chunk is EBikeToolkit + BaseModule + auto-init; each BaseModule subclass
+    # starts a tool chunk that also takes the helper classes after it and its
+    # standalone window.GodspeedToolkit wrapper.
+    src = src.replace("\r\n", "\n")
+    classes = list(_CLASS_RE.finditer(src))
+    init = _INIT_RE.search(src)
+    if not classes or not init or init.start() < classes[-1].start():
+        raise ValueError(f"{TOOLKIT}: unexpected layout (classes, then the DOMContentLoaded auto-init)")
+    tail = src[init.start():]
+
+    bodies = []
+    for k, m in enumerate(classes):
+        # A class runs from its doc comment up to the next class's doc comment
+        start = src.rfind("\n}\n", 0, m.start()) + 3 if k else 0
+        end = classes[k + 1].start() if k + 1 < len(classes) else init.start()
+        end = src.rfind("\n}\n", 0, end) + 3
+        bodies.append((m.group(1), m.group(2), src[start:end]))
+
+    core = TOOLKIT_PREFIX + "core"
+    chunks = {core: {"classes": [], "source": []}}
+    current = core
+    for name, base, body in bodies:
+        if base == "BaseModule":
+            current = TOOLKIT_PREFIX + kebab(name)
+            chunks[current] = {"classes": [], "source": [], "module": name}
+        chunks[current]["classes"].append(name)
+        chunks[current]["source"].append(body)
+    chunks[core]["source"].append(init.group(0))
+
+    standalone = {m.group(2): m.group(0) for m in _STANDALONE_RE.finditer(tail)}
+    for key, chunk in chunks.items():
+        if key == core:
+            chunk["source"].append(
+                "window.EBikeToolkit = EBikeToolkit;\n"
+                "window.EBikeToolkitModules = window.EBikeToolkitModules || {};\n"
+                "window.EBikeToolkitModules.BaseModule = BaseModule;\n"
+                "window.GodspeedToolkit = window.EBikeToolkitModules;\n"
+            )
+            chunk["source"] = "".join(chunk["source"])
+            continue
+        module = chunk["module"]
+        # Wrapped so a chunk included twice on one page does not redeclare its classes
+        chunk["source"] = (
+            "(() => {\n"
+            f"if (EBikeToolkit.registry && EBikeToolkit.registry.{module}) return;\n"
+            + "".join(chunk["source"])
+            + f"EBikeToolkit.register('{module}', {module});\n"
+            f"window.EBikeToolkitModules.{module} = {module};\n"
+            + standalone.get(module, "")
+            + "})();\n"
+        )
+    features = dict(_LOAD_MODULE_RE.findall(src))
+    chunks[core]["module"] = None
+    return chunks, features
+
+
+# --- build ----------------------------------------------------------------------------
+
+def load_manifest(path=MANIFEST):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if manifest.get("version") == FORMAT_VERSION else {}
+
+
+def code_digest():
+    with open(os.path.abspath(__file__), "rb") as f:
+        return digest(f.read())
+
+
+def emit(name, source, previous, code, out_dir=ASSETS):
+    # Minified, content-hashed asset for one chunk; skipped when its source and the
+    # build code are what the previous manifest saw and the file is still there
+    source_digest = digest(source.encode("utf-8"))
+    old = previous.get(name)
+    if old and old["source"] == source_digest and old["code"] == code \
+            and os.path.exists(os.path.join(out_dir, old["file"])):
+        return dict(old), False
+    data = minify_js(source).encode("utf-8")
+    file_name = f"{name}.{digest(data)[:HASH_LEN]}.min.js"
+    path = os.path.join(out_dir, file_name)
+    with open(path, "wb") as f:
+        f.write(data)
+    return {"file": file_name, "bytes": len(data), "source": source_digest, "code": code,
+            "source_bytes": len(source.encode("utf-8"))}, True
+
+
+def render_snippet(entries):
+    lines = [
+        "{%- comment -%}",
+        "  Generated by build_theme_assets.py, do not edit.",
+        "  Loads one built asset by name: {% render 'theme-asset', name: 'toolkit-range-calculator' %}",
+        "{%- endcomment -%}",
+        "{%- case name -%}",
+    ]
+    for name, entry in sorted(entries.items()):
+        lines.append(f"  {{%- when '{name}' -%}}")
+        lines.append(f"    {{{{ '{entry['file']}' | asset_url | script_tag }}}}")
+    lines.append("{%- endcase -%}")
+    return "\n".join(lines) + "\n"
+
+
+def build(out_dir=ASSETS, manifest_path=MANIFEST, snippet_path=SNIPPET):
+    previous = load_manifest(manifest_path).get("assets", {})
+    code = code_digest()
+    with open(TOOLKIT, "r", encoding="utf-8") as f:
+        chunks, features = split_toolkit(f.read())
+
+    sources = {name: chunk["source"] for name, chunk in chunks.items()}
+    for name, path in BUNDLES.items():
+        with open(path, "r", encoding="utf-8") as f:
+            sources[name] = f.read()
+
+    entries = {}
+    rebuilt = []
+    for name, source in sources.items():
+        entries[name], changed = emit(name, source, previous, code, out_dir)
+        if name in chunks:
+            entries[name]["classes"] = chunks[name]["classes"]
+        if changed:
+            rebuilt.append(name)
+
+    # Files of older builds
+    live = {e["file"] for e in entries.values()}
+    removed = []
+    for old in previous.values():
+        path = os.path.join(out_dir, old["file"])
+        if old["file"] not in live and os.path.exists(path):
+            os.remove(path)
+            removed.append(old["file"])
+
+    manifest = {"version": FORMAT_VERSION, "features": features, "assets": entries}
+    write_if_changed(manifest_path, json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    write_if_changed(snippet_path, render_snippet(entries))
+    return manifest, rebuilt, removed
+
+
+def write_if_changed(path, text):
+    data = text.encode("utf-8")
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+# --- page budgets ---------------------------------------------------------------------
+
+_SECTION_RE = re.compile(r"\{%-?\s*section\s+'([\w-]+)'")
+_RENDER_RE = re.compile(r"\{%-?\s*(?:render|include)\s+'([\w-]+)'(.*?)-?%\}", re.S)
+_THEME_ASSET_RE = re.compile(r"name:\s*'([\w-]+)'")
+_ASSET_TAG_RE = re.compile(r"\{\{\s*'([\w.-]+)'\s*\|\s*asset_url\s*\|\s*(script_tag|stylesheet_tag)")
+_TOOL_USE_RES = (
+    re.compile(r"GodspeedToolkit\.(\w+)"),
+    re.compile(r"data-ebike-tool=\"(\w+)\""),
+    re.compile(r"getModule\('(\w+)'\)"),
+)
+
+
+def read_text(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return ""
+
+
+def template_files(path, seen=None):
+    # The template plus every section and snippet it pulls in, recursively
+    seen = seen if seen is not None else []
+    if path in seen or not os.path.exists(path):
+        return seen
+    seen.append(path)
+    text = read_text(path)
+    if path.endswith(".json"):
+        try:
+            data = json.loads(re.sub(r"^/\*.*?\*/", "", text, flags=re.S))
+        except ValueError:
+            data = {}
+        for section in (data.get("sections") or {}).values():
+            template_files(f"sections/{section.get('type')}.liquid", seen)
+        return seen
+    for name in _SECTION_RE.findall(text):
+        template_files(f"sections/{name}.liquid", seen)
+    for name, _ in _RENDER_RE.findall(text):
+        if name != "theme-asset":
+            template_files(f"snippets/{name}.liquid", seen)
+    return seen
+
+
+def asset_size(name):
+    # Bytes of the file Shopify serves for an asset_url name; Liquid-rendered assets
+    # are measured by their source
+    for candidate in (name, name + ".liquid", re.sub(r"\.css$", ".liquid", name)):
+        path = os.path.join(ASSETS, candidate)
+        if os.path.exists(path):
+            return os.path.getsize(path)
+    return 0
+
+
+def loaded_assets(paths, entries):
+    # {asset: bytes} for every script/stylesheet tag and theme-asset render in paths
+    assets = {}
+    for path in paths:
+        text = read_text(path)
+        for name, _ in _ASSET_TAG_RE.findall(text):
+            assets[name] = asset_size(name)
+        for name, args in _RENDER_RE.findall(text):
+            if name == "theme-asset":
+                for asset in _THEME_ASSET_RE.findall(args):
+                    if asset in entries:
+                        assets[entries[asset]["file"]] = entries[asset]["bytes"]
+    return assets
+
+
+def tools_used(paths, features):
+    used = set()
+    for path in paths:
+        text = read_text(path)
+        for pattern in _TOOL_USE_RES:
+            for name in pattern.findall(text):
+                used.add(features.get(name, name))
+    return used
+
+
+def page_budgets(manifest, budget=PAGE_BUDGET):
+    # (template, bytes loaded, tools used but not loaded) per live template
+    entries = manifest["assets"]
+    by_class = {c: name for name, e in entries.items() for c in e.get("classes", ())}
+    layout = loaded_assets([LAYOUT], entries)
+    rows = []
+    for pattern in TEMPLATE_GLOBS:
+        for template in sorted(glob.glob(pattern)):
+            paths = template_files(template)
+            assets = dict(layout)
+            assets.update(loaded_assets(paths, entries))
+            missing = sorted(
+                by_class[c] for c in tools_used(paths, manifest["features"])
+                if c in by_class and entries[by_class[c]]["file"] not in assets
+            )
+            total = sum(assets.values())
+            rows.append((template, total, total > budget, missing))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split, minify and content-hash the theme JS and report per-page asset bytes.")
+    parser.add_argument("--budget", type=int, default=PAGE_BUDGET, help="bytes of JS + CSS per page before warning")
+    parser.add_argument("--report-only", action="store_true", help="skip the build, report from the current manifest")
+    args = parser.parse_args()
+
+    if args.report_only:
+        manifest, rebuilt, removed = load_manifest(), [], []
+        if not manifest:
+            parser.error(f"no manifest at {MANIFEST}; run a build first")
+    else:
+        manifest, rebuilt, removed = build()
+    entries = manifest["assets"]
+    print(f"{len(entries)} assets, {len(rebuilt)} rebuilt"
+          + (f" ({', '.join(rebuilt)})" if rebuilt else "")
+          + (f", {len(removed)} stale removed" if removed else ""))
+    for name, e in sorted(entries.items()):
+        print(f"  {e['file']:<44} {e['bytes']:>8} bytes (source {e['source_bytes']})")
+
+    print(f"\nPer-page JS + CSS bytes (budget {args.budget}):")
+    over = 0
+    for template, total, too_big, missing in page_budgets(manifest, args.budget):
+        over += too_big
+        flag = "  OVER" if too_big else ""
+        print(f"  {template:<44} {total:>8}{flag}")
+        if missing:
+            print(f"    uses tools without loading them: {', '.join(missing)}")
+    if over:
+        print(f"{over} page(s) over budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+import argparse
+import ast
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from catalog_store import file_digest
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATE_PATH = ".catalog_build.json"
+
+# Bump when the state layout changes; older state files are ignored
+FORMAT_VERSION = 1
+
+
+class Stage:
+    # One script run: what it reads, what it writes, extra command-line arguments.
+    # A stage that rewrites a file in place lists it under both inputs and outputs.
+
+    __slots__ = ("name", "script", "inputs", "outputs", "args")
+
+    def __init__(self, name, script, inputs, outputs, args=()):
+        self.name = name
+        self.script = script
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.args = tuple(args)
+
+    def __repr__(self):
+        return f"Stage({self.name!r}, {self.script!r})"
+
+
+# Dependencies follow from the file names: a stage runs after whichever stage writes
+# one of its inputs. Files no stage writes are sources.
+STAGES = [
+    Stage("translate", "translate_categories.py",
+          ["products_translated_english.csv"], ["products_fully_english.csv"]),
+    Stage("clean", "clean_categories.py",
+          ["products_translated_english.csv"], ["products_clean_english.csv"]),
+    Stage("count", "count_categories.py",
+          ["products_clean_english.csv"], ["clean_category_summary.txt"]),
+    Stage("normalize", "normalize_categories.py",
+          ["products_translated_english.csv"], ["products_final.csv", "verification_report.txt"]),
+    Stage("verify", "verify.py",
+          ["products_final.csv"], ["final_categories.txt"]),
+    Stage("taxonomy", "map_to_taxonomy_simple.py",
+          ["products_final.csv"], ["products_with_taxonomy.csv", "taxonomy_summary.txt"]),
+    Stage("export", "export_for_shopify.py",
+          ["products_final.csv"], ["products_for_shopify.csv", "tag_frequencies.csv"]),
+    Stage("specs", "extract_specs.py",
+          ["products_final.csv", "shopify_metafield_definitions_products.json"], ["products_metafields.csv"]),
+    Stage("storefront", "build_storefront_index.py",
+          ["products_final.csv"], ["storefront_index/catalog-index.json"]),
+    Stage("collections", "reassign_collections.py",
+          ["200-products-with-collections.csv"], ["200-products-with-collections.csv", "collection_changes.csv"]),
+]
+
+
+def build_graph(stages):
+    # {stage name: set of upstream stage names}, in declaration order
+    producers = {}
+    for stage in stages:
+        for path in stage.outputs:
+            if path in producers:
+                raise ValueError(f"{path} is written by both {producers[path]} and {stage.name}")
+            producers[path] = stage.name
+    graph = {}
+    for stage in stages:
+        graph[stage.name] = {producers[p] for p in stage.inputs if p in producers and producers[p] != stage.name}
+    order = topological(graph)
+    if len(order) != len(graph):
+        raise ValueError(f"Dependency cycle among: {', '.join(sorted(set(graph) - set(order)))}")
+    return graph
+
+
+def topological(graph):
+    done = []
+    placed = set()
+    pending = list(graph)
+    while pending:
+        ready = [n for n in pending if graph[n] <= placed]
+        if not ready:
+            break
+        for n in ready:
+            done.append(n)
+            placed.add(n)
+        pending = [n for n in pending if n not in placed]
+    return done
+
+
+def with_upstream(graph, names):
+    selected = set()
+    todo = list(names)
+    while todo:
+        name = todo.pop()
+        if name not in selected:
+            selected.add(name)
+            todo.extend(graph[name])
+    return selected
+
+
+def local_modules(script, root=ROOT):
+    # The script plus every repo module it imports, transitively; stdlib and
+    # third-party imports are not files in the repo and drop out
+    seen = []
+    todo = [script]
+    while todo:
+        path = todo.pop()
+        if path in seen:
+            continue
+        seen.append(path)
+        with open(os.path.join(root, path), "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [a.name for a in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                candidate = name.split(".")[0] + ".py"
+                if os.path.exists(os.path.join(root, candidate)):
+                    todo.append(candidate)
+    return sorted(seen)
+
+
+def code_digest(stage, root=ROOT):
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((FORMAT_VERSION, stage.script, stage.args)).encode("utf-8"))
+    for path in local_modules(stage.script, root):
+        h.update(path.encode("utf-8") + b"\0")
+        h.update(file_digest(os.path.join(root, path)).encode("ascii"))
+    return h.hexdigest()
+
+
+class BuildState:
+    # Last successful run per stage (code, input and output digests), plus a
+    # (size, mtime) -> digest memo so unchanged files are not re-hashed
+
+    def __init__(self, path=STATE_PATH, root=ROOT):
+        self.path = os.path.join(root, path)
+        self.root = root
+        self.files = {}
+        self.stages = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        if data.get("version") == FORMAT_VERSION:
+            self.files = data.get("files", {})
+            self.stages = data.get("stages", {})
+
+    def digest(self, path):
+        full = os.path.join(self.root, path)
+        try:
+            st = os.stat(full)
+        except OSError:
+            return None
+        known = self.files.get(path)
+        if known and known[0] == st.st_size and known[1] == st.st_mtime_ns:
+            return known[2]
+        value = file_digest(full)
+        self.files[path] = [st.st_size, st.st_mtime_ns, value]
+        return value
+
+    def digests(self, paths):
+        return {p: self.digest(p) for p in paths}
+
+    def stale_reason(self, stage, code):
+        # None when the recorded run still matches, else why the stage must run
+        record = self.stages.get(stage.name)
+        if record is None:
+            return "never built"
+        if record.get("code") != code:
+            return "code changed"
+        missing = [p for p in stage.inputs if self.digest(p) is None]
+        if missing:
+            return f"missing input {missing[0]}"
+        for path, value in self.digests(stage.inputs).items():
+            if record["inputs"].get(path) != value:
+                return f"{path} changed"
+        for path, value in self.digests(stage.outputs).items():
+            if value is None:
+                return f"{path} missing"
+            if record["outputs"].get(path) != value:
+                return f"{path} modified outside the build"
+        return None
+
+    def record(self, stage, code):
+        # Taken after the run, so in-place outputs count as the stage's own input next time
+        self.stages[stage.name] = {
+            "code": code,
+            "inputs": self.digests(stage.inputs),
+            "outputs": self.digests(stage.outputs),
+        }
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": FORMAT_VERSION, "files": self.files, "stages": self.stages}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+def run_script(stage, root=ROOT):
+    started = time.perf_counter()
+    proc = subprocess.run([sys.executable, stage.script, *stage.args], cwd=root,
+                          capture_output=True, text=True)
+    return proc.returncode, proc.stdout + proc.stderr, time.perf_counter() - started
+
+
+def build(stages, targets=None, jobs=None, force=False, dry_run=False, root=ROOT, state_path=STATE_PATH, log=print):
+    # Runs every stale stage once its upstream stages are done; independent stages
+    # run side by side. A stage whose upstream rerun produced identical files stays
+    # skipped, since staleness is judged on content digests, not timestamps.
+    by_name = {s.name: s for s in stages}
+    graph = build_graph(stages)
+    unknown = [t for t in targets or () if t not in by_name]
+    if unknown:
+        raise ValueError(f"Unknown stage(s): {', '.join(unknown)} (known: {', '.join(by_name)})")
+    selected = with_upstream(graph, targets) if targets else set(by_name)
+    order = [n for n in topological(graph) if n in selected]
+
+    state = BuildState(state_path, root)
+    results = {}
+    if dry_run:
+        for name in order:
+            stage = by_name[name]
+            upstream = [u for u in graph[name] if results.get(u) == "run"]
+            reason = "forced" if force else state.stale_reason(stage, code_digest(stage, root))
+            if reason is None and upstream:
+                reason = f"after {', '.join(sorted(upstream))}, if their outputs change"
+            results[name] = "run" if reason else "skip"
+            log(f"{name:<12} {'would run: ' + reason if reason else 'up to date'}")
+        return results
+
+    pending = list(order)
+    running = {}
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        while pending or running:
+            for name in list(pending):
+                upstream = graph[name] & selected
+                if any(results.get(u) == "failed" or results.get(u) == "blocked" for u in upstream):
+                    results[name] = "blocked"
+                    pending.remove(name)
+                    log(f"{name:<12} blocked by a failed upstream stage")
+                    continue
+                if not all(u in results for u in upstream):
+                    continue
+                pending.remove(name)
+                stage = by_name[name]
+                code = code_digest(stage, root)
+                reason = "forced" if force else state.stale_reason(stage, code)
+                if reason is None:
+                    results[name] = "skip"
+                    log(f"{name:<12} up to date")
+                    continue
+                log(f"{name:<12} running {stage.script} ({reason})")
+                running[pool.submit(run_script, stage, root)] = (stage, code)
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, code = running.pop(future)
+                returncode, output, seconds = future.result()
+                if returncode == 0:
+                    state.record(stage, code)
+                    state.save()
+                    results[stage.name] = "run"
+                    log(f"{stage.name:<12} done in {seconds:.1f}s")
+                else:
+                    results[stage.name] = "failed"
+                    log(f"{stage.name:<12} FAILED (exit {returncode}) after {seconds:.1f}s")
+                    for line in output.rstrip().splitlines()[-20:]:
+                        log(f"    {line}")
+    state.save()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the catalog outputs, running only stages whose inputs or code changed.")
+    parser.add_argument("targets", nargs="*", help="stages to bring up to date, with their upstream (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="stages run at once (default: all cores)")
+    parser.add_argument("--force", action="store_true", help="rerun the selected stages even if up to date")
+    parser.add_argument("-n", "--dry-run", action="store_true", help="only report what would run")
+    parser.add_argument("--list", action="store_true", help="show the stage graph and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        graph = build_graph(STAGES)
+        for stage in STAGES:
+            after = ", ".join(sorted(graph[stage.name])) or "-"
+            print(f"{stage.name:<12} {stage.script:<28} after: {after}")
+            print(f"{'':<12} in:  {', '.join(stage.inputs)}")
+            print(f"{'':<12} out: {', '.join(stage.outputs)}")
+        return
+
+    started = time.perf_counter()
+    try:
+        results = build(STAGES, args.targets, args.jobs, args.force, args.dry_run)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.dry_run:
+        return
+    counts = {k: sum(1 for v in results.values() if v == k) for k in ("run", "skip", "failed", "blocked")}
+    print(f"Ran {counts['run']}, skipped {counts['skip']} up-to-date stage(s) in {time.perf_counter() - started:.1f}s"
+          + (f"; {counts['failed']} failed, {counts['blocked']} blocked" if counts["failed"] or counts["blocked"] else ""))
+    sys.exit(1 if counts["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
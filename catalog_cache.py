@@ -0,0 +1,136 @@
+import hashlib
+import os
+import pickle
+
+from product_groups import is_head
+
+CACHE_PATH = ".catalog_cache.pkl"
+
+# Bump when the cache layout changes; older caches are ignored
+FORMAT_VERSION = 2
+
+# Columns the category stages read; cached rows are re-validated per distinct pair.
+# Category stages only touch product rows, so whether a row is one is part of the key.
+CATEGORY_COLUMNS = ("Type", "Product Category")
+
+
+def digest(obj):
+    return hashlib.sha256(repr(obj).encode("utf-8")).hexdigest()
+
+
+def row_fingerprint(row, fieldnames, salt=""):
+    h = hashlib.blake2b(digest_size=16)
+    for name in fieldnames:
+        h.update((row.get(name) or "").encode("utf-8"))
+        h.update(b"\x1f")
+    if salt:
+        h.update(b"\x1e" + salt.encode("utf-8"))
+    return h.digest()
+
+
+def row_keys(rows):
+    # Handle + Variant SKU, plus a running count so image-only rows (no SKU) stay distinct
+    seen = {}
+    for row in rows:
+        base = (row.get("Handle", ""), row.get("Variant SKU", ""))
+        n = seen.get(base, 0)
+        seen[base] = n + 1
+        yield base + (n,), row
+
+
+def load_cache(path=CACHE_PATH):
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            cache = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    if cache.get("format") != FORMAT_VERSION:
+        return None
+    return cache
+
+
+def save_cache(cache, path=CACHE_PATH):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def category_outcome(row):
+    return tuple(row.get(c, "") for c in CATEGORY_COLUMNS)
+
+
+def category_input(row):
+    return category_outcome(row) + (is_head(row),)
+
+
+def probe_categories(pairs, run_row, fieldnames):
+    # Run each distinct (Type, Product Category, product row?) input through the stages once
+    outcomes = {}
+    for pair in pairs:
+        row = dict.fromkeys(fieldnames, "")
+        row.update(zip(CATEGORY_COLUMNS, pair))
+        if pair[-1]:
+            row["Title"] = "probe"
+        out = run_row(row)
+        outcomes[pair] = category_outcome(out) if out is not None else None
+    return outcomes
+
+
+def run_incremental(rows, fieldnames, run_row, stage_names, rules, category_stages=(), path=CACHE_PATH, stats=None,
+                    salt=None):
+    # Yields output rows in input order. `rules` maps stage name -> digest of its rule tables.
+    # salt(row), if given, is mixed into each row's fingerprint: output a row takes from
+    # catalog-wide state (the tag vocabulary) re-runs just the rows whose part of it changed.
+    # Rows whose fingerprint matches the cache are spliced from it. If only category-driven
+    # stages changed their rules, just the rows whose category outcome changes are recomputed;
+    # any other rule change recomputes everything. The cache is saved once the stream ends.
+    cache = load_cache(path)
+    if cache is not None and (cache["stages"] != list(stage_names) or cache["fieldnames"] != list(fieldnames)):
+        cache = None
+    old_rows = cache["rows"] if cache else {}
+    old_outcomes = cache["categories"] if cache else {}
+    affected = set()
+    if cache is not None:
+        changed_stages = {name for name in stage_names if cache["rules"].get(name) != rules.get(name)}
+        if changed_stages - set(category_stages):
+            old_rows = {}
+        elif changed_stages:
+            fresh = probe_categories(old_outcomes, run_row, fieldnames)
+            affected = {pair for pair, out in fresh.items() if out != old_outcomes[pair]}
+
+    stats = stats if stats is not None else {}
+    stats.update(spliced=0, recomputed=0, changed=0)
+    new_rows = {}
+    new_outcomes = {}
+    for key, row in row_keys(rows):
+        fp = row_fingerprint(row, fieldnames, salt(row) if salt else "")
+        pair = category_input(row)
+        hit = old_rows.get(key)
+        if hit is not None and hit[0] == fp and pair not in affected:
+            values = hit[1]
+            stats["spliced"] += 1
+        else:
+            out = run_row(row)
+            values = None if out is None else tuple(out.get(name, "") for name in fieldnames)
+            stats["recomputed"] += 1
+            if hit is None or hit[1] != values:
+                stats["changed"] += 1
+        new_rows[key] = (fp, values)
+        if values is None:
+            new_outcomes.setdefault(pair, None)
+            continue
+        out_row = dict(zip(fieldnames, values))
+        new_outcomes.setdefault(pair, category_outcome(out_row))
+        yield out_row
+
+    save_cache({
+        "format": FORMAT_VERSION,
+        "stages": list(stage_names),
+        "fieldnames": list(fieldnames),
+        "rules": dict(rules),
+        "rows": new_rows,
+        "categories": new_outcomes,
+    }, path)
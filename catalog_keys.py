@@ -0,0 +1,420 @@
+import argparse
+import csv
+import os
+import pickle
+import re
+import sys
+from array import array
+from collections import Counter, defaultdict
+
+from catalog_store import file_digest, split_record
+
+# Lookup index over the identifying columns of any catalog CSV. Keys are normalized
+# once, when the index is built, so the Shopify export ('817510 with a text marker),
+# the collections sheet (Product ID, Barcode) and a supplier list all meet on the same
+# values. The index keeps each record's byte span, so a hit reads just that record back
+# from the CSV instead of scanning it.
+
+# Bump when the index layout or key normalization changes; older indexes are rebuilt
+FORMAT_VERSION = 1
+
+# Key kind -> columns that may carry it, first one present in the header wins
+KEY_COLUMNS = {
+    "sku": ("Variant SKU", "SKU"),
+    "barcode": ("Variant Barcode", "Barcode"),
+    "handle": ("Handle",),
+    "product_id": ("Product ID", "ID"),
+}
+
+# Handles and product IDs name a product, so they are taken from product rows only
+# (see product_groups.is_head); SKUs and barcodes name variants and come from every row
+PRODUCT_KEYS = ("handle", "product_id")
+
+_DIGITS_RE = re.compile(r"[0-9]+(?:\.0+)?")
+_GID_RE = re.compile(r"^gid://shopify/Product/([0-9]+)$")
+
+
+def strip_text_marker(value):
+    # Spreadsheet exports keep SKUs/barcodes as text with a leading apostrophe
+    value = (value or "").strip()
+    return value[1:].strip() if value.startswith("'") else value
+
+
+def normalize_sku(value):
+    return strip_text_marker(value).upper()
+
+
+def normalize_barcode(value):
+    # Numeric barcodes as 14-digit GTINs, so UPC-A, EAN-13 and a spreadsheet's
+    # "5037835371000.0" agree; anything else is compared as upper-case text
+    value = strip_text_marker(value)
+    if _DIGITS_RE.fullmatch(value):
+        digits = value.split(".")[0]
+        if not digits.strip("0"):
+            return ""
+        return digits.zfill(14) if len(digits) <= 14 else digits
+    return value.upper()
+
+
+def normalize_handle(value):
+    return (value or "").strip().lower()
+
+
+def normalize_product_id(value):
+    value = strip_text_marker(value)
+    m = _GID_RE.match(value)
+    return m.group(1) if m else value
+
+
+NORMALIZERS = {
+    "sku": normalize_sku,
+    "barcode": normalize_barcode,
+    "handle": normalize_handle,
+    "product_id": normalize_product_id,
+}
+
+
+def normalize_key(kind, value):
+    return NORMALIZERS[kind](value)
+
+
+def key_columns(fieldnames):
+    # {kind: column} for the kinds this header carries
+    columns = {}
+    for kind, candidates in KEY_COLUMNS.items():
+        for name in candidates:
+            if name in fieldnames:
+                columns[kind] = name
+                break
+    return columns
+
+
+def row_keys(row, columns, product_row):
+    # (kind, normalized key) pairs of one row; empty keys are left out
+    for kind, column in columns.items():
+        if kind in PRODUCT_KEYS and not product_row:
+            continue
+        key = normalize_key(kind, row.get(column))
+        if key:
+            yield kind, key
+
+
+def is_product_row(row, fieldnames):
+    # A sheet without titles has one row per product
+    return bool(row.get("Title")) if "Title" in fieldnames else True
+
+
+def iter_spans(f):
+    # (offset, length, text) per CSV record of a binary file, BOM skipped. A record spans
+    # lines while its quote count is odd, as in catalog_store.iter_records; UTF-8 never
+    # puts a quote or newline byte inside a multi-byte character, so bytes are safe to scan.
+    offset = 3 if f.read(3) == b"\xef\xbb\xbf" else 0
+    f.seek(offset)
+    pending = []
+    odd = False
+    start = offset
+    for line in f:
+        pending.append(line)
+        offset += len(line)
+        if line.count(b'"') % 2:
+            odd = not odd
+        if odd:
+            continue
+        data = b"".join(pending)
+        yield start, len(data), data.decode("utf-8")
+        pending = []
+        start = offset
+    if pending:
+        raise ValueError("CSV ends inside a quoted field")
+
+
+def index_path_for(csv_path):
+    return os.path.splitext(csv_path)[0] + ".keys"
+
+
+class KeyIndex:
+    # {kind: {normalized key: [row numbers]}} for one CSV, plus the byte span of every
+    # row. Row numbers count data records from 0, header excluded.
+
+    def __init__(self, source, fieldnames, columns, keys, offsets, lengths, stamp):
+        self.source = source
+        self.fieldnames = fieldnames
+        self.columns = columns
+        self.keys = keys
+        self.offsets = offsets
+        self.lengths = lengths
+        self.stamp = stamp
+        self._file = None
+
+    @classmethod
+    def build(cls, path):
+        keys = defaultdict(dict)
+        offsets = array("Q")
+        lengths = array("I")
+        with open(path, "rb") as f:
+            spans = iter_spans(f)
+            try:
+                _, _, header = next(spans)
+            except StopIteration:
+                raise ValueError(f"{path} is empty")
+            fieldnames, _ = split_record(header)
+            columns = key_columns(fieldnames)
+            for offset, length, text in spans:
+                fields, _ = split_record(text)
+                if fields == [""]:
+                    continue
+                row = dict(zip(fieldnames, fields))
+                n = len(offsets)
+                offsets.append(offset)
+                lengths.append(length)
+                for kind, key in row_keys(row, columns, is_product_row(row, fieldnames)):
+                    keys[kind].setdefault(key, []).append(n)
+        return cls(path, fieldnames, columns, dict(keys), offsets, lengths, file_stamp(path))
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def rows(self, kind, value, normalized=False):
+        # Row numbers carrying value as kind; O(1)
+        if kind not in KEY_COLUMNS:
+            raise KeyError(f"Unknown key kind {kind!r} (known: {', '.join(KEY_COLUMNS)})")
+        key = value if normalized else normalize_key(kind, value)
+        return self.keys.get(kind, {}).get(key, [])
+
+    def record(self, n):
+        # Row n as a dict, read straight from its byte span in the CSV
+        if self._file is None:
+            self._file = open(self.source, "rb")
+        self._file.seek(self.offsets[n])
+        fields, _ = split_record(self._file.read(self.lengths[n]).decode("utf-8"))
+        return dict(zip(self.fieldnames, fields))
+
+    def get(self, kind, value):
+        return [self.record(n) for n in self.rows(kind, value)]
+
+    def find(self, value, kinds=None):
+        # (kind, rows) for the first kind in kinds (default: every kind) that has value
+        for kind in kinds or KEY_COLUMNS:
+            if kind in self.columns:
+                found = self.rows(kind, value)
+                if found:
+                    return kind, found
+        return None, []
+
+    def save(self, path=None):
+        path = path or index_path_for(self.source)
+        data = {
+            "format": FORMAT_VERSION,
+            "source": os.path.abspath(self.source),
+            "stamp": self.stamp,
+            "fieldnames": self.fieldnames,
+            "columns": self.columns,
+            "keys": self.keys,
+            "offsets": self.offsets,
+            "lengths": self.lengths,
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        return path
+
+
+def file_stamp(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns, file_digest(path)]
+
+
+def is_current(stamp, path):
+    # Size and mtime unchanged, or the content digest still matches
+    st = os.stat(path)
+    if stamp[0] == st.st_size and stamp[1] == st.st_mtime_ns:
+        return True
+    return stamp[0] == st.st_size and stamp[2] == file_digest(path)
+
+
+def load_index(csv_path, index_path=None, rebuild=False):
+    # The saved index of csv_path, rebuilt (and saved again) when missing, from an older
+    # format, or out of date with the CSV
+    index_path = index_path or index_path_for(csv_path)
+    if not rebuild and os.path.exists(index_path):
+        try:
+            with open(index_path, "rb") as f:
+                data = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            data = {}
+        if data.get("format") == FORMAT_VERSION and is_current(data["stamp"], csv_path):
+            return KeyIndex(csv_path, data["fieldnames"], data["columns"], data["keys"],
+                            data["offsets"], data["lengths"], data["stamp"])
+    index = KeyIndex.build(csv_path)
+    index.save(index_path)
+    return index
+
+
+def join_kinds(on, left_columns, right_columns):
+    kinds = [k.strip() for k in on.split(",") if k.strip()]
+    unknown = [k for k in kinds if k not in KEY_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown key kind(s): {', '.join(unknown)} (known: {', '.join(KEY_COLUMNS)})")
+    usable = [k for k in kinds if k in left_columns and k in right_columns]
+    if not usable:
+        raise ValueError(f"Neither file carries a common key among: {', '.join(kinds)}")
+    return usable
+
+
+def join(left_path, right, out_path, on="barcode,sku", how="inner", label=None):
+    # Streams the left CSV once and probes the right file's index for every row: the
+    # first kind in `on` with a match decides. Matched right columns are appended, renamed
+    # "<column> (<label>)" where the left file has the same column. how="left" also keeps
+    # unmatched left rows, with the right side blank.
+    label = label or os.path.splitext(os.path.basename(right.source))[0]
+    stats = Counter()
+    with open(left_path, "r", encoding="utf-8-sig", newline="") as f_in, \
+         open(out_path, "w", encoding="utf-8", newline="") as f_out:
+        reader = csv.DictReader(f_in)
+        left_fields = reader.fieldnames or []
+        left_columns = key_columns(left_fields)
+        kinds = join_kinds(on, left_columns, right.columns)
+        renamed = [f"{c} ({label})" if c in left_fields else c for c in right.fieldnames]
+        writer = csv.writer(f_out)
+        writer.writerow(left_fields + ["Matched On"] + renamed)
+        blank = [""] * len(renamed)
+        for row in reader:
+            stats["left_rows"] += 1
+            left = [row.get(c, "") for c in left_fields]
+            keys = dict(row_keys(row, left_columns, is_product_row(row, left_fields)))
+            matched = None
+            for kind in kinds:
+                if kind in keys:
+                    found = right.rows(kind, keys[kind], normalized=True)
+                    if found:
+                        matched = kind
+                        break
+            if matched is None:
+                stats["unmatched"] += 1
+                if how == "left":
+                    writer.writerow(left + [""] + blank)
+                continue
+            stats["matched"] += 1
+            stats["on:" + matched] += 1
+            if len(found) > 1:
+                stats["ambiguous"] += 1
+            for n in found:
+                record = right.record(n)
+                writer.writerow(left + [matched] + [record.get(c, "") for c in right.fieldnames])
+                stats["out_rows"] += 1
+    return stats
+
+
+def row_owner(index, n):
+    # The product a row belongs to: its handle, else its product ID, else the row itself.
+    # The same product listed in two files is one owner.
+    record = index.record(n)
+    for kind in PRODUCT_KEYS:
+        column = index.columns.get(kind)
+        key = normalize_key(kind, record.get(column)) if column else ""
+        if key:
+            return kind, key
+    return index.source, n
+
+
+def find_duplicates(indexes, kinds=("sku", "barcode")):
+    # {(kind, key): [(source, row number), ...]} for every SKU/barcode that sits on two
+    # rows of one file, or on different products across the files
+    seen = defaultdict(list)
+    for index in indexes:
+        for kind in kinds:
+            for key, rows in index.keys.get(kind, {}).items():
+                seen[(kind, key)].extend((index, n) for n in rows)
+    duplicates = {}
+    for key, places in seen.items():
+        if len(places) < 2:
+            continue
+        per_file = Counter(index.source for index, _ in places)
+        owners = {row_owner(index, n) for index, n in places}
+        if max(per_file.values()) > 1 or len(owners) > 1:
+            duplicates[key] = [(index.source, n) for index, n in places]
+    return duplicates
+
+
+def write_duplicates(duplicates, indexes, path):
+    by_source = {index.source: index for index in indexes}
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Kind", "Key", "File", "Record", "Handle", "Title"])
+        for (kind, key), places in sorted(duplicates.items()):
+            for source, n in places:
+                record = by_source[source].record(n)
+                # Records are numbered from 1 after the header, like a spreadsheet's data rows
+                writer.writerow([kind, key, source, n + 1, record.get("Handle", ""), record.get("Title", "")])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index catalog CSVs by SKU, barcode, handle and product ID; look up, join and find duplicates.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("build", help="(re)build the saved index of a CSV")
+    p.add_argument("csv")
+    p = sub.add_parser("lookup", help="rows of a CSV carrying a key")
+    p.add_argument("csv")
+    p.add_argument("value")
+    p.add_argument("--by", choices=tuple(KEY_COLUMNS), help="key kind (default: the first kind that matches)")
+    p = sub.add_parser("join", help="stream LEFT against the index of RIGHT")
+    p.add_argument("left")
+    p.add_argument("right")
+    p.add_argument("-o", "--out", required=True)
+    p.add_argument("--on", default="barcode,sku", help="key kinds to try in order (default: %(default)s)")
+    p.add_argument("--how", choices=("inner", "left"), default="inner")
+    p = sub.add_parser("duplicates", help="SKUs and barcodes carried by more than one row, across all files")
+    p.add_argument("csvs", nargs="+")
+    p.add_argument("-o", "--out", default="duplicate_keys.csv")
+    args = parser.parse_args()
+
+    try:
+        if args.command == "build":
+            index = load_index(args.csv, rebuild=True)
+            counts = ", ".join(f"{len(index.keys.get(k, {}))} {k}" for k in index.columns)
+            print(f"Indexed {len(index)} rows of {args.csv}: {counts} -> {index_path_for(args.csv)}")
+        elif args.command == "lookup":
+            with load_index(args.csv) as index:
+                kind, rows = (args.by, index.rows(args.by, args.value)) if args.by else index.find(args.value)
+                if not rows:
+                    print(f"No row of {args.csv} carries {args.value!r}")
+                    sys.exit(1)
+                for n in rows:
+                    record = index.record(n)
+                    shown = ", ".join(f"{c}={record.get(c, '')!r}" for c in index.columns.values())
+                    print(f"record {n + 1} ({kind}): {record.get('Title', '')!r} {shown}")
+        elif args.command == "join":
+            with load_index(args.right) as right:
+                stats = join(args.left, right, args.out, args.on, args.how)
+            on = ", ".join(f"{k[3:]} {v}" for k, v in sorted(stats.items()) if k.startswith("on:"))
+            print(f"Wrote {args.out}: {stats['matched']} of {stats['left_rows']} rows matched ({on or 'none'}), "
+                  f"{stats['ambiguous']} with several right rows, {stats['out_rows']} joined rows")
+        else:
+            indexes = [load_index(path) for path in args.csvs]
+            try:
+                duplicates = find_duplicates(indexes)
+                write_duplicates(duplicates, indexes, args.out)
+            finally:
+                for index in indexes:
+                    index.close()
+            per_kind = Counter(kind for kind, _ in duplicates)
+            print(f"{per_kind['sku']} duplicate SKUs, {per_kind['barcode']} duplicate barcodes -> {args.out}")
+    except (OSError, ValueError, KeyError) as e:
+        print(e)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+import argparse
+import csv
+import sys
+from collections import Counter
+from contextlib import ExitStack
+from functools import lru_cache
+
+import encoding_repair
+import normalize_categories
+import normalize_tags
+import translate_categories
+from catalog_cache import CACHE_PATH, digest, run_incremental
+from clean_categories import standardize_category
+from encoding_repair import REPAIR_REPORT, repair_row, repair_text
+from export_for_shopify import clear_category
+from map_to_taxonomy_simple import TYPE_TO_TAXONOMY, map_taxonomy
+from normalize_categories import normalize_category
+from normalize_tags import TagVocabulary
+from product_groups import is_head, product_stage
+from run_metrics import RunMetrics, add_arguments, from_args, profiled
+from translate_categories import translate_category
+
+SRC = "products_export_1.csv"
+OUT = "products_for_shopify.csv"
+
+# seed -> normalize -> translate reproduces products_final.csv from the raw export;
+# repair runs first so every later stage sees properly decoded text, and tags + export
+# then match export_for_shopify.py
+DEFAULT_STAGES = ["repair", "seed", "normalize", "translate", "tags", "export"]
+
+
+def read_fieldnames(path):
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        return next(csv.reader(f), [])
+
+
+def iter_rows(path):
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        yield from csv.DictReader(f)
+
+
+def seed_category(row):
+    # Raw exports carry the shop's own category in Type; Product Category is empty or
+    # an earlier Shopify taxonomy guess, so the category chain always starts from Type
+    row["Product Category"] = row.get("Type", "")
+    return row
+
+
+def category_stage(fn):
+    # Wrap a str -> str category function the way the standalone scripts apply it
+    def stage(row):
+        cat = fn(row.get("Product Category", ""))
+        row["Product Category"] = cat
+        row["Type"] = cat  # Make Type match Category exactly
+        return row
+    stage.__name__ = fn.__name__
+    return stage
+
+
+def taxonomy_stage(row):
+    row["Product Category"] = map_taxonomy(row.get("Type", ""))
+    return row
+
+
+# Set through use_tag_vocabulary() before a run that includes the tags stage
+TAG_VOCABULARY = TagVocabulary()
+
+
+def use_tag_vocabulary(vocab):
+    global TAG_VOCABULARY
+    TAG_VOCABULARY = vocab
+
+
+def tags_stage(row):
+    return TAG_VOCABULARY.normalize_row(row)
+
+
+def tags_input(stage_names):
+    # Tags as they reach the tags stage, from the raw cell. Of the stages before it only
+    # repair touches the column, so the vocabulary never needs the other stages run.
+    if "repair" in stage_names[:stage_names.index("tags")] and "Tags" in encoding_repair.TEXT_COLUMNS:
+        return lru_cache(maxsize=None)(repair_text)
+    return lambda cell: cell
+
+
+def count_tag_cells(records, header):
+    # {raw Tags cell: products carrying it} over csv.reader records; only product rows
+    # (those with a Title) carry tags
+    if "Title" not in header or "Tags" not in header:
+        return Counter()
+    title, tags = header.index("Title"), header.index("Tags")
+    width = max(title, tags)
+    return Counter(r[tags] for r in records if len(r) > width and r[title])
+
+
+def vocabulary_from(cells, tags_in):
+    vocab = TagVocabulary()
+    for cell, n in cells.items():
+        vocab.add(tags_in(cell), n)
+    return vocab
+
+
+def prepare_tags(src, stage_names, tags_in=None):
+    # First pass for the tags stage: the canonical spelling of a tag depends on how the
+    # whole catalog spells it, so every product's Tags cell is counted before any row
+    # is written. Reads the Title and Tags columns only.
+    with open(src, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        cells = count_tag_cells(reader, next(reader, []))
+    return vocabulary_from(cells, tags_in or tags_input(stage_names))
+
+
+# Category stages run once per product, on its first row; variant and image rows keep
+# their blank product columns
+STAGES = {
+    "repair": repair_row,
+    "seed": product_stage(seed_category),
+    "translate": product_stage(category_stage(translate_category)),
+    "standardize": product_stage(category_stage(standardize_category)),
+    "normalize": product_stage(category_stage(normalize_category)),
+    "taxonomy": product_stage(taxonomy_stage),
+    "tags": tags_stage,
+    "export": clear_category,
+}
+
+# Rule tables behind each stage; a change here invalidates cached results in --incremental mode
+RULE_TABLES = {
+    "repair": lambda: (encoding_repair.TEXT_COLUMNS, encoding_repair.MAX_ROUNDS),
+    "seed": lambda: (),
+    "translate": lambda: (translate_categories.translations,),
+    "standardize": lambda: (standardize_category.__code__.co_code, standardize_category.__code__.co_consts),
+    "normalize": lambda: (normalize_categories.SEGMENT_TRANSLATIONS, normalize_categories.WHOLE_REPLACEMENTS),
+    "taxonomy": lambda: (TYPE_TO_TAXONOMY,),
+    # The vocabulary itself is not a rule table: --incremental keys each product row on
+    # its rendered tags instead (see tags_salt), so a re-spelled tag re-runs only its rows
+    "tags": lambda: (normalize_tags.TAG_TRANSLATIONS,),
+    "export": lambda: (),
+}
+
+# Stages whose output depends only on the Type / Product Category columns
+CATEGORY_STAGES = {"seed", "translate", "standardize", "normalize", "taxonomy", "export"}
+
+
+def tags_salt(tags_in):
+    # Extra cache key per row: the tags it renders to under the current vocabulary
+    def salt(row):
+        return TAG_VOCABULARY.normalize(tags_in(row.get("Tags", ""))) if is_head(row) else ""
+    return salt
+
+
+def rules_digests(names):
+    return {name: digest(RULE_TABLES[name]()) for name in names}
+
+
+def tap_stage(writer):
+    # Debug tap: writes the row as it looks at this point and passes it on
+    def stage(row):
+        writer.writerow(row)
+        return row
+    return stage
+
+
+def build_stages(names, taps=None, fieldnames=None, stack=None, metrics=None):
+    # taps maps a stage name to a CSV path written right after that stage runs
+    taps = taps or {}
+    metrics = metrics or RunMetrics("pipeline")
+    unknown = [n for n in list(names) + list(taps) if n not in STAGES]
+    if unknown:
+        raise ValueError(f"Unknown stage(s): {', '.join(unknown)} (known: {', '.join(STAGES)})")
+    missing = [n for n in taps if n not in names]
+    if missing:
+        raise ValueError(f"Tap on stage(s) not in the pipeline: {', '.join(missing)}")
+    stages = []
+    for name in names:
+        stages.append(metrics.wrap(name, STAGES[name]))
+        if name in taps:
+            f = stack.enter_context(open(taps[name], "w", encoding="utf-8", newline=""))
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            stages.append(tap_stage(writer))
+    return stages
+
+
+def apply_stages(rows, stages):
+    # A stage may return None to drop the row
+    for row in rows:
+        for stage in stages:
+            row = stage(row)
+            if row is None:
+                break
+        else:
+            yield row
+
+
+def write_rows(path, fieldnames, rows, metrics=None):
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writerow = metrics.wrap("csv_write", writer.writerow) if metrics else writer.writerow
+        for row in rows:
+            writerow(row)
+            count += 1
+    return count
+
+
+def apply_stages_counted(rows, stages, metrics):
+    # apply_stages plus counters for rows whose category columns the stages change
+    for row in rows:
+        metrics.count("rows")
+        before = (row.get("Type", ""), row.get("Product Category", ""))
+        out = next(apply_stages([row], stages), None)
+        if out is None:
+            metrics.count("rows_dropped")
+            continue
+        if (out.get("Type", ""), out.get("Product Category", "")) != before:
+            metrics.count("rows_changed")
+        yield out
+
+
+def count_repairs(metrics):
+    for col, n in REPAIR_REPORT.items():
+        metrics.count(f"repaired:{col}", n)
+
+
+def run_pipeline(src=SRC, out=OUT, stage_names=DEFAULT_STAGES, taps=None, incremental=None, stats=None, metrics=None):
+    # incremental: cache path; unchanged rows are spliced from the previous run
+    metrics = metrics or RunMetrics("pipeline")
+    fieldnames = read_fieldnames(src)
+    with ExitStack() as stack:
+        stages = build_stages(stage_names, taps, fieldnames, stack, metrics)
+        metrics.watch_cache("normalize_category", normalize_category)
+        tags_in = tags_input(stage_names) if "tags" in stage_names else None
+        if tags_in:
+            use_tag_vocabulary(prepare_tags(src, stage_names, tags_in))
+        REPAIR_REPORT.clear()
+        source = metrics.iterate("csv_parse", iter_rows(src))
+        if not incremental:
+            rows = apply_stages_counted(source, stages, metrics) if metrics.enabled else apply_stages(source, stages)
+            count = write_rows(out, fieldnames, rows, metrics)
+            count_repairs(metrics)
+            return count
+        if taps:
+            raise ValueError("--tap cannot be combined with --incremental (spliced rows skip the stages)")
+
+        def run_row(row):
+            return next(apply_stages([row], stages), None)
+
+        stats = stats if stats is not None else {}
+        rows = run_incremental(source, fieldnames, run_row, stage_names, rules_digests(stage_names),
+                               CATEGORY_STAGES, incremental, stats, tags_salt(tags_in) if tags_in else None)
+        count = write_rows(out, fieldnames, rows, metrics)
+        count_repairs(metrics)
+        for key in ("spliced", "recomputed", "changed"):
+            metrics.count(f"rows_{key}", stats[key])
+        return count
+
+
+def parse_taps(values):
+    taps = {}
+    for value in values or []:
+        name, sep, path = value.partition("=")
+        if not sep or not path:
+            raise ValueError(f"Bad --tap {value!r}, expected STAGE=PATH")
+        taps[name] = path
+    return taps
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the catalog transforms as one streaming pass.")
+    parser.add_argument("--src", default=SRC)
+    parser.add_argument("--out", default=OUT)
+    parser.add_argument("--stages", default=",".join(DEFAULT_STAGES),
+                        help=f"comma-separated stages, known: {', '.join(STAGES)}")
+    parser.add_argument("--tap", action="append", metavar="STAGE=PATH",
+                        help="also write the rows as they leave STAGE (e.g. translate=products_final.csv)")
+    parser.add_argument("--incremental", nargs="?", const=CACHE_PATH, metavar="CACHE",
+                        help=f"only reprocess rows whose input or rules changed (cache: {CACHE_PATH})")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    stats = {}
+    metrics = from_args("catalog_pipeline", args)
+    try:
+        stage_names = [s.strip() for s in args.stages.split(",") if s.strip()]
+        with profiled(args.profile):
+            count = run_pipeline(args.src, args.out, stage_names, parse_taps(args.tap), args.incremental, stats, metrics)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+    print(f"Wrote {args.out} ({count} rows) via {' -> '.join(stage_names)}.")
+    if metrics.write():
+        print(f"Wrote {metrics.report_path}")
+    if REPAIR_REPORT:
+        fixed = ", ".join(f"{col} {n}" for col, n in REPAIR_REPORT.most_common())
+        print(f"Repaired double-encoded text: {fixed}.")
+    if args.incremental:
+        print(f"Incremental: {stats['spliced']} spliced, {stats['recomputed']} recomputed, {stats['changed']} changed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,511 @@
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from collections import Counter
+
+MAGIC = b"CATSTOR1"
+FORMAT_VERSION = 1
+ALIGN = 8
+BATCH_ROWS = 4096
+
+# int64 slot meaning "empty cell" in numeric columns
+EMPTY = -(1 << 63)
+# Largest magnitude a numeric cell may scale to; EMPTY itself is reserved
+INT64_MAX = (1 << 63) - 1
+
+# Raw text of each CSV field in a record, quotes included
+_FIELD_RE = re.compile(r'(?:^|,)("[^"]*(?:""[^"]*)*"|[^,"\r\n]*)')
+# Canonical numbers only, so rendering the stored value gives the original text back
+_NUMBER_RE = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.([0-9]+))?")
+
+
+def store_path_for(csv_path):
+    return os.path.splitext(csv_path)[0] + ".catstore"
+
+
+def file_digest(path):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def iter_records(f):
+    # Yields (fields, layout) per CSV record. layout keeps what csv.reader throws away:
+    # which fields were quoted ("q"/"-" per field) and the record terminator, so a row
+    # renders back byte for byte. A record spans lines while its quote count is odd.
+    pending = []
+    odd = False
+    for line in f:
+        pending.append(line)
+        if line.count('"') % 2:
+            odd = not odd
+        if odd:
+            continue
+        yield split_record("".join(pending))
+        pending = []
+    if pending:
+        raise ValueError("CSV ends inside a quoted field")
+
+
+def split_record(text):
+    body = text.rstrip("\r\n")
+    raws = _FIELD_RE.findall(body)
+    if sum(map(len, raws)) + len(raws) - 1 != len(body):
+        raise ValueError(f"Malformed CSV record: {body[:80]!r}")
+    fields = [r[1:-1].replace('""', '"') if r[:1] == '"' else r for r in raws]
+    flags = ["q" if r[:1] == '"' else "-" for r in raws]
+    return fields, "".join(flags) + text[len(body):]
+
+
+def render_record(fields, layout):
+    out = []
+    for value, flag in zip(fields, layout):
+        out.append('"' + value.replace('"', '""') + '"' if flag == "q" else value)
+    return ",".join(out) + layout[len(fields):]
+
+
+def numeric_scale(values):
+    # Decimal places shared by every non-empty value, or None if the column is not
+    # purely numeric (SKUs with a leading apostrophe, "01", mixed "1.5"/"1.50", ...)
+    # or a scaled value does not fit an int64 (20-digit IDs); those stay dictionary-encoded
+    scale = None
+    seen = False
+    for v in values:
+        if v == "":
+            continue
+        m = _NUMBER_RE.fullmatch(v)
+        if not m or v == "-0" or v.startswith("-0.") and not v.strip("-0."):
+            return None
+        digits = len(m.group(1)) if m.group(1) is not None else 0
+        if scale is None:
+            scale = digits
+        elif digits != scale:
+            return None
+        if abs(parse_scaled(v, scale)) > INT64_MAX:
+            return None
+        seen = True
+    return scale if seen else None
+
+
+def parse_scaled(v, scale):
+    if v == "":
+        return EMPTY
+    if not scale:
+        return int(v)
+    whole, _, frac = v.partition(".")
+    n = int(whole.lstrip("-") + frac)
+    return -n if v.startswith("-") else n
+
+
+def format_scaled(n, scale):
+    if n == EMPTY:
+        return ""
+    if not scale:
+        return str(n)
+    sign = "-" if n < 0 else ""
+    digits = str(abs(n)).rjust(scale + 1, "0")
+    return f"{sign}{digits[:-scale]}.{digits[-scale:]}"
+
+
+def code_type(n_values):
+    return "B" if n_values <= 0xFF else "H" if n_values <= 0xFFFF else "I"
+
+
+class _Segments:
+    # Collects aligned binary segments; offsets are relative to the data section
+
+    def __init__(self):
+        self.parts = []
+        self.size = 0
+
+    def add(self, data):
+        data = bytes(data)
+        offset = self.size
+        pad = -len(data) % ALIGN
+        self.parts.append(data + b"\0" * pad)
+        self.size += len(data) + pad
+        return [offset, len(data)]
+
+
+class _ColumnBuilder:
+    def __init__(self):
+        self.ids = {}
+        self.codes = array("I")
+
+    def extend(self, values):
+        ids = self.ids
+        self.codes.extend([ids.setdefault(v, len(ids)) for v in values])
+
+    def encode(self, segments, numeric=True):
+        values = list(self.ids)
+        scale = numeric_scale(values) if numeric else None
+        if scale is not None:
+            parsed = [parse_scaled(v, scale) for v in values]
+            return {"kind": "number", "scale": scale,
+                    "values": segments.add(array("q", (parsed[c] for c in self.codes)).tobytes())}
+        return encode_dictionary(values, self.codes, segments)
+
+
+def encode_dictionary(values, codes, segments):
+    blob = bytearray()
+    offsets = array("I", [0])
+    for v in values:
+        blob += v.encode("utf-8")
+        offsets.append(len(blob))
+    typecode = code_type(len(values))
+    return {"kind": "dict", "size": len(values), "typecode": typecode,
+            "codes": segments.add(array(typecode, codes).tobytes()),
+            "offsets": segments.add(offsets.tobytes()),
+            "blob": segments.add(blob)}
+
+
+def _flush(batch, batch_layouts, builders, layouts):
+    # Rows are transposed in batches so each column is encoded in one tight loop
+    if batch:
+        for builder, values in zip(builders, zip(*batch)):
+            builder.extend(values)
+        layouts.extend(batch_layouts)
+        batch.clear()
+        batch_layouts.clear()
+
+
+def build_store(src, path=None, verify=True):
+    # Columnar copy of a CSV: every column dictionary-encoded, purely numeric columns
+    # (prices, grams, positions) as int64 arrays with a fixed number of decimals
+    path = path or store_path_for(src)
+    with open(src, "rb") as f:
+        bom = f.read(3) == b"\xef\xbb\xbf"
+    with open(src, "r", encoding="utf-8-sig", newline="") as f:
+        records = iter_records(f)
+        fieldnames, header_layout = next(records, ([], ""))
+        builders = [_ColumnBuilder() for _ in fieldnames]
+        layouts = _ColumnBuilder()
+        blank_lines = []
+        rows = 0
+        batch, batch_layouts = [], []
+        for fields, layout in records:
+            if fields == [""] and len(fieldnames) > 1:
+                # Blank line (csv.DictReader skips these); kept by position for the round trip
+                blank_lines.append([rows, layout[1:]])
+                continue
+            if len(fields) != len(fieldnames):
+                raise ValueError(f"Row {rows + 2} of {src} has {len(fields)} fields, expected {len(fieldnames)}")
+            batch.append(fields)
+            batch_layouts.append(layout)
+            rows += 1
+            if len(batch) == BATCH_ROWS:
+                _flush(batch, batch_layouts, builders, layouts)
+        _flush(batch, batch_layouts, builders, layouts)
+
+    segments = _Segments()
+    columns = {name: builder.encode(segments) for name, builder in zip(fieldnames, builders)}
+    st = os.stat(src)
+    header = {
+        "version": FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "rows": rows,
+        "fieldnames": fieldnames,
+        "header_layout": header_layout,
+        "bom": bom,
+        "blank_lines": blank_lines,
+        "columns": columns,
+        "layouts": layouts.encode(segments, numeric=False),
+        "source": {"path": os.path.abspath(src), "size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                   "digest": file_digest(src)},
+    }
+    raw = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    raw += b" " * (-(len(MAGIC) + 8 + len(raw)) % ALIGN)
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(raw)))
+        f.write(raw)
+        for part in segments.parts:
+            f.write(part)
+    if verify:
+        with CatalogStore(tmp) as store:
+            if store.csv_digest() != header["source"]["digest"]:
+                os.remove(tmp)
+                raise ValueError(f"{src} does not round-trip through the store")
+    os.replace(tmp, path)
+    return path
+
+
+class DictColumn:
+    # Codes into a dictionary of distinct values, both read straight from the mapped file
+
+    def __init__(self, name, data, meta):
+        self.name = name
+        self.codes = _view(data, meta["codes"], meta["typecode"])
+        self._offsets = _view(data, meta["offsets"], "I")
+        self._blob = _view(data, meta["blob"], "B")
+        self._dictionary = None
+
+    @property
+    def dictionary(self):
+        if self._dictionary is None:
+            off, blob = self._offsets, self._blob
+            self._dictionary = [bytes(blob[off[i]:off[i + 1]]).decode("utf-8") for i in range(len(off) - 1)]
+        return self._dictionary
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, i):
+        return self.dictionary[self.codes[i]]
+
+    def __iter__(self):
+        dictionary = self.dictionary
+        return (dictionary[c] for c in self.codes)
+
+    def value_counts(self):
+        # Counted on the code array; strings are only decoded for distinct values
+        dictionary = self.dictionary
+        return Counter({dictionary[code]: n for code, n in Counter(self.codes).items()})
+
+
+class NumberColumn:
+    # Fixed-point int64 values, rendered back to their original text
+
+    def __init__(self, name, data, meta):
+        self.name = name
+        self.scale = meta["scale"]
+        self.values = _view(data, meta["values"], "q")
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, i):
+        return format_scaled(self.values[i], self.scale)
+
+    def __iter__(self):
+        scale = self.scale
+        return (format_scaled(v, scale) for v in self.values)
+
+    def value_counts(self):
+        scale = self.scale
+        return Counter({format_scaled(v, scale): n for v, n in Counter(self.values).items()})
+
+
+def _view(data, segment, typecode):
+    offset, length = segment
+    return data[offset:offset + length].cast(typecode)
+
+
+class CatalogStore:
+    # Read-only, memory-mapped view of a store written by build_store(). Columns are
+    # decoded lazily, so an aggregation only pages in the columns it reads.
+
+    def __init__(self, path):
+        self.path = path
+        self._f = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._f.close()
+            raise ValueError(f"{path} is empty, not a catalog store")
+        view = memoryview(self._mm)
+        if view[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a catalog store")
+        (header_len,) = struct.unpack_from("<Q", view, len(MAGIC))
+        start = len(MAGIC) + 8
+        self.header = json.loads(bytes(view[start:start + header_len]).decode("utf-8"))
+        if self.header.get("version") != FORMAT_VERSION or self.header.get("byteorder") != sys.byteorder:
+            self.close()
+            raise ValueError(f"{path} was written by an incompatible store version or byte order")
+        self._data = view[start + header_len:]
+        self._columns = {}
+        self.fieldnames = self.header["fieldnames"]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        # Views into the map must be released before it can close
+        self._columns = {}
+        self._data = None
+        if getattr(self, "_mm", None) is not None:
+            try:
+                self._mm.close()
+            except BufferError:
+                pass
+        self._f.close()
+
+    def __len__(self):
+        return self.header["rows"]
+
+    def column(self, name):
+        col = self._columns.get(name)
+        if col is None:
+            meta = self.header["columns"].get(name)
+            if meta is None:
+                raise KeyError(f"No column {name!r} in {self.path}")
+            cls = NumberColumn if meta["kind"] == "number" else DictColumn
+            col = self._columns[name] = cls(name, self._data, meta)
+        return col
+
+    def value_counts(self, name):
+        return self.column(name).value_counts()
+
+    def iter_rows(self, columns=None):
+        # Dicts like csv.DictReader, restricted to `columns` when given
+        names = list(columns or self.fieldnames)
+        cols = [iter(self.column(n)) for n in names]
+        for values in zip(*cols):
+            yield dict(zip(names, values))
+
+    def iter_csv(self):
+        # The source file's text, record by record (without the BOM)
+        yield render_record(self.fieldnames, self.header["header_layout"])
+        layouts = DictColumn("layout", self._data, self.header["layouts"])
+        cols = [iter(self.column(n)) for n in self.fieldnames]
+        blanks = iter(self.header["blank_lines"])
+        blank = next(blanks, None)
+        for row, (fields, layout) in enumerate(zip(zip(*cols), layouts)):
+            while blank and blank[0] == row:
+                yield blank[1]
+                blank = next(blanks, None)
+            yield render_record(fields, layout)
+        while blank:
+            yield blank[1]
+            blank = next(blanks, None)
+
+    def to_csv(self, path):
+        with open(path, "w", encoding="utf-8-sig" if self.header["bom"] else "utf-8", newline="") as f:
+            f.writelines(self.iter_csv())
+        return path
+
+    def csv_digest(self):
+        h = hashlib.blake2b(digest_size=16)
+        if self.header["bom"]:
+            h.update(b"\xef\xbb\xbf")
+        for record in self.iter_csv():
+            h.update(record.encode("utf-8"))
+        return h.hexdigest()
+
+    def stale(self):
+        # True when the source CSV changed since the store was built
+        src = self.header["source"]
+        try:
+            st = os.stat(src["path"])
+        except OSError:
+            return False
+        return (st.st_size, st.st_mtime_ns) != (src["size"], src["mtime_ns"])
+
+
+def open_store(path):
+    # For the report scripts: warn (but carry on) when the store is older than its CSV
+    store = CatalogStore(path)
+    if store.stale():
+        print(f"Warning: {store.header['source']['path']} changed since {path} was built; "
+              f"rebuild with: python catalog_store.py build {store.header['source']['path']}")
+    return store
+
+
+def describe(store):
+    lines = [f"{store.path}: {len(store)} rows x {len(store.fieldnames)} columns "
+             f"(from {store.header['source']['path']})"]
+    for name in store.fieldnames:
+        meta = store.header["columns"][name]
+        if meta["kind"] == "number":
+            lines.append(f"  {name:<45} number, {meta['scale']} decimals")
+        else:
+            lines.append(f"  {name:<45} dict, {meta['size']} distinct ({meta['typecode']} codes)")
+    return "\n".join(lines)
+
+
+# Columns that must round-trip and the encoding each must get, for `selftest`
+SELFTEST_COLUMNS = {
+    "Price": (["19.90", "", "-5.00", "1234567.50"], "number"),
+    "Int64 Max": ([str(INT64_MAX), str(-INT64_MAX), "0"], "number"),
+    "Long ID": (["12345678901234567890", "1"], "dict"),
+    "Int64 Min": ([str(EMPTY), "1"], "dict"),
+    "Long Decimal": (["92233720368547758.08", "0.01"], "dict"),
+    "SKU": (["'0123", "00123", "-0"], "dict"),
+}
+
+
+def selftest():
+    # Builds a store from edge-case columns in a temporary directory; returns the failures
+    import tempfile
+    fieldnames = list(SELFTEST_COLUMNS)
+    depth = max(len(values) for values, _ in SELFTEST_COLUMNS.values())
+    rows = [[SELFTEST_COLUMNS[name][0][i] if i < len(SELFTEST_COLUMNS[name][0]) else "" for name in fieldnames]
+            for i in range(depth)]
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "selftest.csv")
+        with open(src, "w", encoding="utf-8", newline="") as f:
+            f.write("\n".join(",".join(r) for r in [fieldnames] + rows) + "\n")
+        try:
+            path = build_store(src)
+        except (OverflowError, ValueError) as e:
+            return [f"build failed: {type(e).__name__}: {e}"]
+        with CatalogStore(path) as store:
+            for name, (values, kind) in SELFTEST_COLUMNS.items():
+                got = store.header["columns"][name]["kind"]
+                if got != kind:
+                    failures.append(f"{name}: encoded as {got}, expected {kind}")
+                stored = list(store.column(name))[:len(values)]
+                if stored != values:
+                    failures.append(f"{name}: read back {stored}, expected {values}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Columnar, memory-mapped copies of the product CSVs.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("build", help="build a store from a CSV (checked to round-trip exactly)")
+    p.add_argument("src")
+    p.add_argument("store", nargs="?", help="default: SRC with a .catstore suffix")
+    p = sub.add_parser("export", help="write the store back to CSV")
+    p.add_argument("store")
+    p.add_argument("out")
+    p = sub.add_parser("info", help="show columns and their encodings")
+    p.add_argument("store")
+    p = sub.add_parser("counts", help="value counts of one column")
+    p.add_argument("store")
+    p.add_argument("column")
+    sub.add_parser("selftest", help="round-trip edge-case columns (int64 bounds, long IDs) through a store")
+    args = parser.parse_args()
+
+    try:
+        if args.command == "selftest":
+            failures = selftest()
+            for failure in failures:
+                print(failure)
+            print("selftest failed" if failures else f"selftest passed ({len(SELFTEST_COLUMNS)} columns)")
+            sys.exit(1 if failures else 0)
+        if args.command == "build":
+            path = build_store(args.src, args.store)
+            print(f"Wrote {path} ({os.path.getsize(path)} bytes, source {os.path.getsize(args.src)} bytes)")
+            return
+        with CatalogStore(args.store) as store:
+            if args.command == "export":
+                store.to_csv(args.out)
+                print(f"Wrote {args.out} ({len(store)} rows)")
+            elif args.command == "info":
+                print(describe(store))
+            else:
+                for value, n in store.value_counts(args.column).most_common():
+                    print(f"{n:>8}  {value}")
+    except (OSError, ValueError, KeyError) as e:
+        print(e)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import Counter
+
+from catalog_store import open_store
+from product_groups import VARIANT_COLUMNS, Product, is_head, iter_products
+
+# Counts over the full " > " category tree of a catalog, built in one streaming pass.
+# Every node carries the totals of its whole subtree (products, variants, vendors,
+# statuses, price bands) plus the products filed on the node itself. Cubes of separate
+# files or shards add up with merge(), and the category reports are rendered from a
+# cube instead of each script re-counting the CSV its own way.
+#
+# A shard cut at an arbitrary record can split one product's rows between two cubes.
+# Each cube therefore keeps the rows of its last product (its tail) and holds back any
+# leading rows without a product row (its lead); merge() recounts the tail with the
+# next cube's lead when their handles match, so the product is counted once, under its
+# own category, with all of its variants.
+
+CATEGORY_COLUMN = "Product Category"
+SEPARATOR = " > "
+NO_SUBCATEGORY = "(No subcategory)"
+
+# Upper bounds of the price bands; a product falls in the band of its lowest variant price
+PRICE_BANDS = (25, 50, 100, 250, 500, 1000, 2500, 5000)
+NO_PRICE = "(no price)"
+
+# Bump when the serialized layout changes; older cube files are refused
+FORMAT_VERSION = 2
+
+
+def category_path(category):
+    # Segments with their whitespace trimmed; empty segments (and empty categories) drop out
+    return tuple(p.strip() for p in (category or "").split(SEPARATOR) if p.strip())
+
+
+def band_labels(bands=PRICE_BANDS):
+    labels = [f"<{bands[0]}"]
+    labels.extend(f"{lo}-{hi}" for lo, hi in zip(bands, bands[1:]))
+    labels.append(f"{bands[-1]}+")
+    return labels + [NO_PRICE]
+
+
+def price_band(price, bands=PRICE_BANDS):
+    if price is None:
+        return NO_PRICE
+    lower = None
+    for upper in bands:
+        if price < upper:
+            return f"{lower}-{upper}" if lower is not None else f"<{upper}"
+        lower = upper
+    return f"{lower}+"
+
+
+def lowest_price(variants):
+    prices = []
+    for row in variants:
+        try:
+            prices.append(float(row.get("Variant Price") or ""))
+        except ValueError:
+            pass
+    return min(prices) if prices else None
+
+
+class CubeNode:
+    __slots__ = ("children", "own", "products", "variants", "vendors", "statuses", "prices")
+
+    def __init__(self):
+        self.children = {}
+        self.own = 0
+        self.products = 0
+        self.variants = 0
+        self.vendors = Counter()
+        self.statuses = Counter()
+        self.prices = Counter()
+
+    def child(self, name):
+        node = self.children.get(name)
+        if node is None:
+            node = self.children[name] = CubeNode()
+        return node
+
+    def merge(self, other):
+        self.own += other.own
+        self.products += other.products
+        self.variants += other.variants
+        self.vendors.update(other.vendors)
+        self.statuses.update(other.statuses)
+        self.prices.update(other.prices)
+        for name, node in other.children.items():
+            self.child(name).merge(node)
+
+    def to_dict(self):
+        return {
+            "own": self.own,
+            "products": self.products,
+            "variants": self.variants,
+            "vendors": dict(self.vendors),
+            "statuses": dict(self.statuses),
+            "prices": dict(self.prices),
+            "children": {name: node.to_dict() for name, node in sorted(self.children.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        node = cls()
+        node.own = data["own"]
+        node.products = data["products"]
+        node.variants = data["variants"]
+        node.vendors = Counter(data["vendors"])
+        node.statuses = Counter(data["statuses"])
+        node.prices = Counter(data["prices"])
+        node.children = {name: cls.from_dict(child) for name, child in data["children"].items()}
+        return node
+
+
+def decrement(counter, key):
+    counter[key] -= 1
+    if not counter[key]:
+        del counter[key]
+
+
+class CategoryCube:
+    # The root holds the catalog totals; products without a category are its own count
+
+    def __init__(self, column=CATEGORY_COLUMN):
+        self.column = column
+        self.root = CubeNode()
+        self.lead = None
+        self.tail = None
+
+    def add(self, product):
+        # One product (a product_groups.Product); variant and image rows are counted
+        # through it, never as products of their own. Rows before the first product row
+        # continue a product of the previous shard and wait for merge().
+        if self.tail is None and self.lead is None and not is_head(product.head):
+            self.lead = product
+            return
+        self.count(product)
+        self.tail = product
+
+    def count(self, product):
+        variants = product.variants
+        vendor = product.get("Vendor") or ""
+        status = product.get("Status") or ""
+        band = price_band(lowest_price(variants))
+        node = self.root
+        for name in (None,) + category_path(product.get(self.column)):
+            if name is not None:
+                node = node.child(name)
+            node.products += 1
+            node.variants += len(variants)
+            node.vendors[vendor] += 1
+            node.statuses[status] += 1
+            node.prices[band] += 1
+        node.own += 1
+
+    def uncount(self, product):
+        # Exact inverse of count(); nodes left without products are dropped
+        variants = product.variants
+        band = price_band(lowest_price(variants))
+        path = category_path(product.get(self.column))
+        nodes = [self.root]
+        for name in path:
+            nodes.append(nodes[-1].children[name])
+        for node in nodes:
+            node.products -= 1
+            node.variants -= len(variants)
+            decrement(node.vendors, product.get("Vendor") or "")
+            decrement(node.statuses, product.get("Status") or "")
+            decrement(node.prices, band)
+        nodes[-1].own -= 1
+        for parent, name, node in reversed(list(zip(nodes, path, nodes[1:]))):
+            if not node.products:
+                del parent.children[name]
+
+    def update(self, products):
+        for product in products:
+            self.add(product)
+        return self
+
+    def merge(self, other):
+        # other covers the rows right after this cube's, as the shards of one file in order
+        if other.column != self.column:
+            raise ValueError(f"Cannot merge a cube over {other.column!r} into one over {self.column!r}")
+        tail = self.tail
+        self.root.merge(other.root)
+        if other.lead is not None:
+            if tail is not None and tail.handle == other.lead.handle:
+                self.uncount(tail)
+                tail = Product(tail.handle, tail.rows + other.lead.rows)
+                self.count(tail)
+            elif self.lead is None and tail is None:
+                self.lead = other.lead
+            else:
+                # Rows without a product row of their own, as read_cube() of the whole file counts them
+                self.count(other.lead)
+        if other.tail is not None:
+            tail = other.tail
+        self.tail = tail
+        return self
+
+    def find(self, category):
+        node = self.root
+        for name in category_path(category):
+            node = node.children.get(name)
+            if node is None:
+                return None
+        return node
+
+    def walk(self, max_depth=None):
+        # (path, node) depth-first, children in name order; the root is path ()
+        stack = [((), self.root)]
+        while stack:
+            path, node = stack.pop()
+            yield path, node
+            if max_depth is None or len(path) < max_depth:
+                for name in sorted(node.children, reverse=True):
+                    stack.append((path + (name,), node.children[name]))
+
+    def categories(self):
+        # {category: products filed exactly there}, like counting the column per product
+        return Counter({SEPARATOR.join(path): node.own for path, node in self.walk() if node.own})
+
+    def main_subcategories(self):
+        # {main category: {subcategory: products}}; deeper categories count under their
+        # second level, products on a main category itself under NO_SUBCATEGORY
+        tree = {}
+        for main, node in self.root.children.items():
+            subs = {name: child.products for name, child in node.children.items()}
+            if node.own:
+                subs[NO_SUBCATEGORY] = subs.get(NO_SUBCATEGORY, 0) + node.own
+            tree[main] = subs
+        return tree
+
+    def edge_to_dict(self, product):
+        # Only the columns count() reads are kept for the next merge()
+        if product is None:
+            return None
+        columns = ("Title", self.column, "Vendor", "Status") + VARIANT_COLUMNS
+        return {"handle": product.handle,
+                "rows": [{c: row[c] for c in columns if row.get(c)} for row in product.rows]}
+
+    def to_dict(self):
+        return {"version": FORMAT_VERSION, "column": self.column, "root": self.root.to_dict(),
+                "lead": self.edge_to_dict(self.lead), "tail": self.edge_to_dict(self.tail)}
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported cube format {data.get('version')!r} (expected {FORMAT_VERSION})")
+        cube = cls(data["column"])
+        cube.root = CubeNode.from_dict(data["root"])
+        cube.lead, cube.tail = (Product(edge["handle"], edge["rows"]) if edge else None
+                                for edge in (data["lead"], data["tail"]))
+        return cube
+
+    def save(self, path):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+
+def load_cube(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return CategoryCube.from_dict(json.load(f))
+
+
+def read_cube(path, column=CATEGORY_COLUMN):
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        return CategoryCube(column).update(iter_products(csv.DictReader(f)))
+
+
+def store_cube(path, column=CATEGORY_COLUMN):
+    # Only the columns the cube counts are decoded from the store
+    with open_store(path) as store:
+        wanted = ("Handle", "Title", column, "Vendor", "Status") + VARIANT_COLUMNS
+        columns = [c for c in dict.fromkeys(wanted) if c in store.fieldnames]
+        return CategoryCube(column).update(iter_products(store.iter_rows(columns)))
+
+
+def cube_from_args(args):
+    # Shared by the report scripts: --cube, else --store, else --src
+    if getattr(args, "cube", None):
+        return load_cube(args.cube)
+    if getattr(args, "store", None):
+        return store_cube(args.store)
+    return read_cube(args.src)
+
+
+def format_tree(cube, max_depth=None, breakdown=None):
+    lines = []
+    for path, node in cube.walk(max_depth):
+        name = path[-1] if path else "(all products)"
+        lines.append(f"{'  ' * len(path)}{name}: {node.products} products, {node.variants} variants"
+                     + (f" ({node.own} here)" if node.own and node.children else ""))
+        if breakdown:
+            counts = getattr(node, breakdown)
+            order = band_labels() if breakdown == "prices" else sorted(counts, key=lambda k: (-counts[k], k))
+            for key in order:
+                if counts.get(key):
+                    lines.append(f"{'  ' * (len(path) + 1)}- {key or '(none)'}: {counts[key]}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build, merge and show category aggregation cubes.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("build", help="count a catalog CSV (or store) into a cube file")
+    p.add_argument("src")
+    p.add_argument("-o", "--out", required=True)
+    p.add_argument("--column", default=CATEGORY_COLUMN)
+    p.add_argument("--store", action="store_true", help="SRC is a catalog store, not a CSV")
+    p = sub.add_parser("merge", help="add up cubes of several files or shards")
+    p.add_argument("cubes", nargs="+", help="shards of one file in file order")
+    p.add_argument("-o", "--out", required=True)
+    p = sub.add_parser("show", help="print the category tree of a cube")
+    p.add_argument("cube")
+    p.add_argument("--depth", type=int, default=None)
+    p.add_argument("--by", choices=("vendors", "statuses", "prices"), help="break every node down further")
+    args = parser.parse_args()
+
+    try:
+        if args.command == "build":
+            cube = store_cube(args.src, args.column) if args.store else read_cube(args.src, args.column)
+            cube.save(args.out)
+            print(f"Wrote {args.out}: {cube.root.products} products in {sum(1 for _ in cube.walk()) - 1} categories")
+        elif args.command == "merge":
+            cube = load_cube(args.cubes[0])
+            for path in args.cubes[1:]:
+                cube.merge(load_cube(path))
+            cube.save(args.out)
+            print(f"Wrote {args.out}: {cube.root.products} products from {len(args.cubes)} cubes")
+        else:
+            print(format_tree(load_cube(args.cube), args.depth, args.by))
+    except (OSError, ValueError, KeyError) as e:
+        print(e)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
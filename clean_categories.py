@@ -1,6 +1,8 @@
 import csv
 import re
 
+from product_groups import iter_products
+
 def standardize_category(category):
     if not category:
         return category
@@ -51,12 +53,12 @@ def process_csv():
         writer = csv.DictWriter(outfile, fieldnames=reader.fieldnames)
         writer.writeheader()
         
-        for row in reader:
-            # Clean both Category and Type fields
-            category = standardize_category(row['Product Category'])
-            row['Product Category'] = category
-            row['Type'] = category  # Make Type match Category exactly
-            writer.writerow(row)
+        for product in iter_products(reader):
+            # Clean both Category and Type fields, once per product
+            category = standardize_category(product.get('Product Category'))
+            product.head['Product Category'] = category
+            product.head['Type'] = category  # Make Type match Category exactly
+            writer.writerows(product.rows)
 
 if __name__ == '__main__':
     process_csv()
\ No newline at end of file
@@ -1,21 +1,9 @@
-import csv
-from collections import Counter, defaultdict
+import argparse
 
-def count_categories():
-    categories = Counter()
-    main_categories = defaultdict(Counter)
+from category_cube import cube_from_args
 
-    with open('products_clean_english.csv', 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            category = row['Product Category']
-            if category:
-                categories[category] += 1
-                parts = category.split(' > ')
-                if len(parts) > 1:
-                    main_categories[parts[0]][parts[1]] += 1
-                else:
-                    main_categories[parts[0]]['(No subcategory)'] += 1
+def count_categories(cube):
+    main_categories = cube.main_subcategories()
 
     with open('clean_category_summary.txt', 'w', encoding='utf-8') as f:
         f.write("Clean Category Structure Summary\n")
@@ -28,5 +16,13 @@ def count_categories():
                 f.write(f"  └─ {subcat} ({count})\n")
             f.write("\n")
 
+def main():
+    parser = argparse.ArgumentParser(description='Summarize the category tree of the cleaned export.')
+    parser.add_argument('--src', default='products_clean_english.csv')
+    parser.add_argument('--store', help='read a catalog store (python catalog_store.py build SRC) instead of the CSV')
+    parser.add_argument('--cube', help='render from a saved category cube (python category_cube.py build SRC -o CUBE)')
+    args = parser.parse_args()
+    count_categories(cube_from_args(args))
+
 if __name__ == '__main__':
-    count_categories()
\ No newline at end of file
+    main()
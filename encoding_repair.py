@@ -0,0 +1,115 @@
+import argparse
+import csv
+import re
+from collections import Counter
+
+TEXT_COLUMNS = ("Title", "Tags", "Body (HTML)", "Product Category", "Type")
+
+# Byte value of every character a UTF-8 byte 0x80-0xFF turns into when misread as
+# Windows-1252 (the five bytes cp1252 leaves undefined come through as Latin-1)
+_TO_BYTE = {}
+for _b in range(0x80, 0x100):
+    try:
+        _TO_BYTE[bytes([_b]).decode("cp1252")] = _b
+    except UnicodeDecodeError:
+        _TO_BYTE[chr(_b)] = _b
+
+_CONT = "".join(re.escape(ch) for ch, b in _TO_BYTE.items() if b <= 0xBF)
+_LEAD2 = "".join(re.escape(ch) for ch, b in _TO_BYTE.items() if 0xC2 <= b <= 0xDF)
+_LEAD3 = "".join(re.escape(ch) for ch, b in _TO_BYTE.items() if 0xE0 <= b <= 0xEF)
+_LEAD4 = "".join(re.escape(ch) for ch, b in _TO_BYTE.items() if 0xF0 <= b <= 0xF4)
+
+# A UTF-8 multi-byte sequence that was decoded one byte per character, e.g. "Ã¤" for "ä"
+_MOJIBAKE_RE = re.compile(
+    f"[{_LEAD2}][{_CONT}]|[{_LEAD3}][{_CONT}]{{2}}|[{_LEAD4}][{_CONT}]{{3}}"
+)
+
+# Doubly damaged text needs a second round
+MAX_ROUNDS = 3
+
+# Fixes per column from the pipeline stage, for the end-of-run summary
+REPAIR_REPORT = Counter()
+
+
+def _plausible(ch):
+    # What the shop's texts actually contain: Latin letters, typographic punctuation, currency.
+    # Guards against "Ö’"-style genuine pairs decoding to Hebrew or CJK characters.
+    cp = ord(ch)
+    return cp < 0x0250 or 0x2000 <= cp <= 0x206F or 0x20A0 <= cp <= 0x20CF or 0x2100 <= cp <= 0x214F
+
+
+def _decode(match):
+    seq = match.group(0)
+    try:
+        fixed = bytes(_TO_BYTE[ch] for ch in seq).decode("utf-8")
+    except UnicodeDecodeError:
+        return seq
+    return fixed if _plausible(fixed) else seq
+
+
+def repair_text(value):
+    # Only the damaged sequences are rewritten, so correct umlauts next to them survive
+    if not value or value.isascii():
+        return value
+    for _ in range(MAX_ROUNDS):
+        fixed = _MOJIBAKE_RE.sub(_decode, value)
+        if fixed == value:
+            break
+        value = fixed
+    return value
+
+
+def repair_row(row, columns=TEXT_COLUMNS, report=REPAIR_REPORT):
+    for col in columns:
+        value = row.get(col)
+        if not value or value.isascii():
+            continue
+        fixed = repair_text(value)
+        if fixed != value:
+            row[col] = fixed
+            report[col] += 1
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Repair UTF-8 text that was double-encoded as Windows-1252/Latin-1.")
+    parser.add_argument("src")
+    parser.add_argument("out", nargs="?", help="write the repaired CSV here (omit to only report)")
+    args = parser.parse_args()
+
+    report = Counter()
+    examples = {}
+    rows = 0
+    with open(args.src, "r", encoding="utf-8-sig", newline="") as f_in:
+        reader = csv.DictReader(f_in)
+        f_out = open(args.out, "w", encoding="utf-8", newline="") if args.out else None
+        try:
+            writer = csv.DictWriter(f_out, fieldnames=reader.fieldnames) if f_out else None
+            if writer:
+                writer.writeheader()
+            columns = [c for c in reader.fieldnames if c in TEXT_COLUMNS]
+            for row in reader:
+                rows += 1
+                before = {c: row.get(c) for c in columns}
+                repair_row(row, columns, report)
+                for c in columns:
+                    if row.get(c) != before[c] and c not in examples:
+                        examples[c] = (before[c][:80], row[c][:80])
+                if writer:
+                    writer.writerow(row)
+        finally:
+            if f_out:
+                f_out.close()
+
+    print(f"Checked {rows} rows of {args.src}")
+    if not report:
+        print("No double-encoded text found.")
+    for col, cnt in report.most_common():
+        before, after = examples[col]
+        print(f"- {col}: {cnt} fixed (e.g. {before!r} -> {after!r})")
+    if args.out:
+        print(f"Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,117 @@
+import argparse
 import csv
+import hashlib
+import os
+import shutil
+
+from normalize_tags import read_vocabulary
+from product_groups import iter_products
 
 in_path = "products_final.csv"
 out_path = "products_for_shopify.csv"
+delta_path = "products_for_shopify_delta.csv"
+removed_path = "removed_handles.txt"
+# What Shopify last received: only a --diff run (or --commit-snapshot) moves it forward, so
+# plain exports in between never hide changes from the next delta
+snapshot_path = "products_for_shopify_snapshot.csv"
+tags_report_path = "tag_frequencies.csv"
+
+
+def clear_category(row):
+    # Clear Shopify's Product Category so import doesn't reject non-taxonomy values
+    row["Product Category"] = ""
+    return row
+
+
+def group_digest(rows, fieldnames):
+    # One digest per product: all of its variant and image rows, in order
+    h = hashlib.blake2b(digest_size=16)
+    for row in rows:
+        for name in fieldnames:
+            h.update((row.get(name) or "").encode("utf-8"))
+            h.update(b"\x1f")
+        h.update(b"\x1e")
+    return h.digest()
+
+
+def snapshot_digests(path):
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        return {p.handle: group_digest(p.rows, reader.fieldnames) for p in iter_products(reader)}, reader.fieldnames
+
+
+def write_delta(rows, fieldnames, previous, delta_out=delta_path, removed_out=removed_path):
+    # Writes added/changed product groups (all their rows) and the handles that disappeared.
+    # Yields every row so the full export can be written from the same pass.
+    added = changed = 0
+    seen = set()
+    with open(delta_out, "w", encoding="utf-8", newline="") as f_delta:
+        writer = csv.DictWriter(f_delta, fieldnames=fieldnames)
+        writer.writeheader()
+        for product in iter_products(rows):
+            seen.add(product.handle)
+            old = previous.get(product.handle)
+            if old is None or old != group_digest(product.rows, fieldnames):
+                if old is None:
+                    added += 1
+                else:
+                    changed += 1
+                writer.writerows(product.rows)
+            yield from product.rows
+    removed = sorted(h for h in previous if h not in seen)
+    with open(removed_out, "w", encoding="utf-8") as f_removed:
+        for handle in removed:
+            f_removed.write(f"{handle}\n")
+    print(f"Delta: {added} added, {changed} changed, {len(removed)} removed -> {delta_out}, {removed_out}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write the Shopify import CSV with Product Category cleared and tags normalized.")
+    parser.add_argument("--diff", action="store_true",
+                        help=f"also write only added/changed products to {delta_path} and removed handles to {removed_path}")
+    parser.add_argument("--snapshot", default=snapshot_path,
+                        help="CSV last sent to Shopify, to diff against; advanced by --diff (default: %(default)s)")
+    parser.add_argument("--commit-snapshot", action="store_true",
+                        help="record this export as sent to Shopify (e.g. after a full import) without a delta")
+    args = parser.parse_args()
+
+    previous = None
+    if args.diff:
+        if os.path.exists(args.snapshot):
+            previous, snapshot_fields = snapshot_digests(args.snapshot)
+        else:
+            print(f"No snapshot at {args.snapshot}; every product counts as added.")
+            previous, snapshot_fields = {}, None
+
+    # Tags are interned in a first pass, so each spelling is resolved against the whole catalog
+    vocab = read_vocabulary(in_path)
+    with open(in_path, "r", encoding="utf-8-sig", newline="") as f_in:
+        reader = csv.DictReader(f_in)
+        fieldnames = reader.fieldnames
+        rows = (vocab.normalize_row(clear_category(row)) for row in reader)
+        if previous is not None:
+            if snapshot_fields is not None and snapshot_fields != fieldnames:
+                print(f"Warning: columns of {args.snapshot} differ from {in_path}; all products will diff as changed.")
+            rows = write_delta(rows, fieldnames, previous)
+        # Written to a temp file so --snapshot may name the file being replaced
+        tmp_path = out_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f_out:
+            writer = csv.DictWriter(f_out, fieldnames=fieldnames)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row)
+    os.replace(tmp_path, out_path)
+    if args.diff or args.commit_snapshot:
+        shutil.copyfile(out_path, args.snapshot + ".tmp")
+        os.replace(args.snapshot + ".tmp", args.snapshot)
+
+    vocab.write_report(tags_report_path)
 
-with open(in_path, "r", encoding="utf-8-sig", newline="") as f_in, \
-     open(out_path, "w", encoding="utf-8", newline="") as f_out:
-    reader = csv.DictReader(f_in)
-    fieldnames = reader.fieldnames
-    writer = csv.DictWriter(f_out, fieldnames=fieldnames)
-    writer.writeheader()
+    print(f"Wrote {out_path} with Product Category cleared for Shopify import.")
+    if args.diff or args.commit_snapshot:
+        print(f"Snapshot {args.snapshot} now matches {out_path}.")
+    print(f"Tags: {len(vocab.names)} distinct -> {len(set(vocab.canonical()))} canonical ({tags_report_path})")
 
-    for row in reader:
-        # Clear Shopify's Product Category so import doesn't reject non-taxonomy values
-        row["Product Category"] = ""
-        writer.writerow(row)
 
-print(f"Wrote {out_path} with Product Category cleared for Shopify import.")
+if __name__ == "__main__":
+    main()
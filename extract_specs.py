@@ -0,0 +1,456 @@
+import argparse
+import csv
+import json
+import re
+import sys
+from collections import Counter
+
+from product_groups import Product, iter_products
+
+SRC = "products_final.csv"
+OUT = "products_metafields.csv"
+DEFINITIONS = "shopify_metafield_definitions_products.json"
+
+# The specs metafields describe bikes; parts and accessories are skipped
+BIKE_CATEGORIES = ("Bikes", "E-Bikes")
+
+TAG_RE = re.compile(r"<[^>]+>")
+
+# Ordered pattern sets, most specific first. Each set is compiled into one alternation
+# with a named group per value; within a text the most specific value found wins.
+FRAME_MATERIALS = [
+    ("Carbon", r"\bcarbon(?:rahmen|-frame|\s+frame)?\b|\bC:6[28]X?\b|\bHPC\b"),
+    ("Aluminum", r"\balumin(?:ium|um)(?:rahmen|konstruktion|rohrs\w*|-frame|\s+frame)?\b|\balloy\b|\bAL\b"),
+    ("Steel", r"\b(?:steel|stahl\w*|chromoly|cr-?mo)\b"),
+]
+
+BRAKE_TYPES = [
+    ("Hydraulic Disc", r"\bhydraul\w*\s+(?:\w+\s+)?(?:scheiben\w*|disc|disk|freni)|\bdisc\w*\s+hydraul\w*"),
+    ("Mechanical Disc", r"\bmechani\w*\s+(?:scheiben\w*|disc|disk)"),
+    ("Rim", r"\bfelgenbrems\w*|\brim\s+brakes?\b|\bv-brakes?\b"),
+    ("Coaster", r"\brücktritt\w*|\bcoaster\s+brakes?\b"),
+    ("Disc", r"\bscheibenbrems\w*|\bdisc\s+brakes?\b"),
+]
+
+SUSPENSION = [
+    ("Full", r"\bfull[\s-]suspension\b|\bvollgefedert\b"),
+    ("Hardtail", r"\bhardtail\b|\bfedergabel\b|\bsuspension\s+fork\b"),
+    ("Rigid", r"\bstarrgabel\b|\brigid\b"),
+]
+
+# Known drive units; the generic brand names come last so a model always beats them
+MOTOR_SYSTEMS = [
+    ("Bosch Cargo Line", r"\bcargo\s+line\b"),
+    ("Bosch Performance Line CX", r"\bperformance\s+(?:line\s+)?cx\b|\bperf\.?\s*cx\b|\bcx\s+line\b|\bbosch\s+cx\b"),
+    ("Bosch Performance Line SX", r"\bperformance\s+(?:line\s+)?sx\b|\bsx\s+e-antrieb\b|\bbosch\s+sx\b"),
+    ("Bosch Performance Line Speed", r"\bperformance\s+(?:line\s+)?speed\b"),
+    ("Bosch Performance Line", r"\bperformance\s+line\b"),
+    ("Bosch Active Line", r"\bactive\s+line(?:\s+plus)?\b"),
+    ("Shimano EP8", r"\bep8(?:01)?\b"),
+    ("Shimano EP6", r"\bep6(?:00)?\b"),
+    ("Shimano STEPS", r"\b(?:steps|e6100|e5000)\b"),
+    ("Yamaha PW-X3", r"\bpw-?x3\b"),
+    ("Yamaha PW-X2", r"\bpw-?x2\b|\by-x2\b"),
+    ("Dyname", r"\bpowerplay\b|\bdyname\b"),
+    ("Fazua", r"\bfazua\b"),
+    ("TQ HPR50", r"\btq[\s-]?hpr\s?50\b"),
+    ("Brose", r"\bbrose\b"),
+    ("Bafang", r"\bbafang\b"),
+    ("Bosch", r"\bbosch\b"),
+    ("Shimano", r"\bshimano\s+e-?bike\b"),
+]
+
+# Wheel sizes that can also be frame sizes ("Trapeze 14\"") count only on kids' bikes
+WHEEL_RE = re.compile(r"(?<![\d.])(12|14|16|18|20|24|26|27[.,]5|28|29)\s*(?:\"|”|''|\s?zoll\b|-?\s?inch\b)"
+                      r"(?:\s*/\s*(12|14|16|18|20|24|26|27[.,]5|28|29)\s*(?:\"|”|''))?", re.I)
+MULLET_RE = re.compile(r"\b29\s*/\s*27[.,]5\b")
+KIDS_ONLY_WHEELS = {"12", "14", "16", "18"}
+
+WH_RE = re.compile(r"(?<![\d.])(\d{3,4})\s?wh\b", re.I)
+# Model codes that carry the capacity: Cube "Hybrid ... 625" / "400X", Yamaha "i630"
+CUBE_HYBRID_RE = re.compile(r"\bhybrid\b.*?\b(400|500|625|750|800|1350|1500)x?\b", re.I)
+YAMAHA_RE = re.compile(r"\bi(500|600|630|720)\b", re.I)
+BATTERY_RANGE = (150, 2000)
+
+# Known model families: defaults when title, tags and body do not say
+KNOWN_MODELS = [
+    (re.compile(r"^brompton .*\belectric\b", re.I),
+     {"motor_system": "Brompton E-Motor", "battery_wh": 300, "wheel_size": '16"'}),
+    (re.compile(r"^brompton ", re.I), {"wheel_size": '16"'}),
+    (re.compile(r"^mondraker .*\bcrafty\b", re.I), {"motor_system": "Bosch Performance Line CX"}),
+    (re.compile(r"^mondraker .*\bdusty\b", re.I), {"motor_system": "Bosch Performance Line SX"}),
+    (re.compile(r"^orbea .*\bwild\b", re.I), {"motor_system": "Bosch Performance Line CX"}),
+    (re.compile(r"^husqvarna .*\bmc4\b", re.I), {"motor_system": "Shimano EP8"}),
+]
+# E-bike brands that build on one motor supplier
+VENDOR_MOTORS = {"cube": "Bosch", "riese & müller": "Bosch", "benno": "Bosch", "tern": "Bosch", "amsler": "Bosch"}
+
+KIDS_RE = re.compile(r"\bkids?\b|\bjunior\b|\byouth\b|\bkinder\w*", re.I)
+WOMEN_RE = re.compile(r"\bwomen'?s?\b|\bdamen\b|\blady\b", re.I)
+MEN_RE = re.compile(r"\bmen'?s?\b|\bherren\b", re.I)
+
+# Colour words, first one in the title wins. Long roots also match as the end of Cube's
+# compound names ("sagebrushgreen'n'prism"); short ones only as whole words.
+COLOR_FAMILIES = {
+    "black": "Black", "schwarz": "Black", "nero": "Black", "blackline": "Black",
+    "white": "White", "weiss": "White", "weiß": "White", "bianco": "White", "ivory": "White",
+    "grey": "Grey", "gray": "Grey", "grau": "Grey", "anthracite": "Grey", "silver": "Grey", "sil": "Grey",
+    "blue": "Blue", "blau": "Blue", "hellblau": "Blue", "navy": "Blue", "blu": "Blue", "petrol": "Blue",
+    "green": "Green", "grün": "Green", "olive": "Green", "matcha": "Green", "moss": "Green", "teal": "Green",
+    "red": "Red", "rot": "Red", "rosso": "Red", "burgundy": "Red", "coral": "Red",
+    "orange": "Orange", "yellow": "Yellow", "gelb": "Yellow", "lime": "Yellow",
+    "purple": "Purple", "hyperpurple": "Purple", "violet": "Purple", "lila": "Purple",
+    "pink": "Pink", "rosa": "Pink",
+    "brown": "Brown", "bronze": "Brown", "tan": "Brown", "braun": "Brown",
+    "beige": "Beige", "sand": "Beige", "latte": "Beige", "cotton": "Beige",
+}
+COLOR_SUFFIXES = tuple(c for c in COLOR_FAMILIES if len(c) >= 4)
+TOKEN_RE = re.compile(r"[^\W_]+(?:[.:][^\W_]+)*")
+# Cube joins colours with 'n' ("black'n'orange", "teak´n´green"); both quotes are required,
+# or a colour ending in n ("sagebrushgreen'n'prism") would lose that letter
+JOIN_RE = re.compile(r"(?<=\w)\s?['´’]n['´’]\s?(?=\w)")
+SIZE_TOKENS = {"xxs", "xs", "s", "m", "l", "xl", "xxl", "one", "size", "cm"}
+# Frame sizes in cm, written "47cm" or "47 cm"
+SIZE_RE = re.compile(r"(?<![\d.])\d{2}\s?cm\b", re.I)
+
+
+# Spec tables in the descriptions ("Rahmen  Aluminium Superlite, ...") name the part exactly
+SPEC_LABELS = {
+    "frame_material": ("Rahmen", "Frame", "Telaio"),
+    "brake_type": ("Bremsen", "Brakes", "Freni"),
+    "suspension": ("Gabel", "Fork", "Forcella"),
+    "motor_system": ("Motor", "Antrieb", "Motore"),
+}
+_LABEL_RES = {
+    name: re.compile(r"(?:^|\n)\s*(?:" + "|".join(labels) + r")\s*:?\s*\n?\s*([^\n]{1,120})", re.I)
+    for name, labels in SPEC_LABELS.items()
+}
+
+
+def compile_set(patterns):
+    regex = re.compile("|".join(f"(?P<v{i}>{p})" for i, (_, p) in enumerate(patterns)), re.I)
+    return regex, [value for value, _ in patterns]
+
+
+_SETS = {
+    "frame_material": compile_set(FRAME_MATERIALS),
+    "brake_type": compile_set(BRAKE_TYPES),
+    "suspension": compile_set(SUSPENSION),
+    "motor_system": compile_set(MOTOR_SYSTEMS),
+}
+
+
+def match_set(name, texts):
+    # Most specific value in the first text that has any; texts go from most to least reliable
+    regex, values = _SETS[name]
+    for text in texts:
+        best = None
+        for m in regex.finditer(text):
+            pos = int(m.lastgroup[1:])
+            if best is None or pos < best:
+                best = pos
+        if best is not None:
+            return values[best]
+    return None
+
+
+def labelled(name, body):
+    # The spec table entries for one field, as a single text
+    return " / ".join(m.group(1) for m in _LABEL_RES[name].finditer(body))
+
+
+def title_tokens(title):
+    return [t.lower() for t in TOKEN_RE.findall(JOIN_RE.sub(" ", title))]
+
+
+def color_of(token):
+    family = COLOR_FAMILIES.get(token)
+    if family is None and len(token) > 4:
+        for root in COLOR_SUFFIXES:
+            if token.endswith(root):
+                return COLOR_FAMILIES[root]
+    return family
+
+
+def color_family(title):
+    for token in title_tokens(title):
+        family = color_of(token)
+        if family:
+            return family
+    return None
+
+
+def model_family(vendor, title):
+    # Title without colours and frame sizes: colour/size variants of one model share a key
+    kept = [t for t in title_tokens(SIZE_RE.sub(" ", title)) if not color_of(t) and t not in SIZE_TOKENS]
+    return (vendor or "").strip().lower(), " ".join(kept)
+
+
+def wheel_size(texts, kids):
+    for text in texts:
+        if MULLET_RE.search(text):
+            return '29"/27.5"'
+        for m in WHEEL_RE.finditer(text):
+            front, rear = m.group(1).replace(",", "."), m.group(2)
+            if front in KIDS_ONLY_WHEELS and not kids:
+                continue
+            return f'{front}"/{rear.replace(",", ".")}"' if rear and rear != front else f'{front}"'
+    return None
+
+
+def battery_wh(title, texts):
+    for text in texts:
+        for m in WH_RE.finditer(text):
+            wh = int(m.group(1))
+            if BATTERY_RANGE[0] <= wh <= BATTERY_RANGE[1]:
+                return wh
+    for regex in (CUBE_HYBRID_RE, YAMAHA_RE):
+        m = regex.search(title)
+        if m:
+            return int(m.group(1))
+    return None
+
+
+def parse_texts(vendor, title, tags, body, category):
+    # Specs one product's own texts state, without any defaults
+    texts = (title, tags, body)
+
+    def sources(name):
+        return (labelled(name, body),) + texts
+
+    kids = bool(KIDS_RE.search(category) or KIDS_RE.search(tags))
+    ebike = category.startswith("E-Bikes") or bool(re.search(r"\be-?bike\b|\bhybrid\b", f"{title} {tags}", re.I))
+    specs = {
+        "wheel_size": wheel_size((title, category, tags, body), kids),
+        "frame_material": match_set("frame_material", sources("frame_material")),
+        "suspension": match_set("suspension", (category,) + sources("suspension")),
+        "brake_type": match_set("brake_type", sources("brake_type")),
+    }
+    if ebike:
+        specs["motor_system"] = match_set("motor_system", sources("motor_system"))
+        specs["battery_wh"] = battery_wh(title, texts)
+    if kids:
+        specs["fit"] = "Kids"
+    elif WOMEN_RE.search(f"{title} {tags}"):
+        specs["fit"] = "Women"
+    elif MEN_RE.search(f"{title} {tags}"):
+        specs["fit"] = "Men"
+    return {k: v for k, v in specs.items() if v is not None}, ebike
+
+
+def merge_stated(into, specs):
+    # Pattern-set fields keep the most specific value any variant states ("Bosch Cargo
+    # Line" over a bare "Bosch"); the other fields keep the first value found
+    for field, value in specs.items():
+        old = into.get(field)
+        if old is None:
+            into[field] = value
+        elif field in _SETS:
+            values = _SETS[field][1]
+            if values.index(value) < values.index(old):
+                into[field] = value
+
+
+def with_defaults(specs, vendor, title, category, ebike):
+    # Fills what no variant of the family states: road/gravel bikes are rigid, then the
+    # known model defaults, then the vendor's motor supplier
+    specs = dict(specs)
+    if specs.get("suspension") is None and re.search(r"\b(?:road|gravel)\b", category, re.I):
+        specs["suspension"] = "Rigid"
+    for regex, defaults in KNOWN_MODELS:
+        if regex.search(f"{vendor} {title}"):
+            for key, value in defaults.items():
+                if specs.get(key) is None:
+                    specs[key] = value
+            break
+    if ebike and specs.get("motor_system") is None:
+        specs["motor_system"] = VENDOR_MOTORS.get((vendor or "").strip().lower())
+    return {k: v for k, v in specs.items() if v is not None}
+
+
+def bike_parts(head):
+    # Category segments of a bike product, or None for parts and accessories
+    category = head.get("Product Category", "") or head.get("Type", "")
+    parts = [p.strip() for p in category.split(" > ")]
+    return parts if parts[0] in BIKE_CATEGORIES else None
+
+
+class SpecExtractor:
+    # Specs are shared per model family (vendor + title without colours and sizes). Colour
+    # and size variants often describe the model unevenly (one has the spec table, the next
+    # an empty body), so add() merges what every variant states in a first pass, and
+    # extract() hands each variant the family's merged specs. Distinct texts parse once.
+
+    def __init__(self):
+        self._stated = {}
+        self._first = {}
+        self._resolved = {}
+        self._parsed = set()
+        self.products = 0
+        self.filled = Counter()
+
+    @property
+    def families(self):
+        return len(self._stated)
+
+    def add(self, product):
+        head = product.head
+        parts = bike_parts(head)
+        if parts is None:
+            return
+        vendor = head.get("Vendor", "")
+        title = head.get("Title", "")
+        category = " > ".join(parts)
+        tags = head.get("Tags", "") or ""
+        body = TAG_RE.sub(" ", head.get("Body (HTML)", "") or "")
+        key = model_family(vendor, title)
+        if key not in self._stated:
+            self._stated[key] = {}
+            self._first[key] = [vendor, title, category, False]
+        if (key, title, tags, body, category) in self._parsed:
+            return
+        self._parsed.add((key, title, tags, body, category))
+        specs, ebike = parse_texts(vendor, title, tags, body, category)
+        merge_stated(self._stated[key], specs)
+        self._first[key][3] = self._first[key][3] or ebike
+        self._resolved.pop(key, None)
+
+    def extract(self, product):
+        # Without a first pass over the catalog, a family only knows the variants seen so far
+        self.products += 1
+        head = product.head
+        parts = bike_parts(head)
+        if parts is None:
+            return {}
+        title = head.get("Title", "")
+        key = model_family(head.get("Vendor", ""), title)
+        if key not in self._stated:
+            self.add(product)
+        specs = self._resolved.get(key)
+        if specs is None:
+            specs = self._resolved[key] = with_defaults(self._stated[key], *self._first[key])
+        specs = dict(specs)
+        if len(parts) > 1 and parts[1] not in ("Sale", "Used"):
+            specs["category_level2"] = parts[1]
+        family = color_family(title)
+        if family:
+            specs["color_family"] = family
+        self.filled.update(specs.keys())
+        return specs
+
+
+def load_definitions(path=DEFINITIONS, owner="Product"):
+    with open(path, "r", encoding="utf-8") as f:
+        return [d for d in json.load(f)["metafield_definitions"] if d.get("owner_type") == owner]
+
+
+def metafield_column(definition):
+    # Shopify's product CSV header for a metafield
+    return f"{definition['name']} (product.metafields.{definition['namespace']}.{definition['key']})"
+
+
+def run(src=SRC, out=OUT, definitions_path=DEFINITIONS):
+    # The extractor fills the specs namespace; other namespaces are managed in the admin
+    definitions = [d for d in load_definitions(definitions_path) if d["namespace"] == "specs"]
+    columns = [metafield_column(d) for d in definitions]
+    extractor = SpecExtractor()
+    with open(src, "r", encoding="utf-8-sig", newline="") as f:
+        for product in iter_products(csv.DictReader(f)):
+            extractor.add(product)
+    written = 0
+    with open(src, "r", encoding="utf-8-sig", newline="") as f_in, \
+         open(out, "w", encoding="utf-8", newline="") as f_out:
+        writer = csv.writer(f_out)
+        writer.writerow(["Handle"] + columns)
+        for product in iter_products(csv.DictReader(f_in)):
+            specs = extractor.extract(product)
+            if not specs:
+                continue
+            writer.writerow([product.handle] + [specs.get(d["key"], "") for d in definitions])
+            written += 1
+    return extractor, written, definitions
+
+
+# Title variants of one model and the motor every one of them must get, in any order,
+# for --selftest: (vendor, category, [(title, body), ...], motor_system)
+SELFTEST_MODELS = [
+    ("Cube", "E-Bikes > Cargo", [
+        ("Cube Longtail Hybrid 1350 grey'n'reflex 26\": ONE SIZE", ""),
+        ("Cube Longtail Hybrid 1350 blue\u00b4n\u00b4reflex 26\": ONE SIZE",
+         "<p>Motor</p><p>Bosch Drive Unit Cargo Line Generation 4 (85Nm)</p>"),
+    ], "Bosch Cargo Line"),
+    ("Cube", "E-Bikes > E-MTB Full Suspension", [
+        ("Cube Stereo Hybrid ONE77 HPC Race grey'n'black M", "<p>Mit starkem Bosch Antrieb.</p>"),
+        ("Cube Stereo Hybrid ONE77 HPC Race liquidorange'n'orange L", "<p>Bosch Performance Line CX, 85 Nm</p>"),
+        ("Cube Stereo Hybrid ONE77 HPC Race black XL", ""),
+    ], "Bosch Performance Line CX"),
+    ("Cube", "E-Bikes > Kids", [
+        ("Cube Compact Hybrid 500 cotton'n'reflex 20\": ONE SIZE", ""),
+        ("Cube Compact Hybrid 500 black'n'reflex 20\": ONE SIZE", ""),
+    ], "Bosch"),
+    ("Cube", "E-Bikes > City & Trekking", [
+        ("Cube Nulane Hybrid C:62 Race 400X sagebrushgreen'n'prism M", ""),
+        ("Cube Nulane Hybrid C:62 Race 400X grey'n'prism L", ""),
+    ], "Bosch"),
+    ("Riese & M\u00fcller", "E-Bikes > City & Trekking", [
+        ("Nevo4 GT Vario red 47cm", ""),
+        ("Nevo4 GT Vario black 51 cm", ""),
+    ], "Bosch"),
+]
+
+
+# Titles and the colour family each must get, for --selftest
+SELFTEST_COLORS = [
+    ("Cube Compact Hybrid 500 cotton'n'reflex 20\": ONE SIZE", "Beige"),
+    ("Cube Nulane Hybrid C:62 Race 400X sagebrushgreen'n'prism M", "Green"),
+    ("Cube Editor Hybrid SLT FE 400X goblin'n'glossy", None),
+    ("Cube Trike Family Hybrid 750 blue\u00b4n\u00b4reflex 24\" / 20\": ONE SIZE", "Blue"),
+]
+
+
+def selftest():
+    # Returns the failures: every variant of a model must land in one family with one motor,
+    # and colour words joined with 'n' must keep their letters
+    failures = []
+    for title, expected in SELFTEST_COLORS:
+        if color_family(title) != expected:
+            failures.append(f"{title}: colour {color_family(title)}, expected {expected} (tokens {title_tokens(title)})")
+    for vendor, category, variants, motor in SELFTEST_MODELS:
+        products = [Product(f"selftest-{i}", [{"Handle": f"selftest-{i}", "Title": title, "Vendor": vendor,
+                                               "Product Category": category, "Tags": "e-bike", "Body (HTML)": body}])
+                    for i, (title, body) in enumerate(variants)]
+        for order in (products, products[::-1]):
+            extractor = SpecExtractor()
+            for product in order:
+                extractor.add(product)
+            got = [extractor.extract(product).get("motor_system") for product in order]
+            if extractor.families != 1 or set(got) != {motor}:
+                failures.append(f"{variants[0][0]}: {extractor.families} families, motors {got}, expected {motor}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract bike specs from titles, tags and descriptions into a metafield import CSV.")
+    parser.add_argument("--src", default=SRC)
+    parser.add_argument("--out", default=OUT)
+    parser.add_argument("--definitions", default=DEFINITIONS)
+    parser.add_argument("--selftest", action="store_true", help="check that title variants of one model share their specs")
+    args = parser.parse_args()
+
+    if args.selftest:
+        failures = selftest()
+        for failure in failures:
+            print(failure)
+        print("selftest failed" if failures else
+              f"selftest passed ({len(SELFTEST_MODELS)} models, {len(SELFTEST_COLORS)} colours)")
+        sys.exit(1 if failures else 0)
+
+    extractor, written, definitions = run(args.src, args.out, args.definitions)
+    print(f"Wrote {args.out}: {written} of {extractor.products} products with specs "
+          f"({extractor.families} model families parsed).")
+    for d in definitions:
+        print(f"- {d['namespace']}.{d['key']}: {extractor.filled[d['key']]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,84 +1,21 @@
+import argparse
 import csv
-import io
 import os
-import re
 import sys
-import urllib.request
 from collections import Counter
 
-TAXONOMY_URLS = [
-	"https://raw.githubusercontent.com/Shopify/product-taxonomy/main/data/taxonomy_with_ids.csv",
-	"https://raw.githubusercontent.com/Shopify/product-taxonomy/main/data/taxonomy.csv",
-	"https://raw.githubusercontent.com/Shopify/product-taxonomy/master/data/taxonomy_with_ids.csv",
-	"https://raw.githubusercontent.com/Shopify/product-taxonomy/master/data/taxonomy.csv",
-]
+import taxonomy_batch
+from run_metrics import add_arguments, from_args, profiled
+from taxonomy_index import TaxonomyIndex, tokenize
+from taxonomy_store import STORE_PATH, load_taxonomy
+
 SRC_PRIMARY = "products_final.csv"
 SRC_FALLBACK = "products_translated_english.csv"
 MAP_REPORT = "shopify_taxonomy_mapping.csv"
 OUT_CSV = "products_with_taxonomy.csv"
 
-# Prefer products_final.csv; fallback to products_translated_english.csv
-SRC_PATH = SRC_PRIMARY if os.path.exists(SRC_PRIMARY) else SRC_FALLBACK
-if not os.path.exists(SRC_PATH):
-	print("Source CSV not found.")
-	sys.exit(1)
+RUNNER_UPS = 3
 
-print("Downloading Shopify taxonomy…")
-last_err = None
-data = None
-for url in TAXONOMY_URLS:
-	try:
-		with urllib.request.urlopen(url) as resp:
-			data = resp.read().decode("utf-8", errors="replace")
-			print(f"Loaded taxonomy from: {url}")
-			break
-	except Exception as e:
-		last_err = e
-		continue
-
-if not data:
-	print("Failed to download Shopify taxonomy:", last_err)
-	sys.exit(1)
-
-reader = csv.DictReader(io.StringIO(data))
-taxonomy = []
-for row in reader:
-	full_name = row.get("full_name") or row.get("name") or ""
-	if not full_name:
-		continue
-	taxonomy.append({
-		"id": row.get("id", ""),
-		"full_name": full_name,
-		"tokens": set(re.findall(r"[a-z0-9]+", full_name.lower()))
-	})
-
-if not taxonomy:
-	print("Failed to parse Shopify taxonomy.")
-	sys.exit(1)
-
-print(f"Reading source: {SRC_PATH}")
-with open(SRC_PATH, "r", encoding="utf-8-sig", newline="") as f:
-	reader = csv.DictReader(f)
-	rows = list(reader)
-	fieldnames = reader.fieldnames
-
-# Collect unique categories
-unique_cats = Counter()
-for r in rows:
-	c = (r.get("Product Category") or "").strip()
-	unique_cats[c] += 1
-
-# Token-overlap score + small bias for bike-related nodes
-preferred = {"bike","bikes","bicycle","bicycles","cycling","helmet","helmets","light","lights","bag","bags","brake","pedal","wheel","seatpost","saddle","grip","handlebar","trainer","rollers","ebike","e-bikes","electric"}
-
-def score(cat_str, node):
-	cat_tokens = set(re.findall(r"[a-z0-9]+", cat_str.lower()))
-	if not cat_tokens:
-		return 0.0
-	inter = cat_tokens & node["tokens"]
-	base = (len(inter) / len(cat_tokens)) + (len(inter) / (len(node["tokens"]) or 1))
-	bias = 0.15 if (node["tokens"] & preferred) else 0.0
-	return base + bias
 
 # Manual nudges for common cycling categories (map substrings)
 MANUAL_HINTS = {
@@ -105,55 +42,133 @@ MANUAL_HINTS = {
 	"Bikes > Gravel": "Sporting Goods > Outdoor Recreation > Cycling > Bicycles > Gravel Bicycles",
 }
 
-# Build a lookup from full_name to node for hints
-name_to_node = {n["full_name"]: n for n in taxonomy}
 
-mapping = {}
-for cat, cnt in unique_cats.items():
+def map_category(cat, index, runner_ups=RUNNER_UPS, ranked=None):
+	# ranked: precomputed top_k(cat, runner_ups + 1), e.g. from taxonomy_batch
 	if not cat:
-		mapping[cat] = {"mapped_name": "", "id": "", "score": 0.0, "method": "empty"}
-		continue
+		return {"mapped_name": "", "id": "", "score": 0.0, "method": "empty", "matched": False, "alternatives": []}
 	# Manual hint first (substring match)
 	hint_match = None
 	for key, target_name in MANUAL_HINTS.items():
 		if key.lower() in cat.lower():
-			hint_match = name_to_node.get(target_name)
+			hint_match = index.by_name.get(target_name)
 			break
-	best = None
-	best_score = -1.0
+	if ranked is None:
+		ranked = index.top_k(cat, runner_ups + 1)
 	if hint_match:
-		best = hint_match
-		best_score = 1.0
+		best, best_score = hint_match, 1.0
+		alternatives = [(n, s) for n, s in ranked if n is not hint_match][:runner_ups]
 	else:
-		for node in taxonomy:
-			s = score(cat, node)
-			if s > best_score:
-				best = node
-				best_score = s
-	mapping[cat] = {
+		best, best_score = ranked[0]
+		alternatives = ranked[1:]
+	return {
 		"mapped_name": best["full_name"],
 		"id": best["id"],
 		"score": round(best_score, 3),
-		"method": "hint" if hint_match else "auto"
+		"method": "hint" if hint_match else "auto",
+		# top_k always returns a node; without a shared token it is only the bias pick
+		"matched": bool(hint_match) or bool(tokenize(cat) & best["tokens"]),
+		"alternatives": [(n["full_name"], round(s, 3)) for n, s in alternatives],
 	}
 
-# Write mapping report
-with open(MAP_REPORT, "w", encoding="utf-8", newline="") as f:
-	w = csv.writer(f)
-	w.writerow(["original_category", "count", "mapped_full_name", "taxonomy_id", "match_score", "method"])
-	for cat, cnt in unique_cats.most_common():
-		m = mapping[cat]
-		w.writerow([cat, cnt, m["mapped_name"], m["id"], m["score"], m["method"]])
-
-# Produce Shopify-ready CSV: keep Type, set Product Category to mapped_full_name
-with open(OUT_CSV, "w", encoding="utf-8", newline="") as f:
-	writer = csv.DictWriter(f, fieldnames=fieldnames)
-	writer.writeheader()
-	for r in rows:
-		src_cat = (r.get("Product Category") or "").strip()
-		mapped = mapping.get(src_cat, {"mapped_name": ""})["mapped_name"]
-		r["Product Category"] = mapped
-		writer.writerow(r)
-
-print("Wrote:", OUT_CSV)
-print("Wrote:", MAP_REPORT)
+
+def collect_categories(src_path):
+	# Counts per stripped Product Category, read with a plain reader (no per-row dicts)
+	counts = Counter()
+	rows = 0
+	with open(src_path, "r", encoding="utf-8-sig", newline="") as f:
+		reader = csv.reader(f)
+		header = next(reader, [])
+		col = header.index("Product Category") if "Product Category" in header else None
+		for record in reader:
+			if not record:
+				continue
+			rows += 1
+			value = record[col] if col is not None and col < len(record) else ""
+			counts[value.strip()] += 1
+	return counts, rows
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Map product categories to the Shopify taxonomy.")
+	parser.add_argument("--refresh-taxonomy", action="store_true", help="re-download the taxonomy into the local store")
+	parser.add_argument("--taxonomy-csv", metavar="CSV", help="seed the local store from a taxonomy CSV (offline)")
+	parser.add_argument("--taxonomy-store", default=STORE_PATH)
+	parser.add_argument("--batch", action="store_true", help="score all categories in one NumPy/SciPy batch")
+	add_arguments(parser)
+	args = parser.parse_args()
+	metrics = from_args("map_to_taxonomy", args)
+	with profiled(args.profile):
+		run(args, metrics)
+	if metrics.write():
+		print(f"Wrote {metrics.report_path}")
+
+
+def run(args, metrics):
+	# Prefer products_final.csv; fallback to products_translated_english.csv
+	src_path = SRC_PRIMARY if os.path.exists(SRC_PRIMARY) else SRC_FALLBACK
+	if not os.path.exists(src_path):
+		print("Source CSV not found.")
+		sys.exit(1)
+
+	try:
+		with metrics.stage("load_taxonomy"):
+			taxonomy = load_taxonomy(args.taxonomy_store, refresh=args.refresh_taxonomy, seed=args.taxonomy_csv)
+	except (OSError, ValueError) as e:
+		print(e)
+		sys.exit(1)
+	with metrics.stage("build_index", len(taxonomy)):
+		index = TaxonomyIndex(taxonomy)
+
+	# Phase 1: distinct categories only; memory grows with the category vocabulary, not the feed
+	print(f"Reading source: {src_path}")
+	with metrics.stage("collect_categories"):
+		unique_cats, rows = collect_categories(src_path)
+
+	rankings = {}
+	if args.batch:
+		if taxonomy_batch.available():
+			with metrics.stage("batch_scoring", len(unique_cats)):
+				rankings = taxonomy_batch.BatchScorer(taxonomy).top_k([c for c in unique_cats if c], RUNNER_UPS + 1)
+		else:
+			print("NumPy is not installed; falling back to the inverted index.")
+	with metrics.stage("taxonomy_mapping", len(unique_cats)):
+		mapping = {cat: map_category(cat, index, ranked=rankings.get(cat)) for cat in unique_cats}
+	for cat, m in mapping.items():
+		metrics.count(f"method_{m['method']}")
+		if cat and not m["matched"]:
+			metrics.count("unmapped_categories")
+	metrics.count("rows", rows)
+	metrics.count("distinct_categories", len(unique_cats))
+
+	# Write mapping report
+	with open(MAP_REPORT, "w", encoding="utf-8", newline="") as f:
+		w = csv.writer(f)
+		w.writerow(["original_category", "count", "mapped_full_name", "taxonomy_id", "match_score", "method", "runner_ups"])
+		for cat, cnt in unique_cats.most_common():
+			m = mapping[cat]
+			alts = "; ".join(f"{name} ({s})" for name, s in m["alternatives"])
+			w.writerow([cat, cnt, m["mapped_name"], m["id"], m["score"], m["method"], alts])
+
+	# Phase 2: stream rows through the resolved mapping; keep Type, set Product Category to mapped_full_name
+	resolved = {cat: m["mapped_name"] for cat, m in mapping.items()}
+	with open(src_path, "r", encoding="utf-8-sig", newline="") as f_in, \
+		 open(OUT_CSV, "w", encoding="utf-8", newline="") as f_out:
+		reader = csv.DictReader(f_in)
+		writer = csv.DictWriter(f_out, fieldnames=reader.fieldnames)
+		writer.writeheader()
+		writerow = metrics.wrap("csv_write", writer.writerow)
+		for r in metrics.iterate("csv_parse", reader):
+			src_cat = r.get("Product Category") or ""
+			mapped = resolved.get(src_cat.strip(), "")
+			if mapped != src_cat:
+				metrics.count("rows_changed")
+			r["Product Category"] = mapped
+			writerow(r)
+
+	print("Wrote:", OUT_CSV)
+	print("Wrote:", MAP_REPORT)
+
+
+if __name__ == "__main__":
+	main()
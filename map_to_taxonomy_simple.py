@@ -1,5 +1,8 @@
 import csv
-from collections import Counter
+from functools import lru_cache
+
+from category_cube import CategoryCube
+from product_groups import iter_products
 
 SRC = "products_final.csv"
 OUT = "products_with_taxonomy.csv"
@@ -15,6 +18,8 @@ TYPE_TO_TAXONOMY = [
 ]
 
 
+# Bounded, so a feed with endless distinct types cannot grow memory without limit
+@lru_cache(maxsize=65536)
 def map_taxonomy(product_type: str) -> str:
     t = (product_type or "").strip()
     for prefix, mapped in TYPE_TO_TAXONOMY:
@@ -24,30 +29,32 @@ def map_taxonomy(product_type: str) -> str:
     return "Sporting Goods > Outdoor Recreation > Cycling"
 
 
-with open(SRC, "r", encoding="utf-8-sig", newline="") as f_in:
-    reader = csv.DictReader(f_in)
-    rows = list(reader)
-    fieldnames = reader.fieldnames
-
-# Write output with Product Category set to valid taxonomy
-with open(OUT, "w", encoding="utf-8", newline="") as f_out:
-    writer = csv.DictWriter(f_out, fieldnames=fieldnames)
-    writer.writeheader()
-    for r in rows:
-        typ = r.get("Type", "")
-        r["Product Category"] = map_taxonomy(typ)
-        writer.writerow(r)
-
-# Summary of assigned taxonomy values
-counts = Counter()
-for r in rows:
-    typ = r.get("Type", "")
-    counts[map_taxonomy(typ)] += 1
-
-with open(SUMMARY, "w", encoding="utf-8") as f:
-    f.write("Assigned Product Category summary (valid Shopify taxonomy)\n")
-    f.write("========================================================\n\n")
-    for cat, cnt in counts.most_common():
-        f.write(f"{cat}: {cnt}\n")
-
-print(f"Wrote {OUT} and {SUMMARY}.")
+def main():
+    # One streaming pass: only the current product's rows are in memory, and the
+    # summary cube is filled as products are written
+    cube = CategoryCube()
+    with open(SRC, "r", encoding="utf-8-sig", newline="") as f_in, \
+         open(OUT, "w", encoding="utf-8", newline="") as f_out:
+        reader = csv.DictReader(f_in)
+        writer = csv.DictWriter(f_out, fieldnames=reader.fieldnames)
+        writer.writeheader()
+        # One taxonomy value per product, on its first row; variant and image rows stay blank
+        for product in iter_products(reader):
+            category = map_taxonomy(product.get("Type"))
+            product.head["Product Category"] = category
+            cube.add(product)
+            writer.writerows(product.rows)
+
+    with open(SUMMARY, "w", encoding="utf-8") as f:
+        f.write("Assigned Product Category summary (valid Shopify taxonomy)\n")
+        f.write("========================================================\n\n")
+        # Ties in name order, so cubes merged from shards render the same
+        counts = cube.categories()
+        for cat, cnt in sorted(counts.items(), key=lambda kv: (-kv[1], kv[0])):
+            f.write(f"{cat}: {cnt}\n")
+
+    print(f"Wrote {OUT} and {SUMMARY}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+from collections import Counter
+
+# Stand-in for the Shopify Admin GraphQL endpoint, enough to exercise shopify_import.py
+# offline: keep-alive HTTP/1.1, a leaky-bucket query cost limit reported the way
+# Shopify reports it (extensions.cost.throttleStatus), THROTTLED errors when the bucket
+# runs dry, and injected 5xx responses, 429s and dropped connections.
+
+PATH_RE = re.compile(r"^/admin/api/[0-9]{4}-[0-9]{2}/graphql\.json$")
+
+# Standard plan: 1000 points, restored at 50 points per second
+BUCKET_SIZE = 1000.0
+RESTORE_RATE = 50.0
+MUTATION_COST = 10
+
+
+class MockShop:
+    def __init__(self, bucket=BUCKET_SIZE, restore_rate=RESTORE_RATE, error_rate=0.0,
+                 drop_rate=0.0, latency=(0.005, 0.02), seed=None):
+        self.bucket = bucket
+        self.restore_rate = restore_rate
+        self.available = bucket
+        self.updated = time.monotonic()
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self.latency = latency
+        self.random = random.Random(seed)
+        self.products = {}
+        self.stats = Counter()
+
+    def refill(self):
+        now = time.monotonic()
+        self.available = min(self.bucket, self.available + (now - self.updated) * self.restore_rate)
+        self.updated = now
+
+    def cost(self, requested, actual):
+        return {
+            "requestedQueryCost": requested,
+            "actualQueryCost": actual,
+            "throttleStatus": {
+                "maximumAvailable": self.bucket,
+                "currentlyAvailable": round(self.available, 1),
+                "restoreRate": self.restore_rate,
+            },
+        }
+
+    def product_set(self, identifier, data):
+        handle = (identifier or {}).get("handle") or data.get("handle", "")
+        if not data.get("title"):
+            return {"product": None, "userErrors": [{"field": ["input", "title"], "message": "Title can't be blank"}]}
+        if handle in self.products:
+            self.stats["products_updated"] += 1
+        else:
+            self.products[handle] = f"gid://shopify/Product/{len(self.products) + 1}"
+            self.stats["products_created"] += 1
+        return {"product": {"id": self.products[handle], "handle": handle}, "userErrors": []}
+
+    def graphql(self, payload):
+        # Every ProductSetInput variable $pN (with identifier $iN) is one aliased productSet
+        variables = payload.get("variables") or {}
+        aliases = sorted((k for k in variables if re.fullmatch(r"p[0-9]+", k)), key=lambda k: int(k[1:]))
+        requested = MUTATION_COST * max(1, len(aliases))
+        self.refill()
+        if requested > self.bucket:
+            self.stats["too_expensive"] += 1
+            return {"errors": [{"message": f"Query cost is {requested}, which exceeds the single query max cost limit ({int(self.bucket)})",
+                                "extensions": {"code": "MAX_COST_EXCEEDED"}}]}
+        if requested > self.available:
+            self.stats["throttled"] += 1
+            return {"errors": [{"message": "Throttled", "extensions": {"code": "THROTTLED"}}],
+                    "extensions": {"cost": self.cost(requested, 0)}}
+        self.available -= requested
+        data = {alias: self.product_set(variables.get("i" + alias[1:]), variables[alias]) for alias in aliases}
+        self.stats["mutations"] += len(aliases)
+        return {"data": data, "extensions": {"cost": self.cost(requested, requested)}}
+
+    async def handle(self, reader, writer):
+        self.stats["connections"] += 1
+        try:
+            while True:
+                request = await read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                self.stats["requests"] += 1
+                await asyncio.sleep(self.random.uniform(*self.latency))
+
+                roll = self.random.random()
+                if roll < self.drop_rate:
+                    self.stats["dropped"] += 1
+                    break
+                roll -= self.drop_rate
+                if roll < self.error_rate:
+                    status = self.random.choice((429, 500, 502, 503))
+                    self.stats[f"status_{status}"] += 1
+                    extra = {"Retry-After": "1.0"} if status == 429 else {}
+                    await write_response(writer, status, {"errors": "injected failure"}, extra)
+                    continue
+
+                if method != "POST" or not PATH_RE.match(path):
+                    await write_response(writer, 404, {"errors": "Not Found"})
+                elif not headers.get("x-shopify-access-token"):
+                    await write_response(writer, 401, {"errors": "[API] Invalid API key or access token"})
+                else:
+                    try:
+                        payload = json.loads(body or b"{}")
+                    except ValueError:
+                        await write_response(writer, 400, {"errors": "Invalid JSON"})
+                        continue
+                    await write_response(writer, 200, self.graphql(payload))
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            # Client went away, or the server is shutting down
+            pass
+        finally:
+            writer.close()
+
+
+async def read_request(reader):
+    line = await reader.readline()
+    if not line:
+        return None
+    method, path, _ = line.decode("latin-1").split(" ", 2)
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0))
+    body = await reader.readexactly(length) if length else b""
+    return method, path, headers, body
+
+
+async def write_response(writer, status, payload, extra_headers=None):
+    reasons = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found",
+               429: "Too Many Requests", 500: "Internal Server Error", 502: "Bad Gateway", 503: "Service Unavailable"}
+    body = json.dumps(payload).encode("utf-8")
+    head = [f"HTTP/1.1 {status} {reasons.get(status, '')}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(body)}"]
+    head.extend(f"{k}: {v}" for k, v in (extra_headers or {}).items())
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+    await writer.drain()
+
+
+async def start_mock(shop, host="127.0.0.1", port=0):
+    # Returns the running server; port 0 picks a free one (server.sockets[0].getsockname())
+    return await asyncio.start_server(shop.handle, host, port)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for the Shopify Admin GraphQL API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--bucket", type=float, default=BUCKET_SIZE, help="query cost bucket size")
+    parser.add_argument("--restore-rate", type=float, default=RESTORE_RATE, help="cost points restored per second")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with 429/5xx")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="share of requests whose connection is dropped")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    shop = MockShop(args.bucket, args.restore_rate, args.error_rate, args.drop_rate, seed=args.seed)
+
+    async def serve():
+        server = await start_mock(shop, args.host, args.port)
+        print(f"Mock Shopify Admin API on http://{args.host}:{args.port}/admin/api/<version>/graphql.json "
+              f"(bucket {args.bucket:g}, restore {args.restore_rate:g}/s); Ctrl-C to stop")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    print(f"{len(shop.products)} products stored")
+    for key, cnt in sorted(shop.stats.items()):
+        print(f"- {key}: {cnt}")
+
+
+if __name__ == "__main__":
+    main()
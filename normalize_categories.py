@@ -1,6 +1,14 @@
+import argparse
 import csv
+import io
 import re
-from collections import Counter, defaultdict
+import sys
+from collections import Counter
+from functools import lru_cache
+
+from category_cube import CategoryCube
+from product_groups import iter_products
+from run_metrics import RunMetrics, add_arguments, from_args, profiled
 
 # Terms to translate at the token/segment level (substring-safe)
 SEGMENT_TRANSLATIONS = {
@@ -92,30 +100,53 @@ FOREIGN_TERMS = [
 	"Dämpfer", "Getriebe", "Übersetzung", "Räder", "Saddlesstütze", "Velopflege"
 ]
 
-ASCII_ALLOWED = set(chr(c) for c in range(32, 127)) | {"\t", "\n", "\r"}
+_NON_ASCII_RE = re.compile(r"[^\x20-\x7e\t\n\r]")
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_WHOLE_PATTERNS = []
+_SEGMENT_ITEMS = ()
+_SEGMENT_GATE = None
+
+
+def compile_rules():
+	# Build the matchers once from the tables; call again after editing the tables at runtime
+	global _WHOLE_PATTERNS, _SEGMENT_ITEMS, _SEGMENT_GATE
+	_WHOLE_PATTERNS = [(re.compile(pattern, flags=re.IGNORECASE), replacement) for pattern, replacement in WHOLE_REPLACEMENTS]
+	_SEGMENT_ITEMS = tuple(SEGMENT_TRANSLATIONS.items())
+	# One alternation over every key, longest first: a segment that contains no key is left
+	# untouched by the table, so only segments that hit it pay for the ordered replace chain
+	keys = sorted(SEGMENT_TRANSLATIONS, key=len, reverse=True)
+	_SEGMENT_GATE = re.compile("|".join(re.escape(k) for k in keys)) if keys else None
+	normalize_category.cache_clear()
+
+
+def translate_segment(seg: str) -> str:
+	if _SEGMENT_GATE is None or not _SEGMENT_GATE.search(seg):
+		return seg
+	# Replacements chain (e.g. "E-bike" -> "E-Bikes" feeds "Kompaktes / Faltbares E-Bikes"),
+	# so the table is applied in order to keep today's output byte-identical
+	for src, dst in _SEGMENT_ITEMS:
+		if src in seg:
+			seg = seg.replace(src, dst)
+	return seg
 
 
+@lru_cache(maxsize=65536)
 def normalize_category(raw: str) -> str:
 	if not raw:
 		return raw
 	value = raw.replace(" - ", " > ")
-	value = re.sub(r"\s+", " ", value).strip()
+	value = _WHITESPACE_RE.sub(" ", value).strip()
 
 	# Whole-string structural replacements
-	for pattern, replacement in WHOLE_REPLACEMENTS:
-		if re.match(pattern, value, flags=re.IGNORECASE):
+	for pattern, replacement in _WHOLE_PATTERNS:
+		if pattern.match(value):
 			value = replacement
 			break
 
 	# Segment translations with substring replacements
-	segments = [seg.strip() for seg in value.split(" > ")]
-	translated_segments = []
-	for seg in segments:
-		for src, dst in SEGMENT_TRANSLATIONS.items():
-			if src in seg:
-				seg = seg.replace(src, dst)
-		translated_segments.append(seg)
-	value = " > ".join(translated_segments)
+	value = " > ".join(translate_segment(seg.strip()) for seg in value.split(" > "))
 
 	# If first segment contains E-Bikes variants, normalize main/sub structure
 	parts = [p.strip() for p in value.split(" > ") if p.strip()]
@@ -128,75 +159,178 @@ def normalize_category(raw: str) -> str:
 
 	# Final tidy
 	value = value.replace("&amp;", "&")
-	value = re.sub(r"\s+", " ", value).strip()
+	value = _WHITESPACE_RE.sub(" ", value).strip()
 	return value
 
 
-def run():
+compile_rules()
+
+
+class CategoryVerifier:
+	# Collects the verification report while products stream past. Verdicts depend only on
+	# the category string, so they are computed once per distinct category; the category
+	# overview is rendered from a CategoryCube.
+
+	def __init__(self, foreign_terms=FOREIGN_TERMS):
+		# One whole-word pattern per term, so terms that start at the same offset (a term
+		# and a longer term it prefixes) are all counted; the combined alternation only
+		# gates the per-term searches for the clean categories that make up nearly all rows
+		self._foreign_terms = [(t, re.compile(r"\b" + re.escape(t) + r"\b")) for t in foreign_terms]
+		self._foreign_gate = re.compile(r"\b(?:" + "|".join(re.escape(t) for t in foreign_terms) + r")\b") if foreign_terms else None
+		self._verdicts = {}
+		self.rows = 0
+		self.non_ascii_rows = 0
+		self.mismatched_type = 0
+		self.foreign_hits = Counter()
+		self.cube = CategoryCube()
+
+	def _verdict(self, cat):
+		verdict = self._verdicts.get(cat)
+		if verdict is None:
+			non_ascii = bool(_NON_ASCII_RE.search(cat))
+			terms = ()
+			if self._foreign_gate is not None and self._foreign_gate.search(cat):
+				terms = tuple(t for t, pattern in self._foreign_terms if pattern.search(cat))
+			verdict = self._verdicts[cat] = (non_ascii, terms)
+		return verdict
+
+	def add(self, row):
+		cat = row.get("Product Category", "") or ""
+		typ = row.get("Type", "") or ""
+		self.rows += 1
+
+		# Type matches Category
+		if cat != typ:
+			self.mismatched_type += 1
+
+		non_ascii, terms = self._verdict(cat)
+		if non_ascii:
+			self.non_ascii_rows += 1
+		for term in terms:
+			self.foreign_hits[term] += 1
+		return row
+
+	def add_product(self, product):
+		# The row checks run on every row; the cube counts the product once
+		self.cube.add(product)
+		for row in product:
+			self.add(row)
+		return product
+
+	@property
+	def passed(self):
+		return not (self.mismatched_type or self.non_ascii_rows or self.foreign_hits)
+
+	def write_report(self, report_path):
+		with open(report_path, "w", encoding="utf-8") as r:
+			r.write("One-Pass Category Normalization Report\n")
+			r.write("====================================\n\n")
+			r.write(f"Type equals Category mismatches: {self.mismatched_type}\n")
+			r.write(f"Rows with non-ASCII in Category: {self.non_ascii_rows}\n")
+			r.write("Remaining foreign terms (should be empty):\n")
+			for term, cnt in sorted(self.foreign_hits.items(), key=lambda x: (-x[1], x[0])):
+				r.write(f"- {term}: {cnt}\n")
+			if not self.foreign_hits:
+				r.write("- None\n")
+			r.write("\nCategory overview:\n")
+			for main, subs in sorted(self.cube.main_subcategories().items()):
+				total = sum(subs.values())
+				r.write(f"{main} (Total: {total})\n")
+				for sub, cnt in sorted(subs.items()):
+					r.write(f"  - {sub}: {cnt}\n")
+
+
+def verify_csv(path, report_path="verification_report.txt"):
+	# Standalone check of any catalog CSV; the file itself is not rewritten
+	verifier = CategoryVerifier()
+	with open(path, "r", encoding="utf-8-sig", newline="") as f:
+		for product in iter_products(csv.DictReader(f)):
+			verifier.add_product(product)
+	verifier.write_report(report_path)
+	return verifier
+
+
+def run(metrics=None):
 	in_path = "products_translated_english.csv"
 	out_path = "products_final.csv"
 	report_path = "verification_report.txt"
+	metrics = metrics or RunMetrics("normalize_categories")
+	metrics.watch_cache("normalize_category", normalize_category)
 
+	# Verification runs inline on the rows as they are written
+	verifier = CategoryVerifier()
+	normalize = metrics.wrap("normalize", normalize_category)
+	verify = metrics.wrap("verify", verifier.add_product)
 	with open(in_path, "r", encoding="utf-8-sig", newline="") as f_in, \
 		 open(out_path, "w", encoding="utf-8", newline="") as f_out:
 		reader = csv.DictReader(f_in)
 		writer = csv.DictWriter(f_out, fieldnames=reader.fieldnames)
 		writer.writeheader()
+		writerow = metrics.wrap("csv_write", writer.writerow)
+
+		# Categories live on each product's first row; variant and image rows pass through
+		for product in iter_products(metrics.iterate("csv_parse", reader)):
+			head = product.head
+			raw = head.get("Product Category", "")
+			cat = normalize(raw)
+			if cat != raw:
+				metrics.count("products_changed")
+			head["Product Category"] = cat
+			head["Type"] = cat
+			for row in product:
+				writerow(row)
+			verify(product)
+
+	with metrics.stage("write_report"):
+		verifier.write_report(report_path)
+	metrics.count("rows", verifier.rows)
+	metrics.count("foreign_term_hits", sum(verifier.foreign_hits.values()))
+	metrics.count("non_ascii_rows", verifier.non_ascii_rows)
+
+
+def check_golden(in_path="products_translated_english.csv", golden_path="products_final.csv"):
+	# Re-normalize in memory and compare byte-for-byte with the committed output
+	buf = io.StringIO(newline="")
+	with open(in_path, "r", encoding="utf-8-sig", newline="") as f_in:
+		reader = csv.DictReader(f_in)
+		writer = csv.DictWriter(buf, fieldnames=reader.fieldnames)
+		writer.writeheader()
+		for product in iter_products(reader):
+			cat = normalize_category(product.get("Product Category"))
+			product.head["Product Category"] = cat
+			product.head["Type"] = cat
+			writer.writerows(product.rows)
+	with open(golden_path, "r", encoding="utf-8", newline="") as f:
+		expected = f.read()
+	actual = buf.getvalue()
+	if actual == expected:
+		return None
+	for line_no, (a, e) in enumerate(zip(actual.splitlines(), expected.splitlines()), 1):
+		if a != e:
+			return f"line {line_no}:\n  expected: {e}\n  actual:   {a}"
+	return f"length differs: expected {len(expected)} chars, got {len(actual)}"
 
-		for row in reader:
-			cat = normalize_category(row.get("Product Category", ""))
-			row["Product Category"] = cat
-			row["Type"] = cat
-			writer.writerow(row)
-
-	# Verification
-	non_ascii_rows = 0
-	mismatched_type = 0
-	foreign_hits = Counter()
-	main_counts = defaultdict(Counter)
-
-	with open(out_path, "r", encoding="utf-8", newline="") as f:
-		reader = csv.DictReader(f)
-		for row in reader:
-			cat = row.get("Product Category", "")
-			typ = row.get("Type", "")
-
-			# Type matches Category
-			if cat != typ:
-				mismatched_type += 1
-
-			# Non-ASCII detection
-			if any(ch not in ASCII_ALLOWED for ch in cat):
-				non_ascii_rows += 1
-
-			# Foreign term detection with whole-word regex
-			for term in FOREIGN_TERMS:
-				if re.search(rf"\b{re.escape(term)}\b", cat):
-					foreign_hits[term] += 1
-
-			# Main/subcategory counts
-			parts = [p.strip() for p in cat.split(" > ") if p.strip()]
-			if parts:
-				main = parts[0]
-				sub = parts[1] if len(parts) > 1 else "(No subcategory)"
-				main_counts[main][sub] += 1
-
-	with open(report_path, "w", encoding="utf-8") as r:
-		r.write("One-Pass Category Normalization Report\n")
-		r.write("====================================\n\n")
-		r.write(f"Type equals Category mismatches: {mismatched_type}\n")
-		r.write(f"Rows with non-ASCII in Category: {non_ascii_rows}\n")
-		r.write("Remaining foreign terms (should be empty):\n")
-		for term, cnt in sorted(foreign_hits.items(), key=lambda x: (-x[1], x[0])):
-			r.write(f"- {term}: {cnt}\n")
-		if not foreign_hits:
-			r.write("- None\n")
-		r.write("\nCategory overview:\n")
-		for main, subs in sorted(main_counts.items()):
-			total = sum(subs.values())
-			r.write(f"{main} (Total: {total})\n")
-			for sub, cnt in sorted(subs.items()):
-				r.write(f"  - {sub}: {cnt}\n")
 
 if __name__ == "__main__":
-	run()
+	parser = argparse.ArgumentParser(description="Normalize product categories and write the verification report.")
+	parser.add_argument("--check", action="store_true", help="only compare normalization against products_final.csv")
+	parser.add_argument("--verify", metavar="CSV", help="only verify an existing catalog CSV, without rewriting it")
+	parser.add_argument("--report", default="verification_report.txt", help="report path for --verify")
+	add_arguments(parser)
+	args = parser.parse_args()
+	if args.verify:
+		verifier = verify_csv(args.verify, args.report)
+		print(f"Verified {verifier.rows} rows of {args.verify} -> {args.report}: {'OK' if verifier.passed else 'ISSUES FOUND'}")
+		sys.exit(0 if verifier.passed else 1)
+	elif args.check:
+		diff = check_golden()
+		if diff:
+			print("Golden check FAILED at", diff)
+			sys.exit(1)
+		print("Golden check passed: output is byte-identical to products_final.csv")
+	else:
+		metrics = from_args("normalize_categories", args)
+		with profiled(args.profile):
+			run(metrics)
+		if metrics.write():
+			print(f"Wrote {metrics.report_path}")
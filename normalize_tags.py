@@ -0,0 +1,222 @@
+import argparse
+import csv
+import os
+import re
+from collections import Counter
+
+from product_groups import is_head
+
+SRC = "products_final.csv"
+REPORT = "tag_frequencies.csv"
+
+# Whole-tag translations of the German/Italian shop tags, named like the matching
+# category segments after normalize_categories. Matched on the folded tag (see tag_key).
+TAG_TRANSLATIONS = {
+    # Main groups
+    "Teile": "Parts",
+    "Zubehör": "Accessories",
+    "Velos": "Bikes",
+
+    # Parts
+    "Bremsen": "Brakes",
+    "Dämpfer & Federgabel": "Suspension",
+    "Getriebe und Übersetzung": "Gears and Transmission",
+    "Griffe": "Grips",
+    "Lenker": "Handlebars",
+    "Pedale": "Pedals",
+    "Räder": "Wheels",
+    "Sattel": "Saddles",
+    "Sattelstütze": "Seatpost",
+    "Velopflege": "Bike Care",
+
+    # Accessories
+    "Anhänger": "Trailers",
+    "Bekleidung": "Clothing",
+    "Caricatori": "Chargers",
+    "Gepäckträger": "Luggage Racks",
+    "Handy": "Phone Mounts",
+    "Helme": "Helmets",
+    "Kindersitz": "Child Seats",
+    "Klingeln": "Bells",
+    "Körbe": "Baskets",
+    "Lichte": "Lights",
+    "Pumpen": "Pumps",
+    "Regenschutz": "Rain Protection",
+    "Schlösser": "Locks",
+    "Schutzbleche": "Fenders",
+    "Spiegel": "Mirrors",
+    "Ständer": "Stands",
+    "Trinkflaschen": "Bottles",
+    "Velotaschen": "Bags",
+    "Werkstatt / Werkzeuge": "Tools",
+
+    # Bikes and E-Bikes
+    "Cargo e-bike": "Cargo",
+    "E-bike 24 Zoll": "24 Inch",
+    "E-bike 26 Zoll": "26 Inch",
+    "E-bike City & Trekking": "City & Trekking",
+    "E-MTB Fully": "E-MTB Full Suspension",
+    "Gebraucht": "Used",
+    "Kindervelos": "Kids Bikes",
+    "Mountainbike": "Mountain Bikes",
+    "Occasion": "Used",
+    "Velo Sale": "Sale",
+}
+
+_KEY_RE = re.compile(r"[\s_-]+")
+
+
+def tag_key(tag):
+    # Spellings that differ only in case, spaces, hyphens or underscores are one tag
+    # ("RIESE & MÜLLER" / "riese-&-müller")
+    return _KEY_RE.sub(" ", tag).strip().casefold()
+
+
+def split_tags(cell):
+    return [t.strip() for t in (cell or "").split(",") if t.strip()]
+
+
+class TagVocabulary:
+    # Every distinct raw tag gets an integer id the first time it is seen, and every
+    # distinct Tags cell is parsed once into a tuple of ids. Translation, folding and the
+    # choice of spelling then happen once per id, not once per product.
+
+    def __init__(self, translations=TAG_TRANSLATIONS):
+        self.translations = {tag_key(k): v for k, v in translations.items()}
+        self.names = []
+        self._ids = {}
+        self._parsed = {}
+        self.cells = Counter()
+        self._canonical = None
+        self._best = {}
+        self._rendered = {}
+
+    def intern(self, tag):
+        i = self._ids.get(tag)
+        if i is None:
+            i = self._ids[tag] = len(self.names)
+            self.names.append(tag)
+        return i
+
+    def parse(self, cell):
+        ids = self._parsed.get(cell)
+        if ids is None:
+            ids = self._parsed[cell] = tuple(dict.fromkeys(self.intern(t) for t in split_tags(cell)))
+        return ids
+
+    def add(self, cell, n=1):
+        # First pass: one call per product (or per distinct cell with its product count);
+        # identical cells are parsed once and counted
+        self.cells[cell] += n
+        self._canonical = None
+        self._rendered = {}
+        return self.parse(cell)
+
+    def canonical(self):
+        # [id -> canonical tag]. A translated tag counts as its translation; each folded
+        # key then takes its most used spelling, preferring capitalised brand spellings
+        # on ties ("NS Bikes" over "ns-bikes"). Names interned after the counting (from
+        # cells add() never saw) map onto the counted spellings, else onto themselves.
+        if self._canonical is None:
+            used = Counter()
+            for cell, n in self.cells.items():
+                for i in self._parsed[cell]:
+                    used[i] += n
+            spellings = {}
+            for i, name in enumerate(self.names):
+                spelling = self.translations.get(tag_key(name), name)
+                by_spelling = spellings.setdefault(tag_key(spelling), Counter())
+                by_spelling[spelling] += used[i]
+            self._best = {key: max(c, key=lambda s: (c[s], not s.islower())) for key, c in spellings.items()}
+            self._canonical = []
+            self._rendered = {}
+        for name in self.names[len(self._canonical):]:
+            spelling = self.translations.get(tag_key(name), name)
+            self._canonical.append(self._best.get(tag_key(spelling), spelling))
+        return self._canonical
+
+    def tags(self, cell):
+        # The canonical, de-duplicated tags of a cell, in first-seen order. Parsed before
+        # canonical() is read, so names the cell adds to the vocabulary are mapped too.
+        tags = self._rendered.get(cell)
+        if tags is None:
+            ids = self.parse(cell)
+            canonical = self.canonical()
+            tags = self._rendered[cell] = tuple(dict.fromkeys(canonical[i] for i in ids))
+        return tags
+
+    def normalize(self, cell):
+        return ", ".join(self.tags(cell))
+
+    def normalize_row(self, row):
+        # Row-wise form for the export: only the product row carries Tags
+        if is_head(row):
+            row["Tags"] = self.normalize(row.get("Tags", ""))
+        return row
+
+    def frequencies(self):
+        # {canonical tag: products carrying it}, over the cells counted by add()
+        counts = Counter()
+        for cell, n in self.cells.items():
+            for tag in self.tags(cell):
+                counts[tag] += n
+        return counts
+
+    def spellings(self):
+        # {canonical tag: raw spellings merged into it}
+        merged = {}
+        for name, tag in zip(self.names, self.canonical()):
+            merged.setdefault(tag, []).append(name)
+        return merged
+
+    def write_report(self, path=REPORT):
+        merged = self.spellings()
+        frequencies = self.frequencies()
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Tag", "Products", "Spellings"])
+            for tag, n in sorted(frequencies.items(), key=lambda kv: (-kv[1], kv[0].casefold())):
+                writer.writerow([tag, n, " | ".join(s for s in merged.get(tag, ()) if s != tag)])
+
+
+def read_vocabulary(path, translations=TAG_TRANSLATIONS):
+    # First pass over a catalog CSV: intern every product's Tags cell
+    vocab = TagVocabulary(translations)
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        for row in csv.DictReader(f):
+            if is_head(row):
+                vocab.add(row.get("Tags", ""))
+    return vocab
+
+
+def normalize_file(src, out, vocab):
+    # Second pass; out may be src, it is replaced only once fully written
+    tmp_path = out + ".tmp"
+    with open(src, "r", encoding="utf-8-sig", newline="") as f_in, \
+         open(tmp_path, "w", encoding="utf-8", newline="") as f_out:
+        reader = csv.DictReader(f_in)
+        writer = csv.DictWriter(f_out, fieldnames=reader.fieldnames)
+        writer.writeheader()
+        for row in reader:
+            writer.writerow(vocab.normalize_row(row))
+    os.replace(tmp_path, out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Translate, fold and de-duplicate the Tags column and report tag frequencies.")
+    parser.add_argument("--src", default=SRC)
+    parser.add_argument("--out", help="write a copy with normalized tags (may be --src); default: report only")
+    parser.add_argument("--report", default=REPORT)
+    args = parser.parse_args()
+
+    vocab = read_vocabulary(args.src)
+    if args.out:
+        normalize_file(args.src, args.out, vocab)
+    vocab.write_report(args.report)
+    print(f"{len(vocab.names)} distinct tags in {args.src} -> {len(set(vocab.canonical()))} canonical ({args.report})")
+    if args.out:
+        print(f"Wrote {args.out} with normalized tags")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import argparse
+import csv
+import io
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from catalog_pipeline import (DEFAULT_STAGES, OUT, SRC, apply_stages, build_stages, count_tag_cells, tags_input,
+                              use_tag_vocabulary, vocabulary_from)
+
+# Shards smaller than this are not worth a process round-trip
+MIN_SHARD_BYTES = 1 << 20
+SCAN_BLOCK = 1 << 22
+
+
+def record_end(mm, pos, in_quotes=False):
+    # Offset just past the first record terminator at or after pos, honouring quoted
+    # fields that contain newlines ("" inside a quoted field toggles twice, so parity works)
+    size = len(mm)
+    while pos < size:
+        nl = mm.find(b"\n", pos)
+        if nl < 0:
+            return size
+        if mm[pos:nl].count(b'"') % 2:
+            in_quotes = not in_quotes
+        pos = nl + 1
+        if not in_quotes:
+            return pos
+    return size
+
+
+def quote_parity(mm, start, end):
+    odd = False
+    for block in range(start, end, SCAN_BLOCK):
+        if mm[block:min(block + SCAN_BLOCK, end)].count(b'"') % 2:
+            odd = not odd
+    return odd
+
+
+def shard_ranges(path, n_shards):
+    # Byte ranges [start, end) of the data records, split on record boundaries
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data_start = record_end(mm, 0)
+            n_shards = max(1, min(n_shards, (size - data_start) // MIN_SHARD_BYTES))
+            step = (size - data_start) / n_shards
+            bounds = [data_start]
+            for i in range(1, n_shards):
+                target = data_start + int(step * i)
+                if target <= bounds[-1]:
+                    continue
+                # bounds[-1] is a record start, so the quote parity up to target says
+                # whether target sits inside a quoted field
+                boundary = record_end(mm, target, quote_parity(mm, bounds[-1], target))
+                if boundary >= size:
+                    break
+                bounds.append(boundary)
+            bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+class RangeReader(io.RawIOBase):
+    # Raw file view limited to [start, end), so each worker streams only its shard
+
+    def __init__(self, path, start, end):
+        self._f = open(path, "rb")
+        self._f.seek(start)
+        self._left = end - start
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if self._left <= 0:
+            return 0
+        view = memoryview(b)[:min(len(b), self._left)]
+        n = self._f.readinto(view)
+        self._left -= n
+        return n
+
+    def close(self):
+        self._f.close()
+        super().close()
+
+
+def open_range(path, start, end):
+    return io.TextIOWrapper(io.BufferedReader(RangeReader(path, start, end)), encoding="utf-8", newline="")
+
+
+def count_shard_tags(task):
+    # First pass of the tags stage, per shard: {raw Tags cell: products}
+    path, start, end, fieldnames = task
+    with open_range(path, start, end) as f:
+        return count_tag_cells(csv.reader(f), fieldnames)
+
+
+def run_shard(task):
+    path, start, end, fieldnames, stage_names, vocab, shard_path = task
+    if vocab is not None:
+        use_tag_vocabulary(vocab)
+    stages = build_stages(stage_names)
+    count = 0
+    with open_range(path, start, end) as f_in, \
+         open(shard_path, "w", encoding="utf-8", newline="") as f_out:
+        reader = csv.DictReader(f_in, fieldnames=fieldnames)
+        writer = csv.DictWriter(f_out, fieldnames=fieldnames)
+        for row in apply_stages(reader, stages):
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def run_parallel(src=SRC, out=OUT, stage_names=DEFAULT_STAGES, workers=None, shards=None):
+    workers = workers or os.cpu_count() or 1
+    ranges = shard_ranges(src, shards or workers * 4)
+    with open(src, "r", encoding="utf-8-sig", newline="") as f:
+        fieldnames = next(csv.reader(f), [])
+    build_stages(stage_names)  # fail fast on unknown stages before forking
+
+    out_dir = os.path.dirname(os.path.abspath(out))
+    with tempfile.TemporaryDirectory(dir=out_dir, prefix=".shards-") as tmp:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # The tag vocabulary needs the whole catalog: the shards count their Tags cells,
+            # the counts are merged here and the vocabulary is shipped to every shard
+            vocab = None
+            if "tags" in stage_names:
+                cells = Counter()
+                for shard_cells in pool.map(count_shard_tags, [(src, start, end, fieldnames) for start, end in ranges]):
+                    cells.update(shard_cells)
+                vocab = vocabulary_from(cells, tags_input(stage_names))
+            tasks = [
+                (src, start, end, fieldnames, list(stage_names), vocab, os.path.join(tmp, f"{i:05d}.csv"))
+                for i, (start, end) in enumerate(ranges)
+            ]
+            counts = list(pool.map(run_shard, tasks))
+
+        # Shards are concatenated in input order, so output order is deterministic
+        with open(out, "w", encoding="utf-8", newline="") as f_out:
+            csv.writer(f_out).writerow(fieldnames)
+            for task in tasks:
+                with open(task[-1], "r", encoding="utf-8", newline="") as f_shard:
+                    shutil.copyfileobj(f_shard, f_out)
+    return sum(counts), len(tasks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the catalog pipeline over byte-range shards in a process pool.")
+    parser.add_argument("--src", default=SRC)
+    parser.add_argument("--out", default=OUT)
+    parser.add_argument("--stages", default=",".join(DEFAULT_STAGES))
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--shards", type=int, default=None, help="shard count (default: 4 per worker)")
+    args = parser.parse_args()
+
+    stage_names = [s.strip() for s in args.stages.split(",") if s.strip()]
+    try:
+        count, n_shards = run_parallel(args.src, args.out, stage_names, args.workers, args.shards)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+    print(f"Wrote {args.out} ({count} rows, {n_shards} shards) via {' -> '.join(stage_names)}.")
+
+
+if __name__ == "__main__":
+    main()
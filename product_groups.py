@@ -0,0 +1,63 @@
+from itertools import groupby
+
+# Any of these set means the row describes a purchasable variant
+VARIANT_COLUMNS = ("Variant SKU", "Variant Price", "Option1 Value", "Variant Barcode")
+
+
+def is_head(row):
+    # The product row is the one with a Title; in a Shopify export that is always the
+    # first row of its Handle, so row-wise code (shards, the incremental cache) agrees
+    # with iter_products() without seeing the neighbouring rows
+    return bool(row.get("Title"))
+
+
+def is_variant(row):
+    return any(row.get(c) for c in VARIANT_COLUMNS)
+
+
+class Product:
+    # All rows of one Handle, in file order. head carries the product columns.
+
+    __slots__ = ("handle", "rows")
+
+    def __init__(self, handle, rows):
+        self.handle = handle
+        self.rows = rows
+
+    @property
+    def head(self):
+        return self.rows[0]
+
+    @property
+    def variants(self):
+        return [r for r in self.rows if is_variant(r)]
+
+    @property
+    def images(self):
+        return [r for r in self.rows if r.get("Image Src")]
+
+    def get(self, column, default=""):
+        return self.head.get(column, default)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __repr__(self):
+        return f"Product({self.handle!r}, {len(self.rows)} rows)"
+
+
+def iter_products(rows):
+    # Streams products; only one product's rows are held at a time
+    for handle, group in groupby(rows, key=lambda r: r.get("Handle", "")):
+        yield Product(handle, list(group))
+
+
+def product_stage(fn):
+    # Row-wise form for stage chains: fn runs on the product row, the other rows pass through
+    def stage(row):
+        return fn(row) if is_head(row) else row
+    stage.__name__ = getattr(fn, "__name__", "stage")
+    return stage
@@ -0,0 +1,186 @@
+import argparse
+import csv
+import os
+import re
+from collections import Counter, defaultdict
+
+from catalog_store import iter_records, render_record
+
+SRC = "200-products-with-collections.csv"
+CHANGES = "collection_changes.csv"
+TYPE_COLUMN = "Product Type"
+CURRENT_COLUMN = "Current Collection"
+TARGET_COLUMN = "Reassign to Collection"
+
+# (Product Type prefix, collection, conditions). The most specific prefix that has a
+# matching rule wins; within one prefix, rules with conditions are tried before the
+# plain fallback, in the order listed. Conditions (all must hold):
+#   tags   - any of these tags
+#   vendor - any of these vendors
+#   title  - regex searched in the title
+# Prefixes, tags and vendors are compared case-insensitively with whitespace collapsed.
+COLLECTION_RULES = [
+    # Parts
+    ("Teile", "Parts - E-Bike Components", {"tags": ("e-bike", "battery")}),
+    ("Teile", "Parts - General", {}),
+    ("Teile > Bosch", "Parts - E-Bike Components", {}),
+    ("Teile > Bremsen", "Parts - Brakes", {}),
+    ("Teile > Dämpfer & Federgabel", "Parts - Suspension", {}),
+    ("Teile > Getriebe und Übersetzung", "Parts - Drivetrain & Gears", {}),
+    ("Teile > Griffe", "Parts - Handlebars & Grips", {}),
+    ("Teile > Lenker", "Parts - Handlebars & Grips", {}),
+    ("Teile > Pedale", "Parts - Drivetrain & Gears", {"title": r"kurbel|pedivelle|guarnitura|crank"}),
+    ("Teile > Pedale", "Parts - Pedals", {}),
+    ("Teile > Räder", "Parts - Wheels & Tires", {}),
+    ("Teile > Sattel", "Parts - Saddles & Seatposts", {}),
+    ("Teile > Sattelstütze", "Parts - Saddles & Seatposts", {}),
+    ("Teile > Velopflege", "Parts - Bike Care Products", {}),
+
+    # Accessories
+    ("Zubehör", "Accessories - General", {}),
+    ("Zubehör > Anhänger", "Accessories - Trailers", {}),
+    ("Zubehör > Bekleidung", "Accessories - Clothing", {}),
+    ("Zubehör > Gepäckträger", "Accessories - Racks & Carriers", {}),
+    ("Zubehör > Helme", "Accessories - Helmets", {}),
+    ("Zubehör > Kindersitz", "Accessories - Child Seats", {}),
+    ("Zubehör > Klingeln", "Accessories - Bells", {}),
+    ("Zubehör > Körbe", "Accessories - Baskets", {}),
+    ("Zubehör > Lichte", "Accessories - Lights & Visibility", {}),
+    ("Zubehör > Pumpen", "Accessories - Pumps", {}),
+    ("Zubehör > Schlösser", "Accessories - Locks & Security", {}),
+    ("Zubehör > Schutzbleche", "Accessories - Fenders", {}),
+    ("Zubehör > Spiegel", "Accessories - Mirrors", {}),
+    ("Zubehör > Ständer", "Accessories - Kickstands", {}),
+    ("Zubehör > Tools", "Parts - Maintenance & Tools", {}),
+    ("Zubehör > Trinkflaschen", "Accessories - Water Bottles", {}),
+    ("Zubehör > Velotaschen", "Accessories - Bags & Panniers", {}),
+    ("Zubehör > Werkstatt / Werkzeuge", "Parts - Maintenance & Tools", {}),
+
+    # Bikes
+    ("Bikes", "Bikes", {}),
+    ("E-Bikes", "E-Bikes", {}),
+]
+
+
+def norm(text):
+    return " ".join((text or "").split()).casefold()
+
+
+def type_path(product_type):
+    return tuple(norm(p) for p in (product_type or "").split(">") if p.strip())
+
+
+def split_tags(tags):
+    return {norm(t) for t in (tags or "").split(",") if t.strip()}
+
+
+class Rule:
+    __slots__ = ("collection", "tags", "vendors", "title")
+
+    def __init__(self, collection, tags=(), vendor=(), title=None):
+        self.collection = collection
+        self.tags = frozenset(norm(t) for t in tags)
+        self.vendors = frozenset(norm(v) for v in vendor)
+        self.title = re.compile(title, re.I) if title else None
+
+    @property
+    def conditional(self):
+        return bool(self.tags or self.vendors or self.title)
+
+    def matches(self, tags, vendor, title):
+        if self.tags and self.tags.isdisjoint(tags):
+            return False
+        if self.vendors and vendor not in self.vendors:
+            return False
+        if self.title and not self.title.search(title):
+            return False
+        return True
+
+
+def compile_rules(rules=COLLECTION_RULES):
+    # {type prefix path: [Rule, ...]}; a lookup only visits the prefixes of one product
+    # type instead of scanning every rule
+    index = defaultdict(list)
+    for prefix, collection, conditions in rules:
+        index[type_path(prefix)].append(Rule(collection, **conditions))
+    for bucket in index.values():
+        bucket.sort(key=lambda r: not r.conditional)
+    return dict(index)
+
+
+def assign_collection(index, row):
+    # Collection for one product row, or None if no rule covers its type
+    path = type_path(row.get(TYPE_COLUMN))
+    tags = split_tags(row.get("Tags"))
+    vendor = norm(row.get("Vendor"))
+    title = row.get("Title") or ""
+    for depth in range(len(path), 0, -1):
+        for rule in index.get(path[:depth], ()):
+            if rule.matches(tags, vendor, title):
+                return rule.collection
+    return None
+
+
+def reassign(src, out, changes_path, index):
+    # One pass: every record goes to out with the target column filled (unchanged
+    # bytes otherwise), and only products whose collection changes go to changes_path
+    stats = Counter()
+    with open(src, "rb") as f:
+        bom = f.read(3) == b"\xef\xbb\xbf"
+    tmp = out + ".tmp"
+    with open(src, "r", encoding="utf-8-sig", newline="") as f_in, \
+            open(tmp, "w", encoding="utf-8-sig" if bom else "utf-8", newline="") as f_out, \
+            open(changes_path, "w", encoding="utf-8", newline="") as f_changes:
+        records = iter_records(f_in)
+        header, layout = next(records)
+        missing = [c for c in (TYPE_COLUMN, CURRENT_COLUMN, TARGET_COLUMN) if c not in header]
+        if missing:
+            raise ValueError(f"{src} has no column(s): {', '.join(missing)}")
+        target = header.index(TARGET_COLUMN)
+        f_out.write(render_record(header, layout))
+
+        changes = csv.writer(f_changes)
+        changes.writerow(["Product ID", "Handle", "Title", CURRENT_COLUMN, TARGET_COLUMN])
+        for fields, layout in records:
+            if fields == [""]:
+                f_out.write(render_record(fields, layout))
+                continue
+            row = dict(zip(header, fields))
+            current = row.get(CURRENT_COLUMN, "")
+            collection = assign_collection(index, row)
+            stats["products"] += 1
+            if collection is None:
+                stats["unmatched"] += 1
+                collection = current
+            stats["collection:" + collection] += 1
+            if norm(collection) != norm(current):
+                stats["changed"] += 1
+                changes.writerow([row.get("Product ID", ""), row.get("Handle", ""), row.get("Title", ""), current, collection])
+            if row.get(TARGET_COLUMN, "") != collection:
+                stats["rewritten"] += 1
+                fields[target] = collection
+            f_out.write(render_record(fields, layout))
+    os.replace(tmp, out)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fill in collection reassignments from rules and write the change set.")
+    parser.add_argument("--src", default=SRC)
+    parser.add_argument("--out", help="CSV with the reassignment column filled in (default: update --src in place)")
+    parser.add_argument("--changes", default=CHANGES, help="only the products whose collection changes")
+    args = parser.parse_args()
+
+    index = compile_rules()
+    stats = reassign(args.src, args.out or args.src, args.changes, index)
+    print(f"Assigned collections for {stats['products']} products "
+          f"({len(COLLECTION_RULES)} rules over {len(index)} type prefixes)")
+    print(f"- {stats['changed']} change collection -> {args.changes}")
+    print(f"- {stats['unmatched']} not covered by any rule (kept as is)")
+    print(f"- {stats['rewritten']} reassignment cells updated in {args.out or args.src}")
+    for key, cnt in sorted(((k, c) for k, c in stats.items() if k.startswith("collection:")), key=lambda kv: -kv[1]):
+        print(f"  {key[len('collection:'):] or '(none)'}: {cnt}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+import cProfile
+import json
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+REPORT_PATH = "run_report.json"
+PROFILE_PATH = "run_profile.prof"
+
+# CATALOG_METRICS=1 turns metrics on for every script without passing --metrics
+ENV_FLAG = "CATALOG_METRICS"
+
+
+class RunMetrics:
+    # Opt-in per-stage timing and counters. A disabled instance does nothing and the
+    # scripts skip wrapping their stages, so the cost when off is a few attribute checks.
+
+    def __init__(self, script, enabled=False, report_path=REPORT_PATH):
+        self.script = script
+        self.enabled = enabled
+        self.report_path = report_path
+        self.wall = Counter()
+        self.cpu = Counter()
+        self.items = Counter()
+        self.counters = Counter()
+        self.caches = {}
+        self._started = time.perf_counter()
+        self._started_cpu = time.process_time()
+
+    @contextmanager
+    def stage(self, name, items=None):
+        if not self.enabled:
+            yield
+            return
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.wall[name] += time.perf_counter() - wall
+            self.cpu[name] += time.process_time() - cpu
+            if items is not None:
+                self.items[name] += items
+
+    def wrap(self, name, fn):
+        # Time a per-row callable; each call counts as one item
+        if not self.enabled:
+            return fn
+        perf, proc = time.perf_counter, time.process_time
+
+        def timed(*args):
+            wall, cpu = perf(), proc()
+            try:
+                return fn(*args)
+            finally:
+                self.wall[name] += perf() - wall
+                self.cpu[name] += proc() - cpu
+                self.items[name] += 1
+        return timed
+
+    def iterate(self, name, iterable):
+        # Time spent producing items (e.g. CSV parsing inside a generator chain)
+        if not self.enabled:
+            return iterable
+        return self._timed_iter(name, iterable)
+
+    def _timed_iter(self, name, iterable):
+        it = iter(iterable)
+        perf, proc = time.perf_counter, time.process_time
+        while True:
+            wall, cpu = perf(), proc()
+            try:
+                item = next(it)
+            except StopIteration:
+                self.wall[name] += perf() - wall
+                self.cpu[name] += proc() - cpu
+                return
+            self.wall[name] += perf() - wall
+            self.cpu[name] += proc() - cpu
+            self.items[name] += 1
+            yield item
+
+    def count(self, name, n=1):
+        if self.enabled:
+            self.counters[name] += n
+
+    def watch_cache(self, name, cached_fn):
+        # functools.lru_cache functions; hit rates are read when the report is written
+        if self.enabled:
+            self.caches[name] = cached_fn
+
+    def report(self):
+        total_wall = time.perf_counter() - self._started
+        stages = {}
+        for name in self.wall:
+            wall = self.wall[name]
+            items = self.items.get(name)
+            stages[name] = {
+                "wall_s": round(wall, 4),
+                "cpu_s": round(self.cpu[name], 4),
+                "share": round(wall / total_wall, 3) if total_wall else None,
+            }
+            if items:
+                stages[name]["items"] = items
+                stages[name]["per_sec"] = round(items / wall, 1) if wall else None
+        caches = {}
+        for name, fn in self.caches.items():
+            info = fn.cache_info()
+            lookups = info.hits + info.misses
+            caches[name] = {"hits": info.hits, "misses": info.misses, "size": info.currsize,
+                            "hit_rate": round(info.hits / lookups, 4) if lookups else None}
+        return {
+            "finished": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "wall_s": round(total_wall, 4),
+            "cpu_s": round(time.process_time() - self._started_cpu, 4),
+            "stages": stages,
+            "counters": dict(self.counters),
+            "caches": caches,
+        }
+
+    def write(self):
+        # One file for all scripts, keyed by script name, so a chain of runs shares a report
+        if not self.enabled:
+            return None
+        reports = {}
+        if os.path.exists(self.report_path):
+            try:
+                with open(self.report_path, "r", encoding="utf-8") as f:
+                    reports = json.load(f)
+            except (OSError, ValueError):
+                reports = {}
+        reports[self.script] = self.report()
+        with open(self.report_path, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=2)
+        return self.report_path
+
+
+def add_arguments(parser):
+    parser.add_argument("--metrics", action="store_true",
+                        help=f"write per-stage timings and counters to {REPORT_PATH} (or set {ENV_FLAG}=1)")
+    parser.add_argument("--profile", nargs="?", const=PROFILE_PATH, metavar="PATH",
+                        help=f"also dump a cProfile of the run (default {PROFILE_PATH})")
+
+
+def from_args(script, args):
+    enabled = bool(getattr(args, "metrics", False) or getattr(args, "profile", None)
+                   or os.environ.get(ENV_FLAG, "") not in ("", "0"))
+    return RunMetrics(script, enabled)
+
+
+@contextmanager
+def profiled(path):
+    # cProfile the block when a path is given; otherwise a no-op
+    if not path:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+        print(f"Wrote profile {path}")
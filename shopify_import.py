@@ -0,0 +1,518 @@
+import argparse
+import asyncio
+import csv
+import hashlib
+import json
+import os
+import random
+import ssl
+import sys
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+from catalog_keys import strip_text_marker
+from product_groups import iter_products
+
+SRC = "products_for_shopify.csv"
+CHECKPOINT = ".shopify_import.jsonl"
+# --mock runs keep their own checkpoint, so a benchmark never marks products as imported.
+# The mock shop starts empty every run, so the mock checkpoint is cleared at the start.
+MOCK_CHECKPOINT = ".shopify_import.mock.jsonl"
+ERRORS = "shopify_import_errors.csv"
+API_VERSION = "2025-01"
+
+BATCH_SIZE = 10
+CONCURRENCY = 4
+MAX_RETRIES = 6
+# Seconds a response may take to arrive; a stalled socket is then retried like a 5xx
+READ_TIMEOUT = 60.0
+
+# Learned from the first responses; only used until then
+INITIAL_MUTATION_COST = 10.0
+
+
+def product_input(product):
+    # ProductSetInput for one product (all rows of one Handle)
+    head = product.head
+    option_names = [head.get(f"Option{i} Name", "") for i in (1, 2, 3) if head.get(f"Option{i} Name")]
+    values = {name: [] for name in option_names}
+    variants = []
+    for row in product.variants:
+        option_values = []
+        for i, name in enumerate(option_names, 1):
+            value = row.get(f"Option{i} Value", "")
+            if value and value not in values[name]:
+                values[name].append(value)
+            option_values.append({"optionName": name, "name": value})
+        variant = {"optionValues": option_values, "price": row.get("Variant Price") or "0.00"}
+        if row.get("Variant Compare At Price"):
+            variant["compareAtPrice"] = row["Variant Compare At Price"]
+        if strip_text_marker(row.get("Variant Barcode")):
+            variant["barcode"] = strip_text_marker(row["Variant Barcode"])
+        if strip_text_marker(row.get("Variant SKU")):
+            variant["inventoryItem"] = {"sku": strip_text_marker(row["Variant SKU"])}
+        variants.append(variant)
+
+    data = {
+        "handle": product.handle,
+        "title": head.get("Title", ""),
+        "descriptionHtml": head.get("Body (HTML)", ""),
+        "vendor": head.get("Vendor", ""),
+        "productType": head.get("Type", ""),
+        "tags": [t.strip() for t in (head.get("Tags") or "").split(",") if t.strip()],
+        "status": (head.get("Status") or "active").upper(),
+        "productOptions": [{"name": name, "values": [{"name": v} for v in vals]} for name, vals in values.items()],
+        "variants": variants,
+        "files": [{"originalSource": row["Image Src"], "alt": row.get("Image Alt Text", ""), "contentType": "IMAGE"}
+                  for row in product.images],
+    }
+    if head.get("SEO Title") or head.get("SEO Description"):
+        data["seo"] = {"title": head.get("SEO Title", ""), "description": head.get("SEO Description", "")}
+    return data
+
+
+def input_digest(data):
+    return hashlib.blake2b(json.dumps(data, sort_keys=True).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def iter_inputs(src):
+    # (handle, ProductSetInput, digest) per product, streamed
+    with open(src, "r", encoding="utf-8-sig", newline="") as f:
+        for product in iter_products(csv.DictReader(f)):
+            data = product_input(product)
+            yield product.handle, data, input_digest(data)
+
+
+def mutation_document(n):
+    # n aliased productSet mutations in one request, upserting by handle
+    params = ", ".join(f"$p{i}: ProductSetInput!, $i{i}: ProductSetIdentifiers" for i in range(n))
+    fields = " ".join(
+        f"p{i}: productSet(input: $p{i}, identifier: $i{i}, synchronous: true) "
+        "{ product { id handle } userErrors { field message } }"
+        for i in range(n)
+    )
+    return f"mutation Import({params}) {{ {fields} }}"
+
+
+def write_jsonl(src, out):
+    # Variables file for bulkOperationRunMutation with a single productSet mutation
+    count = 0
+    with open(out, "w", encoding="utf-8") as f:
+        for handle, data, _ in iter_inputs(src):
+            f.write(json.dumps({"identifier": {"handle": handle}, "input": data}, ensure_ascii=False) + "\n")
+            count += 1
+    return count
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message, retry_after=None):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class Connection:
+    # One keep-alive HTTP/1.1 connection; reopened on the next request after a failure
+
+    def __init__(self, host, port, tls, timeout=READ_TIMEOUT):
+        self.host = host
+        self.port = port
+        self.tls = tls
+        self.timeout = timeout
+        self.reader = None
+        self.writer = None
+
+    async def open(self):
+        context = ssl.create_default_context() if self.tls else None
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=context)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+    async def request(self, method, path, headers, body):
+        if self.writer is None:
+            await self.open()
+        try:
+            head = [f"{method} {path} HTTP/1.1", f"Host: {self.host}", f"Content-Length: {len(body)}"]
+            head.extend(f"{k}: {v}" for k, v in headers.items())
+            self.writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+            await self.writer.drain()
+            return await asyncio.wait_for(self.read_response(), self.timeout)
+        except BaseException:
+            self.close()
+            raise
+
+    async def read_response(self):
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionResetError("connection closed by server")
+        status = int(line.split(b" ", 2)[1])
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n"):
+                break
+            if not line:
+                raise ConnectionResetError("connection closed in headers")
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    while (await self.reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await self.reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await self.reader.read()
+            self.close()
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return status, headers, body
+
+
+class ConnectionPool:
+    def __init__(self, url, size, timeout=READ_TIMEOUT):
+        parts = urlsplit(url)
+        self.path = parts.path
+        tls = parts.scheme == "https"
+        self.idle = asyncio.Queue()
+        for _ in range(size):
+            self.idle.put_nowait(Connection(parts.hostname, parts.port or (443 if tls else 80), tls, timeout))
+
+    async def post(self, headers, body):
+        conn = await self.idle.get()
+        try:
+            return await conn.request("POST", self.path, headers, body)
+        finally:
+            self.idle.put_nowait(conn)
+
+    def close(self):
+        while not self.idle.empty():
+            self.idle.get_nowait().close()
+
+
+class CostThrottle:
+    # Local mirror of the shop's query cost bucket. Requests reserve their estimated
+    # cost before they are sent; every response resets the mirror to what the API
+    # reports, less what is still in flight. Retry-After pauses everyone.
+
+    def __init__(self, maximum=1000.0, restore_rate=50.0):
+        self.maximum = maximum
+        self.restore_rate = restore_rate
+        self.available = maximum
+        self.updated = time.monotonic()
+        self.in_flight = 0.0
+        self.paused_until = 0.0
+        self.mutation_cost = INITIAL_MUTATION_COST
+        self.waited = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.available = min(self.maximum, self.available + (now - self.updated) * self.restore_rate)
+        self.updated = now
+
+    def estimate(self, n):
+        return self.mutation_cost * n
+
+    async def acquire(self, cost):
+        cost = min(cost, self.maximum)
+        while True:
+            now = time.monotonic()
+            if now < self.paused_until:
+                await asyncio.sleep(self.paused_until - now)
+                continue
+            self._refill()
+            if self.available >= cost:
+                self.available -= cost
+                self.in_flight += cost
+                return cost
+            delay = (cost - self.available) / self.restore_rate
+            self.waited += delay
+            await asyncio.sleep(delay)
+
+    def release(self, reserved, cost_info=None, n=0):
+        self.in_flight -= reserved
+        if not cost_info:
+            return
+        status = cost_info.get("throttleStatus") or {}
+        self.maximum = float(status.get("maximumAvailable", self.maximum))
+        self.restore_rate = float(status.get("restoreRate", self.restore_rate)) or self.restore_rate
+        if "currentlyAvailable" in status:
+            self.available = max(0.0, float(status["currentlyAvailable"]) - self.in_flight)
+            self.updated = time.monotonic()
+        if n and cost_info.get("requestedQueryCost"):
+            # Moving average, so the estimate follows the real per-product cost
+            self.mutation_cost = 0.7 * self.mutation_cost + 0.3 * cost_info["requestedQueryCost"] / n
+
+    def pause(self, seconds):
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+class Importer:
+    def __init__(self, url, token, batch_size=BATCH_SIZE, concurrency=CONCURRENCY,
+                 checkpoint=CHECKPOINT, errors=ERRORS, max_retries=MAX_RETRIES, timeout=READ_TIMEOUT):
+        self.url = url
+        self.shop = shop_key(url)
+        self.token = token
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.checkpoint_path = checkpoint
+        self.errors_path = errors
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.throttle = CostThrottle()
+        self.stats = Counter()
+        self.done = load_checkpoint(checkpoint, self.shop)
+
+    async def send(self, pool, batch):
+        # Returns {alias: result} for one batch, retrying transport errors, 429/5xx and THROTTLED
+        document = mutation_document(len(batch))
+        variables = {}
+        for i, (handle, data, _) in enumerate(batch):
+            variables[f"p{i}"] = data
+            variables[f"i{i}"] = {"handle": handle}
+        body = json.dumps({"query": document, "variables": variables}).encode("utf-8")
+        headers = {"Content-Type": "application/json", "Accept": "application/json",
+                   "X-Shopify-Access-Token": self.token}
+        # THROTTLED answers only wait for budget; failures count against max_retries
+        attempt = 0
+        while attempt <= self.max_retries:
+            reserved = await self.throttle.acquire(self.throttle.estimate(len(batch)))
+            cost_info = None
+            try:
+                self.stats["requests"] += 1
+                status, resp_headers, raw = await pool.post(headers, body)
+                if status == 429 or status >= 500:
+                    retry_after = resp_headers.get("retry-after")
+                    raise HTTPError(status, raw[:200].decode("utf-8", "replace"),
+                                    float(retry_after) if retry_after else None)
+                if status != 200:
+                    raise HTTPError(status, raw[:200].decode("utf-8", "replace"))
+                payload = json.loads(raw)
+                cost_info = (payload.get("extensions") or {}).get("cost")
+                errors = payload.get("errors") or []
+                if any((e.get("extensions") or {}).get("code") == "THROTTLED" for e in errors):
+                    self.stats["throttled"] += 1
+                    continue
+                if errors and not payload.get("data"):
+                    raise HTTPError(status, "; ".join(e.get("message", "") for e in errors))
+                return payload["data"]
+            except HTTPError as e:
+                if e.status not in (429,) and e.status < 500:
+                    raise
+                self.stats[f"http_{e.status}"] += 1
+                if e.status == 429:
+                    # Rate limited: everyone holds off, not just this request
+                    self.throttle.pause(e.retry_after if e.retry_after is not None else backoff(attempt))
+                else:
+                    await asyncio.sleep(backoff(attempt))
+            except asyncio.TimeoutError:
+                # The connection was closed on the way out; the request goes again on a fresh one
+                self.stats["timeouts"] += 1
+                await asyncio.sleep(backoff(attempt))
+            except (OSError, asyncio.IncompleteReadError, ValueError):
+                self.stats["connection_errors"] += 1
+                await asyncio.sleep(backoff(attempt))
+            finally:
+                self.throttle.release(reserved, cost_info, len(batch))
+            attempt += 1
+            self.stats["retries"] += 1
+        raise HTTPError(0, f"giving up after {self.max_retries} retries")
+
+    def outcomes(self, batch, data):
+        # [(handle, digest, product id or None, [(field, message)])] for one answered batch
+        data = data or {}
+        outcomes = []
+        for i, (handle, _, digest) in enumerate(batch):
+            result = data.get(f"p{i}") or {}
+            user_errors = [(".".join(map(str, err.get("field") or [])), err.get("message", ""))
+                           for err in result.get("userErrors") or []]
+            product = result.get("product") or {}
+            if not user_errors and not product.get("id"):
+                user_errors = [("", "no product returned")]
+            outcomes.append((handle, digest, None if user_errors else product["id"], user_errors))
+        return outcomes
+
+    async def worker(self, pool, queue, checkpoint, errors):
+        while True:
+            batch = await queue.get()
+            if batch is None:
+                queue.task_done()
+                return
+            try:
+                outcomes = self.outcomes(batch, await self.send(pool, batch))
+            except Exception as e:
+                # Any failure fails this batch only: a worker that died here would leave
+                # the producer blocked on the full queue
+                for handle, _, _ in batch:
+                    errors.writerow([handle, "", str(e) if isinstance(e, HTTPError) else f"{type(e).__name__}: {e}"])
+                self.stats["failed"] += len(batch)
+                queue.task_done()
+                continue
+            for handle, digest, product_id, user_errors in outcomes:
+                if product_id is None:
+                    for field, message in user_errors:
+                        errors.writerow([handle, field, message])
+                    self.stats["failed"] += 1
+                    continue
+                checkpoint.write(json.dumps({"shop": self.shop, "handle": handle, "digest": digest, "id": product_id}) + "\n")
+                self.done[handle] = digest
+                self.stats["imported"] += 1
+            checkpoint.flush()
+            queue.task_done()
+
+    async def run(self, src):
+        # Products already imported with the same content (per checkpoint) are skipped,
+        # so a rerun after a failure resumes, and a rerun after edits sends only those
+        pool = ConnectionPool(self.url, self.concurrency, self.timeout)
+        queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        with open(self.checkpoint_path, "a", encoding="utf-8") as checkpoint, \
+                open(self.errors_path, "w", encoding="utf-8", newline="") as f_errors:
+            errors = csv.writer(f_errors)
+            errors.writerow(["Handle", "Field", "Message"])
+            workers = [asyncio.create_task(self.worker(pool, queue, checkpoint, errors)) for _ in range(self.concurrency)]
+            try:
+                batch = []
+                for item in iter_inputs(src):
+                    self.stats["products"] += 1
+                    if self.done.get(item[0]) == item[2]:
+                        self.stats["skipped"] += 1
+                        continue
+                    batch.append(item)
+                    if len(batch) == self.batch_size:
+                        await queue.put(batch)
+                        batch = []
+                if batch:
+                    await queue.put(batch)
+                for _ in workers:
+                    await queue.put(None)
+                await asyncio.gather(*workers)
+            finally:
+                for w in workers:
+                    w.cancel()
+                pool.close()
+        return self.stats
+
+
+def backoff(attempt):
+    return min(30.0, 0.5 * 2 ** attempt) * (0.5 + random.random() / 2)
+
+
+def shop_key(url):
+    # The shop a checkpoint entry was imported into; the port is left out so a restarted
+    # mock or proxy on another port still matches
+    return urlsplit(url).hostname or url
+
+
+def load_checkpoint(path, shop):
+    # {handle: digest of the input last imported}; a torn last line from a crash is ignored.
+    # Entries recorded against another shop would skip products that shop never got
+    done = {}
+    if not os.path.exists(path):
+        return done
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if entry.get("shop") != shop:
+                raise ValueError(f"{path} was recorded against {entry.get('shop') or 'an unknown shop'}, not {shop}; "
+                                 "pass --restart or another --checkpoint")
+            done[entry["handle"]] = entry["digest"]
+    return done
+
+
+async def import_with_mock(args):
+    # Runs against an in-process mock shop, for offline throughput and retry benchmarks
+    from mock_shopify import MockShop, start_mock
+    shop = MockShop(error_rate=args.error_rate, drop_rate=args.drop_rate, restore_rate=args.restore_rate, seed=args.seed)
+    server = await start_mock(shop)
+    port = server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}/admin/api/{API_VERSION}/graphql.json"
+    # A checkpoint from an earlier run would skip products this fresh mock never got
+    if os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+    importer = Importer(url, "mock-token", args.batch_size, args.concurrency, args.checkpoint, args.errors,
+                        timeout=args.timeout)
+    try:
+        stats = await importer.run(args.src)
+    finally:
+        server.close()
+        await server.wait_closed()
+    return stats, importer, shop
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import the Shopify CSV through the Admin GraphQL API, resumable.")
+    parser.add_argument("--src", default=SRC)
+    parser.add_argument("--shop", default=os.environ.get("SHOPIFY_SHOP"), help="my-shop.myshopify.com (or SHOPIFY_SHOP)")
+    parser.add_argument("--endpoint", help="full GraphQL URL, e.g. of a running mock_shopify.py")
+    parser.add_argument("--api-version", default=API_VERSION)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="productSet mutations per request")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY, help="requests in flight (pooled connections)")
+    parser.add_argument("--checkpoint", help=f"default {CHECKPOINT}, or {MOCK_CHECKPOINT} with --mock")
+    parser.add_argument("--errors", default=ERRORS)
+    parser.add_argument("--timeout", type=float, default=READ_TIMEOUT, help="seconds to wait for a response before retrying")
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoint and import everything")
+    parser.add_argument("--jsonl", metavar="OUT", help="only write bulk-operation JSONL variables and exit")
+    mock = parser.add_argument_group("offline benchmark")
+    mock.add_argument("--mock", action="store_true", help="import into an in-process mock shop")
+    mock.add_argument("--error-rate", type=float, default=0.05)
+    mock.add_argument("--drop-rate", type=float, default=0.01)
+    mock.add_argument("--restore-rate", type=float, default=500.0, help="mock cost points restored per second")
+    mock.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.jsonl:
+        count = write_jsonl(args.src, args.jsonl)
+        print(f"Wrote {count} productSet inputs to {args.jsonl} (stage it and run bulkOperationRunMutation)")
+        return
+    if args.checkpoint is None:
+        args.checkpoint = MOCK_CHECKPOINT if args.mock else CHECKPOINT
+    if args.restart and os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+
+    started = time.perf_counter()
+    try:
+        if args.mock:
+            stats, importer, shop = asyncio.run(import_with_mock(args))
+        else:
+            token = os.environ.get("SHOPIFY_ACCESS_TOKEN")
+            url = args.endpoint or (args.shop and f"https://{args.shop}/admin/api/{args.api_version}/graphql.json")
+            if not url or not token:
+                parser.error("needs --shop (or --endpoint) and SHOPIFY_ACCESS_TOKEN in the environment")
+            importer = Importer(url, token, args.batch_size, args.concurrency, args.checkpoint, args.errors,
+                                timeout=args.timeout)
+            stats = asyncio.run(importer.run(args.src))
+            shop = None
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
+
+    sent = stats["imported"] + stats["failed"]
+    print(f"{stats['products']} products: {stats['imported']} imported, {stats['skipped']} unchanged since the checkpoint, "
+          f"{stats['failed']} failed (see {args.errors})")
+    print(f"{stats['requests']} requests, {stats['retries']} retries, {stats['throttled']} throttled, "
+          f"{importer.throttle.waited:.1f}s spent waiting for cost budget (summed over requests); "
+          f"{elapsed:.1f}s, {sent / elapsed if elapsed else 0:.0f} products/s")
+    for key in sorted(k for k in stats if k.startswith("http_") or k in ("connection_errors", "timeouts")):
+        print(f"- {key}: {stats[key]}")
+    if shop is not None:
+        print(f"Mock shop: {len(shop.products)} products stored, {dict(shop.stats)}")
+    sys.exit(1 if stats["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
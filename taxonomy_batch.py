@@ -0,0 +1,94 @@
+from taxonomy_index import PREFERRED, PREFERRED_BIAS, tokenize
+
+# Optional: batch scoring needs NumPy; SciPy makes the overlap a single sparse product
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
+# Categories scored per block, so the dense score block stays around CHUNK x nodes floats
+CHUNK = 256
+
+
+def available():
+    return np is not None
+
+
+class BatchScorer:
+    # Scores many categories against every taxonomy node at once, with the same arithmetic
+    # as taxonomy_index.score(): overlap/len(cat) + overlap/len(node) + bias. Rankings use a
+    # stable sort, so equal scores keep taxonomy order and the first best still wins.
+
+    def __init__(self, nodes):
+        if np is None:
+            raise ImportError("taxonomy_batch needs numpy (pip install numpy)")
+        self.nodes = list(nodes)
+        self.vocab = {}
+        rows, cols = [], []
+        for pos, node in enumerate(self.nodes):
+            for tok in node["tokens"]:
+                rows.append(pos)
+                cols.append(self.vocab.setdefault(tok, len(self.vocab)))
+        n_nodes = len(self.nodes)
+        self.sizes = np.array([len(n["tokens"]) or 1 for n in self.nodes], dtype=np.float64)
+        self.biases = np.array([PREFERRED_BIAS if n["tokens"] & PREFERRED else 0.0 for n in self.nodes],
+                               dtype=np.float64)
+        rows = np.array(rows, dtype=np.int64)
+        cols = np.array(cols, dtype=np.int64)
+        if sparse is not None:
+            # Token x node incidence, so C (cats x tokens) @ this gives overlap counts
+            self._incidence = sparse.csr_matrix(
+                (np.ones(len(rows), dtype=np.int32), (cols, rows)), shape=(len(self.vocab), n_nodes))
+        else:
+            # token id -> node positions, for bincount-based overlaps
+            order = np.argsort(cols, kind="stable")
+            bounds = np.searchsorted(cols[order], np.arange(len(self.vocab) + 1))
+            self._postings = [rows[order[bounds[t]:bounds[t + 1]]] for t in range(len(self.vocab))]
+
+    def _overlaps(self, token_lists):
+        n_nodes = len(self.nodes)
+        if sparse is not None:
+            r, c = [], []
+            for i, toks in enumerate(token_lists):
+                for t in toks:
+                    r.append(i)
+                    c.append(t)
+            cats = sparse.csr_matrix((np.ones(len(r), dtype=np.int32), (r, c)),
+                                     shape=(len(token_lists), len(self.vocab)))
+            return (cats @ self._incidence).toarray()
+        out = np.zeros((len(token_lists), n_nodes), dtype=np.int32)
+        for i, toks in enumerate(token_lists):
+            if toks:
+                out[i] = np.bincount(np.concatenate([self._postings[t] for t in toks]), minlength=n_nodes)
+        return out
+
+    def scores(self, categories):
+        # Yields (category, score row) block by block
+        for start in range(0, len(categories), CHUNK):
+            block = categories[start:start + CHUNK]
+            token_sets = [tokenize(c) for c in block]
+            known = [[self.vocab[t] for t in toks if t in self.vocab] for toks in token_sets]
+            overlap = self._overlaps(known).astype(np.float64)
+            n_cat = np.array([len(toks) for toks in token_sets], dtype=np.float64)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                block_scores = (overlap / n_cat[:, None]) + (overlap / self.sizes[None, :]) + self.biases[None, :]
+            # Categories without tokens score 0.0 everywhere, bias included
+            block_scores[n_cat == 0] = 0.0
+            yield from zip(block, block_scores)
+
+    def top_k(self, categories, k=5):
+        # {category: [(node, score), ...]} for every category, best first
+        result = {}
+        if k <= 0 or not self.nodes:
+            return {cat: [] for cat in categories}
+        for cat, row in self.scores(list(categories)):
+            if k == 1:
+                order = [int(np.argmax(row))]
+            else:
+                order = np.argsort(-row, kind="stable")[:k]
+            result[cat] = [(self.nodes[pos], float(row[pos])) for pos in order]
+        return result
@@ -0,0 +1,98 @@
+import heapq
+import re
+from collections import Counter
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Small bias for bike-related nodes
+PREFERRED = {"bike","bikes","bicycle","bicycles","cycling","helmet","helmets","light","lights","bag","bags","brake","pedal","wheel","seatpost","saddle","grip","handlebar","trainer","rollers","ebike","e-bikes","electric"}
+PREFERRED_BIAS = 0.15
+
+
+def tokenize(text: str) -> set:
+    return set(TOKEN_RE.findall((text or "").lower()))
+
+
+def score(cat_str, node):
+    # Token-overlap score + small bias for bike-related nodes (reference implementation)
+    cat_tokens = tokenize(cat_str)
+    if not cat_tokens:
+        return 0.0
+    inter = cat_tokens & node["tokens"]
+    base = (len(inter) / len(cat_tokens)) + (len(inter) / (len(node["tokens"]) or 1))
+    bias = PREFERRED_BIAS if (node["tokens"] & PREFERRED) else 0.0
+    return base + bias
+
+
+class TaxonomyIndex:
+    # Inverted index over taxonomy nodes: token -> positions of the nodes containing it.
+    # Only nodes sharing at least one token with a category are scored; every other node
+    # scores exactly its bias, so the best of those is known without looking at them.
+
+    def __init__(self, nodes):
+        self.nodes = list(nodes)
+        self.postings = {}
+        self.sizes = []
+        self.biases = []
+        preferred_positions = []
+        plain_positions = []
+        for pos, node in enumerate(self.nodes):
+            tokens = node["tokens"]
+            for tok in tokens:
+                self.postings.setdefault(tok, []).append(pos)
+            self.sizes.append(len(tokens) or 1)
+            if tokens & PREFERRED:
+                self.biases.append(PREFERRED_BIAS)
+                preferred_positions.append(pos)
+            else:
+                self.biases.append(0.0)
+                plain_positions.append(pos)
+        self._preferred_positions = preferred_positions
+        self._plain_positions = plain_positions
+        self.by_name = {n["full_name"]: n for n in self.nodes}
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def overlaps(self, cat_tokens):
+        counts = Counter()
+        for tok in cat_tokens:
+            posting = self.postings.get(tok)
+            if posting:
+                counts.update(posting)
+        return counts
+
+    def top_k(self, cat_str, k=5):
+        # Ranked [(node, score), ...], best first. Ties keep taxonomy order, so the
+        # first entry is the node a full `score()` scan with `>` would pick.
+        if k <= 0 or not self.nodes:
+            return []
+        cat_tokens = tokenize(cat_str)
+        if not cat_tokens:
+            return [(node, 0.0) for node in self.nodes[:k]]
+
+        n_cat = len(cat_tokens)
+        counts = self.overlaps(cat_tokens)
+        scored = [
+            ((ov / n_cat) + (ov / self.sizes[pos]) + self.biases[pos], pos)
+            for pos, ov in counts.items()
+        ]
+        # Zero-overlap nodes score 0.0 + bias; the first k of each kind are enough
+        for positions in (self._preferred_positions, self._plain_positions):
+            taken = 0
+            for pos in positions:
+                if taken >= k:
+                    break
+                if pos in counts:
+                    continue
+                scored.append((0.0 + self.biases[pos], pos))
+                taken += 1
+
+        best = heapq.nsmallest(k, scored, key=lambda item: (-item[0], item[1]))
+        return [(self.nodes[pos], s) for s, pos in best]
+
+    def best(self, cat_str):
+        ranked = self.top_k(cat_str, 1)
+        if not ranked:
+            return None, -1.0
+        return ranked[0]
@@ -0,0 +1,159 @@
+import argparse
+import csv
+import hashlib
+import io
+import os
+import pickle
+import sys
+import urllib.request
+
+from taxonomy_index import tokenize
+
+TAXONOMY_URLS = [
+    "https://raw.githubusercontent.com/Shopify/product-taxonomy/main/data/taxonomy_with_ids.csv",
+    "https://raw.githubusercontent.com/Shopify/product-taxonomy/main/data/taxonomy.csv",
+    "https://raw.githubusercontent.com/Shopify/product-taxonomy/master/data/taxonomy_with_ids.csv",
+    "https://raw.githubusercontent.com/Shopify/product-taxonomy/master/data/taxonomy.csv",
+]
+STORE_PATH = "shopify_taxonomy.pkl"
+
+# Bump when the snapshot layout or tokenization changes; older snapshots are rejected
+FORMAT_VERSION = 1
+
+
+def download_taxonomy():
+    last_err = None
+    for url in TAXONOMY_URLS:
+        try:
+            with urllib.request.urlopen(url) as resp:
+                data = resp.read().decode("utf-8", errors="replace")
+                print(f"Loaded taxonomy from: {url}")
+                return data, url
+        except Exception as e:
+            last_err = e
+            continue
+    raise OSError(f"Failed to download Shopify taxonomy: {last_err}")
+
+
+def parse_taxonomy(data):
+    reader = csv.DictReader(io.StringIO(data))
+    taxonomy = []
+    for row in reader:
+        full_name = row.get("full_name") or row.get("name") or ""
+        if not full_name:
+            continue
+        taxonomy.append({
+            "id": row.get("id", ""),
+            "full_name": full_name,
+            "tokens": tokenize(full_name)
+        })
+    return taxonomy
+
+
+def build_snapshot(data, source):
+    nodes = parse_taxonomy(data)
+    if not nodes:
+        raise ValueError(f"No taxonomy nodes found in {source}")
+    payload = pickle.dumps(
+        [(n["id"], n["full_name"], tuple(sorted(n["tokens"]))) for n in nodes],
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    source_sha256 = hashlib.sha256(data.encode("utf-8")).hexdigest()
+    return {
+        "format": FORMAT_VERSION,
+        "source": source,
+        "version": source_sha256[:12],
+        "source_sha256": source_sha256,
+        "node_count": len(nodes),
+        "checksum": hashlib.sha256(payload).hexdigest(),
+        "payload": payload,
+    }
+
+
+def save_store(snapshot, path=STORE_PATH):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path=STORE_PATH):
+    # Returns the validated snapshot header + payload, or None if no store exists yet
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        snapshot = pickle.load(f)
+    if snapshot.get("format") != FORMAT_VERSION:
+        raise ValueError(f"{path}: snapshot format {snapshot.get('format')} != {FORMAT_VERSION}, refresh the store")
+    if hashlib.sha256(snapshot["payload"]).hexdigest() != snapshot["checksum"]:
+        raise ValueError(f"{path}: checksum mismatch, refresh or re-seed the store")
+    return snapshot
+
+
+def snapshot_nodes(snapshot):
+    return [
+        {"id": node_id, "full_name": full_name, "tokens": set(tokens)}
+        for node_id, full_name, tokens in pickle.loads(snapshot["payload"])
+    ]
+
+
+def refresh_store(path=STORE_PATH):
+    data, url = download_taxonomy()
+    snapshot = build_snapshot(data, url)
+    save_store(snapshot, path)
+    return snapshot
+
+
+def seed_store(csv_path, path=STORE_PATH):
+    with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+        data = f.read()
+    snapshot = build_snapshot(data, os.path.abspath(csv_path))
+    save_store(snapshot, path)
+    return snapshot
+
+
+def load_taxonomy(path=STORE_PATH, refresh=False, seed=None):
+    # Only touches the network when asked to refresh, or on the very first run
+    if seed:
+        snapshot = seed_store(seed, path)
+    elif refresh:
+        snapshot = refresh_store(path)
+    else:
+        snapshot = read_snapshot(path)
+        if snapshot is None:
+            print(f"No local taxonomy store at {path}, downloading once…")
+            snapshot = refresh_store(path)
+    print(f"Taxonomy v{snapshot['version']} ({snapshot['node_count']} nodes) from {snapshot['source']}")
+    return snapshot_nodes(snapshot)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the local Shopify taxonomy snapshot.")
+    parser.add_argument("--store", default=STORE_PATH)
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--refresh", action="store_true", help="download the taxonomy and rebuild the snapshot")
+    group.add_argument("--seed", metavar="CSV", help="build the snapshot from a local taxonomy CSV")
+    args = parser.parse_args()
+
+    try:
+        if args.seed:
+            snapshot = seed_store(args.seed, args.store)
+        elif args.refresh:
+            snapshot = refresh_store(args.store)
+        else:
+            snapshot = read_snapshot(args.store)
+    except (OSError, ValueError) as e:
+        print(e)
+        sys.exit(1)
+    if snapshot is None:
+        print(f"No taxonomy store at {args.store}; run with --refresh or --seed.")
+        sys.exit(1)
+    print(f"Store:    {args.store}")
+    print(f"Version:  {snapshot['version']} (format {snapshot['format']})")
+    print(f"Source:   {snapshot['source']}")
+    print(f"Nodes:    {snapshot['node_count']}")
+    print(f"Checksum: {snapshot['checksum']}")
+
+
+if __name__ == "__main__":
+    main()
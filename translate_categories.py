@@ -1,6 +1,9 @@
 import csv
 import sys
 
+from encoding_repair import repair_text
+from product_groups import iter_products
+
 translations = {
     'Zubehör': 'Accessories',
     'Teile': 'Parts',
@@ -12,8 +15,6 @@ translations = {
     'Sattel': 'Saddles',
     'Räder': 'Wheels',
     'Gepäckträger': 'Luggage Racks',
-    'RÃ¤der': 'Wheels',
-    'GepÃ¤cktrÃ¤ger': 'Luggage Racks',
     'Ständer': 'Stands',
     'Anhänger': 'Trailers',
     'Velotaschen': 'Bags',
@@ -32,13 +33,28 @@ translations = {
     'E-bike 24 Zoll': 'E-bike 24 Inch',
     'E-bike 26 Zoll': 'E-bike 26 Inch',
     'Gebraucht': 'Used',
-    'Velo Sale': 'Bike Sale'
+    'Velo Sale': 'Bike Sale',
+    # Raw export segments that arrive untranslated in the Type column
+    'Velos': 'Bikes',
+    'Kindervelos': 'Kids Bikes',
+    'Bremsen': 'Brakes',
+    'Pedale': 'Pedals',
+    'Griffe': 'Grips',
+    'Sattelstütze': 'Seatpost',
+    'Lichte': 'Lights',
+    'Schutzbleche': 'Fenders',
+    'Klingeln': 'Bells',
+    'Regenschutz': 'Rain Protection',
+    'Veloschuhe': 'Bike Shoes',
+    'Bike computer': 'Bike Computers',
+    '120-130': '120-130mm Travel'
 }
 
 def translate_category(category):
     if not category:
         return category
-    parts = category.split(' > ')
+    # Double-encoded umlauts ('RÃ¤der') are repaired first, so one key per term is enough
+    parts = repair_text(category).split(' > ')
     translated_parts = []
     for part in parts:
         translated = translations.get(part.strip(), part.strip())
@@ -52,12 +68,12 @@ def process_csv():
         writer = csv.DictWriter(outfile, fieldnames=reader.fieldnames)
         writer.writeheader()
         
-        for row in reader:
-            # Translate both Category and Type fields
-            category = translate_category(row['Product Category'])
-            row['Product Category'] = category
-            row['Type'] = category  # Make Type match Category exactly
-            writer.writerow(row)
+        for product in iter_products(reader):
+            # Translate both Category and Type fields, once per product
+            category = translate_category(product.get('Product Category'))
+            product.head['Product Category'] = category
+            product.head['Type'] = category  # Make Type match Category exactly
+            writer.writerows(product.rows)
 
 if __name__ == '__main__':
     process_csv()
\ No newline at end of file
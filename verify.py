@@ -1,13 +1,20 @@
-import csv
-from collections import Counter
+import argparse
 
-categories = Counter()
+from category_cube import cube_from_args
 
-with open('products_final.csv', 'r', encoding='utf-8-sig') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        categories[row['Product Category']] += 1
+def main():
+    parser = argparse.ArgumentParser(description='List the final categories with their product counts.')
+    parser.add_argument('--src', default='products_final.csv')
+    parser.add_argument('--store', help='read a catalog store (python catalog_store.py build SRC) instead of the CSV')
+    parser.add_argument('--cube', help='render from a saved category cube (python category_cube.py build SRC -o CUBE)')
+    args = parser.parse_args()
 
-with open('final_categories.txt', 'w', encoding='utf-8') as f:
-    for cat, count in sorted(categories.items()):
-        f.write(f"{cat}: {count}\n")
+    # Counted per product: variant and image rows belong to the product above them
+    categories = cube_from_args(args).categories()
+
+    with open('final_categories.txt', 'w', encoding='utf-8') as f:
+        for cat, count in sorted(categories.items()):
+            f.write(f"{cat}: {count}\n")
+
+if __name__ == '__main__':
+    main()